@@ -5,74 +5,68 @@ different bidding strategies for each team.
 
 The auction system supports different types of players (batsmen, bowlers, all-rounders,
 and wicket-keepers) and allows teams to bid based on either basic or statistical strategies.
+Teams, budgets and strategies come from a league config (configs/default.json unless
+--config is given), and only the strategy modules the config uses are imported.
 """
 
-import pandas as pd
+import argparse
+from auctionengine.bidlog import BidLogSink
+from auctionengine.config import DEFAULT_CONFIG, build_league, load_config
 from auctionengine.dealer import Dealer
-from auctionengine.team import Team
-from auctionengine.utils import load_players
-from strategies.base import BiddingStrategy
-from strategies.statistical import StatisticalBiddingStrategy
-from strategies.mlp_strategy import MLPBiddingStrategy
-from strategies.xgboost_strategy import XGBoostBiddingStrategy
-from strategies.bayesian_ridge import BayesianRidgeBiddingStrategy
-from strategies.random_forest import RandomForestBiddingStrategy
+from auctionengine.events import ConsoleSink, TeeSink
+from auctionengine.utils import load_all_players
 
 def main():
     """
     Main function that orchestrates the auction process.
     Loads player data, initializes teams, and runs the auction.
     """
-    # Load data for all categories of players from CSV files
-    batsmen = load_players("dataset/batsmen.csv", role="batsman")
-    bowlers = load_players("dataset/bowlers.csv", role="bowler")
-    allrounders = load_players("dataset/allrounders.csv", role="allrounder")
-    wicket_keepers = load_players("dataset/wicketkeepers.csv", role="wicketkeeper")
+    parser = argparse.ArgumentParser(description="Run a single cricket player auction.")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, metavar="PATH",
+                        help=f"league config with teams, budgets and strategies (default: {DEFAULT_CONFIG})")
+    parser.add_argument("--profile", action="store_true",
+                        help="time strategy calls and bid rounds, and print a summary table")
+    parser.add_argument("--profile-out", metavar="PATH",
+                        help="also write the profile as JSON to PATH (implies --profile)")
+    parser.add_argument("--seed", type=int,
+                        help="root seed for the lot order and strategy randomness (default: unseeded)")
+    parser.add_argument("--bid-log", metavar="PATH",
+                        help="also record every bid to a binary log that auctionengine.bidlog can replay")
+    args = parser.parse_args()
 
-    # Combine all player categories into one list for auction
-    all_players = batsmen + bowlers + allrounders + wicket_keepers
+    config = load_config(args.config)
 
-    # Initialize team budgets (in millions)
-    team_budgets = {
-        "Team A": 40.0,
-        "Team B": 40.0,
-        "Team C": 40.0,
-        "Team D": 40.0
-    }
+    # Load batsmen, bowlers, all-rounders and wicket-keepers into one list for auction
+    all_players = load_all_players(config.get("dataset", "dataset"))
 
-    # Set maximum players allowed per team
-    max_players = 11
+    # Create the teams in seat order and assign their bidding strategies
+    teams, bidding_strategies = build_league(config)
 
-    # Create team objects with their respective budgets and player limits
-    team_a = Team(name="Team A", budget=team_budgets["Team A"], max_players=max_players)
-    team_b = Team(name="Team B", budget=team_budgets["Team B"], max_players=max_players)
-    team_c = Team(name="Team C", budget=team_budgets["Team C"], max_players=max_players)
-    team_d = Team(name="Team D", budget=team_budgets["Team D"], max_players=max_players)
-    teams = [team_a, team_b, team_c, team_d]
+    events = ConsoleSink()
+    if args.bid_log:
+        events = TeeSink(events, BidLogSink(args.bid_log))
 
-    # Assign bidding strategies to teams
-    bidding_strategies = {
-        "Team A": RandomForestBiddingStrategy(),
-        "Team B": XGBoostBiddingStrategy(),
-        "Team C": StatisticalBiddingStrategy(total_budget=team_c.budget),
-        "Team D": BayesianRidgeBiddingStrategy(total_budget=team_d.budget)
-    }
-    
     # Initialize dealer with players, teams and their strategies
-    dealer = Dealer(players=all_players, teams=teams, strategies=bidding_strategies)
+    dealer = Dealer(players=all_players, teams=teams, strategies=bidding_strategies,
+                    events=events, profile=args.profile or bool(args.profile_out), seed=args.seed)
 
     # Execute the auction process
     dealer.start_auction()
+    events.close()
 
     # Display final team compositions and statistics
     for t in teams:
         t.print_team_summary()
-        total_stars = sum(player.stats.get('stars', 0) for player in t.players)
-        print(f"Total Stars Collected by {t.name}: {total_stars}")
+        print(f"Total Stars Collected by {t.name}: {t.total_stars}")
 
     # Determine the winning team based on total stars
-    winning_team = max(teams, key=lambda team: sum(player.stats.get('stars', 0) for player in team.players))
-    print(f"\nWinning Team: {winning_team.name} with {sum(player.stats.get('stars', 0) for player in winning_team.players)} stars")
+    winning_team = max(teams, key=lambda team: team.total_stars)
+    print(f"\nWinning Team: {winning_team.name} with {winning_team.total_stars} stars")
+
+    if dealer.profiler:
+        print("\n" + dealer.profiler.summary_table())
+        if args.profile_out:
+            dealer.profiler.dump(args.profile_out)
 
 if __name__ == "__main__":
     main()
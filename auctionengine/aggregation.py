@@ -0,0 +1,434 @@
+"""
+One-pass, mergeable aggregation of auction results.
+
+A TournamentResult keeps every seat of every auction, which is fine for thousands of
+auctions but grows without bound. A ResultsAggregator instead folds each finished
+auction into fixed-size statistics and forgets it:
+
+- per strategy: seats, wins, stars and spend as running mean/variance (Welford), and
+  quantile sketches of the stars per auction and the price of every purchase;
+- per player: how often they were offered and went unsold, and the running mean,
+  variance and fixed-width histogram of the prices they sold for.
+
+Its size depends on the number of strategies, players and distinct price bins, never
+on the number of auctions. Every statistic merges exactly, so each worker process
+aggregates its own auctions and the parent merges the workers' aggregators. The
+state round-trips through JSON with ``save`` and ``load``, so runs on different
+machines or days can be merged too.
+
+Quantiles come from a log-bucketed sketch (as in DDSketch): values fall into buckets
+whose bounds grow by a constant factor. Any reported quantile is within
+``relative_accuracy`` of the value at that rank, and merging two sketches adds their
+bucket counts.
+"""
+
+import json
+import math
+
+
+class RunningStats:
+    def __init__(self):
+        """
+        Count, mean, variance, min and max of a stream, updated with Welford's method.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """
+        Fold another RunningStats into this one (Chan et al.'s pairwise update).
+        """
+        if other.count == 0:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        """Sample variance, 0 with fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def to_dict(self):
+        return {"count": self.count, "mean": self.mean, "m2": self.m2,
+                "min": self.min if self.count else None, "max": self.max if self.count else None}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.count, stats.mean, stats.m2 = data["count"], data["mean"], data["m2"]
+        if stats.count:
+            stats.min, stats.max = data["min"], data["max"]
+        return stats
+
+
+class QuantileSketch:
+    def __init__(self, relative_accuracy=0.01):
+        """
+        Mergeable quantile sketch for non-negative values.
+
+        Args:
+            relative_accuracy (float): Bound on the relative error of any quantile
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        # Bucket i holds values in (gamma**(i-1), gamma**i]
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, value):
+        if value < 0:
+            raise ValueError(f"QuantileSketch takes non-negative values, got {value}")
+        self.count += 1
+        if value == 0:
+            self.zeros += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        """
+        Value at quantile ``q`` (0 to 1), or None for an empty sketch.
+        """
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket in relative terms
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def to_dict(self):
+        return {"relative_accuracy": self.relative_accuracy, "zeros": self.zeros, "count": self.count,
+                "buckets": {str(index): count for index, count in sorted(self.buckets.items())}}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["relative_accuracy"])
+        sketch.zeros, sketch.count = data["zeros"], data["count"]
+        sketch.buckets = {int(index): count for index, count in data["buckets"].items()}
+        return sketch
+
+
+class PriceHistogram:
+    def __init__(self, width=0.25):
+        """
+        Sparse fixed-width histogram of prices.
+
+        Args:
+            width (float): Bin width in Cr; bin i holds prices in [i * width, (i + 1) * width)
+        """
+        self.width = width
+        self.counts = {}
+
+    def add(self, price):
+        index = int(math.floor(price / self.width + 1e-9))
+        self.counts[index] = self.counts.get(index, 0) + 1
+
+    def merge(self, other):
+        if other.width != self.width:
+            raise ValueError("Cannot merge histograms with different bin widths")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        return self
+
+    def bins(self):
+        """
+        Returns:
+            list: (low, high, count) per non-empty bin, in price order
+        """
+        return [(index * self.width, (index + 1) * self.width, count)
+                for index, count in sorted(self.counts.items())]
+
+    def to_dict(self):
+        return {"width": self.width, "counts": {str(index): count for index, count in sorted(self.counts.items())}}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data["width"])
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        return histogram
+
+
+class StrategyStats:
+    def __init__(self, relative_accuracy=0.01):
+        """
+        Results of every seat one strategy played.
+        """
+        self.wins = 0.0
+        self.stars = RunningStats()
+        self.spent = RunningStats()
+        self.stars_sketch = QuantileSketch(relative_accuracy)
+        self.price_sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, seat, prices):
+        """
+        Args:
+            seat (dict): Seat result from tournament.run_auction
+            prices (list): Price of each player the seat bought
+        """
+        self.wins += seat["won"]
+        self.stars.add(seat["stars"])
+        self.spent.add(seat["spent"])
+        self.stars_sketch.add(seat["stars"])
+        for price in prices:
+            self.price_sketch.add(price)
+
+    def merge(self, other):
+        self.wins += other.wins
+        self.stars.merge(other.stars)
+        self.spent.merge(other.spent)
+        self.stars_sketch.merge(other.stars_sketch)
+        self.price_sketch.merge(other.price_sketch)
+        return self
+
+    def to_dict(self):
+        return {"wins": self.wins, "stars": self.stars.to_dict(), "spent": self.spent.to_dict(),
+                "stars_sketch": self.stars_sketch.to_dict(), "price_sketch": self.price_sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.wins = data["wins"]
+        stats.stars = RunningStats.from_dict(data["stars"])
+        stats.spent = RunningStats.from_dict(data["spent"])
+        stats.stars_sketch = QuantileSketch.from_dict(data["stars_sketch"])
+        stats.price_sketch = QuantileSketch.from_dict(data["price_sketch"])
+        return stats
+
+
+class PlayerStats:
+    def __init__(self, price_bin=0.25):
+        """
+        Outcomes of every lot one player was auctioned in.
+        """
+        self.offered = 0
+        self.unsold = 0
+        self.price = RunningStats()
+        self.histogram = PriceHistogram(price_bin)
+
+    def add(self, price):
+        """
+        Args:
+            price (float): Sale price, or None if the player went unsold
+        """
+        self.offered += 1
+        if price is None:
+            self.unsold += 1
+        else:
+            self.price.add(price)
+            self.histogram.add(price)
+
+    def merge(self, other):
+        self.offered += other.offered
+        self.unsold += other.unsold
+        self.price.merge(other.price)
+        self.histogram.merge(other.histogram)
+        return self
+
+    def to_dict(self):
+        return {"offered": self.offered, "unsold": self.unsold, "price": self.price.to_dict(),
+                "histogram": self.histogram.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.offered, stats.unsold = data["offered"], data["unsold"]
+        stats.price = RunningStats.from_dict(data["price"])
+        stats.histogram = PriceHistogram.from_dict(data["histogram"])
+        return stats
+
+
+class ResultsAggregator:
+    def __init__(self, price_bin=0.25, relative_accuracy=0.01):
+        """
+        Per-strategy and per-player statistics over any number of auctions.
+
+        Args:
+            price_bin (float): Width of the per-player price histogram bins, in Cr
+            relative_accuracy (float): Relative accuracy of the quantile sketches
+        """
+        self.price_bin = price_bin
+        self.relative_accuracy = relative_accuracy
+        self.auctions = 0
+        self.strategies = {}
+        self.players = {}
+
+    def add_auction(self, seats, teams, players):
+        """
+        Fold one finished auction into the statistics.
+
+        Args:
+            seats (list): Seat results from tournament.run_auction, in seat order
+            teams (list): The auction's Team objects, in the same order
+            players (list): Every player offered in the auction
+        """
+        self.auctions += 1
+        buyers = {}
+        for seat, team in zip(seats, teams):
+            prices = []
+            for player in team.players:
+                buyers[player.name] = player.winning_bid
+                prices.append(player.winning_bid)
+            strategy = self.strategies.get(seat["strategy"])
+            if strategy is None:
+                strategy = self.strategies[seat["strategy"]] = StrategyStats(self.relative_accuracy)
+            strategy.add(seat, prices)
+        for player in players:
+            stats = self.players.get(player.name)
+            if stats is None:
+                stats = self.players[player.name] = PlayerStats(self.price_bin)
+            stats.add(buyers.get(player.name))
+
+    def merge(self, other):
+        """
+        Fold another aggregator, e.g. a worker's, into this one.
+
+        Returns:
+            ResultsAggregator: self
+        """
+        if (other.price_bin, other.relative_accuracy) != (self.price_bin, self.relative_accuracy):
+            raise ValueError("Cannot merge aggregators with different bins or sketch accuracy")
+        self.auctions += other.auctions
+        for name, stats in other.strategies.items():
+            if name in self.strategies:
+                self.strategies[name].merge(stats)
+            else:
+                self.strategies[name] = stats
+        for name, stats in other.players.items():
+            if name in self.players:
+                self.players[name].merge(stats)
+            else:
+                self.players[name] = stats
+        return self
+
+    def summary(self):
+        """
+        Per-strategy figures.
+
+        Returns:
+            dict: Strategy name to seats, win rate, mean, std and 5/50/95th percentile
+            stars, mean spend and median and 90th percentile purchase price
+        """
+        summary = {}
+        for name, stats in self.strategies.items():
+            seats = stats.stars.count
+            summary[name] = {
+                "seats": seats,
+                "win_rate": stats.wins / seats,
+                "mean_stars": stats.stars.mean,
+                "std_stars": stats.stars.std,
+                "stars_p5": stats.stars_sketch.quantile(0.05),
+                "stars_p50": stats.stars_sketch.quantile(0.5),
+                "stars_p95": stats.stars_sketch.quantile(0.95),
+                "mean_spent": stats.spent.mean,
+                "price_p50": stats.price_sketch.quantile(0.5),
+                "price_p90": stats.price_sketch.quantile(0.9),
+            }
+        return summary
+
+    def player_summary(self):
+        """
+        Per-player figures.
+
+        Returns:
+            dict: Player name to offered, unsold rate, mean and std sale price and
+            the price histogram as (low, high, count) bins
+        """
+        return {name: {
+            "offered": stats.offered,
+            "unsold_rate": stats.unsold / stats.offered,
+            "mean_price": stats.price.mean if stats.price.count else None,
+            "std_price": stats.price.std,
+            "histogram": stats.histogram.bins(),
+        } for name, stats in self.players.items()}
+
+    def format_report(self, players=10):
+        """
+        Render the strategy table and the highest-priced players as text.
+
+        Args:
+            players (int): Number of players to list
+        """
+        lines = [f"{'Strategy':<16}{'Seats':>8}{'Win rate':>10}{'Stars ± sd':>16}"
+                 f"{'p5/p50/p95':>20}{'Price p50/p90':>16}"]
+        ranked = sorted(self.summary().items(), key=lambda kv: (-kv[1]["win_rate"], -kv[1]["mean_stars"], kv[0]))
+        for name, row in ranked:
+            price = "-" if row["price_p50"] is None else f"{row['price_p50']:.2f}/{row['price_p90']:.2f}"
+            lines.append(
+                f"{name:<16}{row['seats']:>8}{row['win_rate']:>10.3f}"
+                f"{row['mean_stars']:>9.2f} ±{row['std_stars']:<5.2f}"
+                f"{row['stars_p5']:>8.0f}/{row['stars_p50']:.0f}/{row['stars_p95']:.0f}"
+                f"{price:>16}")
+        if players:
+            rows = sorted(self.player_summary().items(), key=lambda kv: (-(kv[1]["mean_price"] or 0.0), kv[0]))[:players]
+            lines.append(f"\n{'Player':<28}{'Offered':>9}{'Unsold':>9}{'Mean price':>12}{'Std':>8}")
+            for name, row in rows:
+                mean = "-" if row["mean_price"] is None else f"{row['mean_price']:.2f}"
+                lines.append(f"{name:<28}{row['offered']:>9}{row['unsold_rate']:>9.1%}{mean:>12}"
+                             f"{row['std_price']:>8.2f}")
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {
+            "price_bin": self.price_bin,
+            "relative_accuracy": self.relative_accuracy,
+            "auctions": self.auctions,
+            "strategies": {name: stats.to_dict() for name, stats in sorted(self.strategies.items())},
+            "players": {name: stats.to_dict() for name, stats in sorted(self.players.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        aggregator = cls(data["price_bin"], data["relative_accuracy"])
+        aggregator.auctions = data["auctions"]
+        aggregator.strategies = {name: StrategyStats.from_dict(s) for name, s in data["strategies"].items()}
+        aggregator.players = {name: PlayerStats.from_dict(p) for name, p in data["players"].items()}
+        return aggregator
+
+    def save(self, path):
+        """Write the aggregator state as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """Read an aggregator saved with ``save``."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
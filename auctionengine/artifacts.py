@@ -0,0 +1,272 @@
+"""
+On-disk cache of trained strategy models.
+
+Fitting the default models (a 100-tree random forest, a 500-iteration MLP, xgboost,
+Bayesian ridge) dominates strategy construction, and every simulation worker pays it
+again. The store keys each fitted model by strategy class, hyperparameters, a hash of
+the training data and the seed, and keeps it as a versioned pickle under a cache
+directory. A model is trained once per key and loaded from disk afterwards. The oldest
+files are evicted when the directory grows past a size limit.
+
+Models fitted by the offline training pipeline (see auctionengine.training) are kept
+apart from that cache, as numbered versions per strategy class under
+``<cache_dir>/trained/<owner>/``. Each version is a pickle holding the model and its
+metadata (target, cross-validation scores, parent version, ...), with the metadata
+also written next to it as JSON. Versions are never evicted. ``trained`` returns a
+version, the newest by default; a model-backed strategy uses one in place of its
+default fit only when given ``trained_version``, so what is on disk never changes
+the outcome of an auction that did not ask for it.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+# Bump when the file layout changes so stale artifacts are ignored rather than misread
+ARTIFACT_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.environ.get("AUCTION_MODEL_CACHE", ".model_cache")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def hash_arrays(*arrays):
+    """
+    Hash the contents, shapes and dtypes of NumPy arrays.
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.shape, array.dtype.str)).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+class ModelArtifactStore:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize a store rooted at a cache directory.
+
+        Args:
+            cache_dir (str): Directory holding the artifact files (created on first save)
+            max_bytes (int): Total size above which the least recently used files are evicted
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, owner, params, data_hash, seed):
+        """
+        Build the artifact key for a model.
+
+        Args:
+            owner (str): Strategy class name
+            params (dict): Hyperparameters and library versions; must be JSON serializable
+            data_hash (str): Hash of the training data (see hash_arrays)
+            seed (int): Seed used for training
+
+        Returns:
+            str: Hex key
+        """
+        payload = json.dumps({
+            "version": ARTIFACT_VERSION,
+            "owner": owner,
+            "params": params,
+            "data": data_hash,
+            "seed": seed,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, owner, key):
+        return os.path.join(self.cache_dir, f"{owner}-{key[:24]}.pkl")
+
+    def load(self, owner, key):
+        """
+        Load a model, or return None when it is missing, stale or unreadable.
+        """
+        path = self._path(owner, key)
+        try:
+            with open(path, "rb") as f:
+                artifact = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if artifact.get("version") != ARTIFACT_VERSION or artifact.get("key") != key:
+            return None
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return artifact["model"]
+
+    def save(self, owner, key, model):
+        """
+        Write a model atomically, then evict old artifacts if over the size limit.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"version": ARTIFACT_VERSION, "key": key, "model": model}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            # Concurrent workers may race to write the same key; either copy is valid.
+            os.replace(tmp_path, self._path(owner, key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used artifacts until the directory fits in max_bytes.
+        """
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        entries = []
+        for name in names:
+            if not name.endswith(".pkl"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def get_or_train(self, owner, params, X, y, seed, train):
+        """
+        Return the cached model for this training setup, training and saving it on a miss.
+
+        Args:
+            owner (str): Strategy class name
+            params (dict): Hyperparameters and library versions
+            X (numpy.ndarray): Training features
+            y (numpy.ndarray): Training targets
+            seed (int): Seed passed to the estimator
+            train (callable): Called as train(X, y) to fit the model on a miss
+
+        Returns:
+            object: Fitted model
+        """
+        key = self.key(owner, params, hash_arrays(X, y), seed)
+        model = self.load(owner, key)
+        if model is None:
+            model = train(X, y)
+            self.save(owner, key, model)
+        return model
+
+    def _trained_dir(self, owner):
+        return os.path.join(self.cache_dir, "trained", owner)
+
+    def versions(self, owner):
+        """
+        Version numbers of the trained models published for a strategy class.
+
+        Returns:
+            list: Version numbers, oldest first
+        """
+        paths = glob.glob(os.path.join(self._trained_dir(owner), "v*.pkl"))
+        return sorted(int(os.path.basename(path)[1:-4]) for path in paths)
+
+    def publish(self, owner, model, metadata, data=None):
+        """
+        Save a trained model as the next version for a strategy class.
+
+        Args:
+            owner (str): Strategy class name
+            model: Fitted model
+            metadata (dict): JSON-serializable description of the training run
+            data (object, optional): Extra state kept with the model for later
+                incremental training, e.g. accumulated samples
+
+        Returns:
+            int: The new version number
+        """
+        directory = self._trained_dir(owner)
+        os.makedirs(directory, exist_ok=True)
+        existing = self.versions(owner)
+        version = existing[-1] + 1 if existing else 1
+        metadata = dict(metadata, version=version)
+        stem = os.path.join(directory, f"v{version:04d}")
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"version": ARTIFACT_VERSION, "metadata": metadata, "model": model, "data": data},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(stem + ".json", "w") as f:
+                json.dump(metadata, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, stem + ".pkl")
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return version
+
+    def load_version(self, owner, version=None):
+        """
+        Load a published version, the newest by default.
+
+        Returns:
+            dict: ``model``, ``metadata`` and ``data``, or None if there is no readable version
+        """
+        if version is None:
+            existing = self.versions(owner)
+            if not existing:
+                return None
+            version = existing[-1]
+        path = os.path.join(self._trained_dir(owner), f"v{version:04d}.pkl")
+        try:
+            with open(path, "rb") as f:
+                artifact = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if artifact.get("version") != ARTIFACT_VERSION:
+            return None
+        return artifact
+
+    def trained(self, owner, version="latest"):
+        """
+        Return a published trained model for a strategy class.
+
+        Args:
+            owner (str): Strategy class name
+            version (int or str): Version number, or "latest" for the newest
+
+        Raises:
+            LookupError: If the version is not published or cannot be read
+        """
+        artifact = self.load_version(owner, None if version == "latest" else version)
+        if artifact is None:
+            raise LookupError(f"no trained {owner} model (version {version}); publish one with train.py")
+        return artifact["model"]
+
+
+_default_store = None
+
+
+def default_store():
+    """
+    Return the process-wide store used when a strategy is not given one.
+    """
+    global _default_store
+    if _default_store is None:
+        _default_store = ModelArtifactStore()
+    return _default_store
@@ -0,0 +1,260 @@
+"""
+Asyncio variant of the Dealer that solicits bids concurrently under a deadline.
+
+The Dealer asks teams for bids one at a time, so the slowest strategy sets the pace
+of the whole auction. AsyncDealer asks every eligible team at once and gives each
+call a deadline; a team that misses it is treated as holding for that round.
+Strategies may implement ``decide_bid`` as a coroutine (for example one that talks
+to a bot process) or as a plain method, which is run in a thread pool.
+
+Round semantics
+---------------
+With ``rounds="concurrent"`` (the default) a lot proceeds in rounds:
+
+1. Every team that can afford the current bid, has squad space and is not the
+   current highest bidder is asked ``decide_bid(player, current_bid)`` at the same
+   time, with the same current bid.
+2. Bids above the current bid that the team can afford are valid. The highest valid
+   bid becomes the new current bid, ties going to the team seated first.
+3. The lot closes after a round with no valid bid.
+
+This differs from the sequential loop in ``Dealer.run_bid_loop`` in three ways:
+within a pass, the loop shows each team the raises of the teams seated before it,
+whereas a concurrent round shows everyone the same price; the loop also polls the
+current highest bidder, who may raise their own bid, whereas a round skips them; and
+a team that misses a deadline holds. Outcomes therefore follow a different (but
+well-defined) distribution than the Dealer's.
+
+With ``rounds="sequential"`` the AsyncDealer polls the teams one at a time in seat
+order with exactly the loop's semantics, still under the per-call deadline. When no
+deadline is missed it reproduces the Dealer lot for lot; ``verify_against_loop``
+checks this.
+
+Without a seed, sync strategies draw from the global ``random`` module on worker
+threads, so in concurrent mode the interleaving of their draws, and hence the
+auction, is only reproducible when at most one of them draws per round. With a
+seed every seat draws from its own stream (see auctionengine.rng) and concurrent
+auctions are reproducible too.
+"""
+
+import asyncio
+import inspect
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from auctionengine.dealer import Dealer
+from auctionengine.events import NullSink
+from auctionengine.money import to_crore, to_lakhs
+from auctionengine.team import Team
+
+ROUND_MODES = ("concurrent", "sequential")
+
+
+class AsyncDealer(Dealer):
+    def __init__(self, players, teams, strategies, deadline=1.0, rounds="concurrent",
+                 executor=None, events=None, profile=False, seed=None):
+        """
+        Initialize the AsyncDealer with players, teams and bidding strategies.
+
+        :param players: List of Player objects or a lot source, as for Dealer
+        :param teams: List of Team objects, in seat order
+        :param strategies: Dict mapping team names to their strategies
+        :param deadline: Seconds each decide_bid call may take, or None to wait forever
+        :param rounds: "concurrent" or "sequential" (see module docstring)
+        :param executor: concurrent.futures.Executor for sync strategies. Defaults to a
+            thread pool with one worker per team, shut down after the auction.
+        :param events: EventSink receiving auction events, as for Dealer
+        :param profile: True or an AuctionProfiler, as for Dealer
+        :param seed: Root seed for the lot order and strategy streams, as for Dealer
+        """
+        if rounds not in ROUND_MODES:
+            raise ValueError(f"rounds must be one of {ROUND_MODES}, got {rounds!r}")
+        super().__init__(players, teams, strategies, events=events, profile=profile, seed=seed)
+        self.deadline = deadline
+        self.rounds = rounds
+        self.executor = executor
+        # Decided before any profiling wrapper hides the coroutine function
+        self._is_async = {name: inspect.iscoroutinefunction(strategy.decide_bid)
+                          for name, strategy in strategies.items()}
+        self.missed_deadlines = {team.name: 0 for team in teams}
+
+    def start_auction(self):
+        """
+        Run the auction to completion on a new event loop.
+        """
+        asyncio.run(self.run_auction())
+
+    async def run_auction(self):
+        """
+        Run the auction inside an already running event loop.
+        """
+        owns_executor = self.executor is None
+        if owns_executor:
+            self.executor = ThreadPoolExecutor(max_workers=max(len(self.teams), 1))
+        self.start_strategies()
+        if self._report:
+            self.events.auction_started(self.teams, self.seed)
+        if self.profiler:
+            self.profiler.instrument(self.strategies)
+            self.profiler.auction_started()
+
+        try:
+            for chunk in self.lot_chunks():
+                for player in chunk:
+                    await self.conduct_bidding_async(player)
+        finally:
+            if self.profiler:
+                self.profiler.auction_finished()
+                self.profiler.uninstrument()
+            if owns_executor:
+                # Calls that missed their deadline may still be running; don't wait for them
+                self.executor.shutdown(wait=False)
+                self.executor = None
+            if self._report:
+                self.events.flush()
+
+        if self._report:
+            self.events.auction_ended(self.teams)
+
+    async def conduct_bidding_async(self, player):
+        """
+        Conduct the bidding process for a single player.
+
+        :param player: Player object for whom bidding is being conducted
+        """
+        if self._report:
+            self.events.lot_started(self.lot, player)
+        if self.rounds == "concurrent":
+            result = await self.run_concurrent_rounds(player)
+        else:
+            result = await self.run_sequential_rounds(player)
+        self.finish_lot(player, *result)
+
+    async def ask(self, team, player, current_bid):
+        """
+        Ask one team for a bid under the deadline.
+
+        :param current_bid: Current bid in lakhs; the strategy is asked in Cr
+        :return: The team's bid in lakhs, or None if it missed the deadline
+        """
+        strategy = self.strategies[team.name]
+        asked = to_crore(current_bid)
+        if self._is_async[team.name]:
+            call = strategy.decide_bid(player, asked)
+        else:
+            loop = asyncio.get_running_loop()
+            call = loop.run_in_executor(self.executor, strategy.decide_bid, player, asked)
+        try:
+            return to_lakhs(await asyncio.wait_for(call, self.deadline))
+        except asyncio.TimeoutError:
+            self.missed_deadlines[team.name] += 1
+            if self._report:
+                self.events.bid_timed_out(self.lot, team, player)
+            return None
+
+    def eligible(self, team, current_bid):
+        return team.can_bid_lakhs(current_bid) and len(team.players) < team.max_players
+
+    async def run_concurrent_rounds(self, player):
+        """
+        Resolve a lot in concurrent rounds.
+
+        :param player: Player object for whom bidding is being conducted
+        :return: Tuple of (final bid in lakhs, highest bidding Team or None)
+        """
+        current_bid = to_lakhs(player.base_price)
+        highest_bidder = None
+        rounds = increments = 0
+
+        while True:
+            rounds += 1
+            bidders = [team for team in self.teams
+                       if team is not highest_bidder and self.eligible(team, current_bid)]
+            if not bidders:
+                break
+            bids = await asyncio.gather(*(self.ask(team, player, current_bid) for team in bidders))
+
+            best_team, best_bid = None, current_bid
+            for team, bid in zip(bidders, bids):
+                # Strictly greater, so ties go to the team seated first
+                if bid is not None and bid > best_bid and team.purse >= bid:
+                    best_team, best_bid = team, bid
+            if best_team is None:
+                break
+            current_bid, highest_bidder = best_bid, best_team
+            increments += 1
+            if self._report_bids:
+                self.events.bid_placed(self.lot, best_team, player, to_crore(best_bid))
+
+        if self.profiler:
+            self.profiler.record_lot(rounds, increments)
+        return current_bid, highest_bidder
+
+    async def run_sequential_rounds(self, player):
+        """
+        Resolve a lot with the semantics of Dealer.run_bid_loop, one call at a time.
+
+        :param player: Player object for whom bidding is being conducted
+        :return: Tuple of (final bid in lakhs, highest bidding Team or None)
+        """
+        current_bid = to_lakhs(player.base_price)
+        highest_bidder = None
+        rounds = increments = 0
+
+        bidding_active = True
+        while bidding_active:
+            bidding_active = False
+            rounds += 1
+            for team in self.teams:
+                if self.eligible(team, current_bid):
+                    next_bid = await self.ask(team, player, current_bid)
+                    if next_bid is not None and next_bid > current_bid and team.purse >= next_bid:
+                        current_bid = next_bid
+                        highest_bidder = team
+                        bidding_active = True
+                        increments += 1
+                        if self._report_bids:
+                            self.events.bid_placed(self.lot, team, player, to_crore(next_bid))
+
+        if self.profiler:
+            self.profiler.record_lot(rounds, increments)
+        return current_bid, highest_bidder
+
+
+def _outcome(teams):
+    return [(team.name, team.purse, [p.name for p in team.players]) for team in teams]
+
+
+def verify_against_loop(players, strategies, seeds=range(20), budget=40.0, max_players=11):
+    """
+    Check that sequential rounds reproduce the Dealer's auctions exactly.
+
+    For every seed, the Dealer and an AsyncDealer with ``rounds="sequential"`` and no
+    deadline play the same pool with the same strategies and the same seeding of
+    ``random`` and ``numpy.random``; the squads and remaining budgets must match.
+
+    Args:
+        players (list): Player pool
+        strategies (list): One strategy per seat
+        seeds (iterable): Seeds to play
+        budget (float): Starting budget of every seat
+        max_players (int): Squad size limit of every seat
+
+    Returns:
+        list: Seeds whose outcomes differ (empty when they all match)
+    """
+    def play(dealer_class, seed, **options):
+        random.seed(seed)
+        np.random.seed(seed % 2**32)
+        teams = [Team(name=f"Seat {t + 1}", budget=budget, max_players=max_players)
+                 for t in range(len(strategies))]
+        dealer = dealer_class(players=list(players), teams=teams,
+                              strategies={team.name: s for team, s in zip(teams, strategies)},
+                              events=NullSink(), **options)
+        dealer.start_auction()
+        return _outcome(teams)
+
+    return [seed for seed in seeds
+            if play(Dealer, seed) != play(AsyncDealer, seed, rounds="sequential", deadline=None)]
@@ -0,0 +1,196 @@
+"""
+Lockstep batch engine that runs many auctions at once as NumPy arrays.
+
+The Dealer works on one auction, one team and one player object at a time. The
+batch engine holds K independent auctions as arrays instead: an int64 ledger of team
+budgets in lakhs (see auctionengine.money) and squad counts (K x T), the current bid and highest bidder per auction, and a separate lot
+order per auction. All K auctions advance together, lot by lot and pass by pass.
+In each pass every seat's strategy decides for all auctions at once through its
+batched ``decide_bids(values, current_bids, budgets, rng)`` method.
+
+The pass semantics are those of ``Dealer.run_bid_loop``. Within a pass, seats are
+polled in order and each sees the bids placed by the seats before it. An auction
+finishes its lot after a pass in which nobody raised. Strategies supply two methods:
+
+- ``batch_values(players)``: per-player array computed once per batch (valuations,
+  allowed bids, ...)
+- ``decide_bids(values, current_bids, budgets, rng)``: new bid per auction, given the
+  ``batch_values`` rows of the players on the block. Bids and budgets are in Cr, as
+  for ``decide_bid``; the engine reads the bids back as lakhs.
+
+Randomness comes from one numpy Generator, so a batch is reproducible from its seed.
+It is not draw-for-draw identical to the scalar Dealer; ``cross_check`` compares the
+two outcome distributions instead.
+"""
+
+import math
+import random
+
+import numpy as np
+
+from auctionengine.dealer import Dealer
+from auctionengine.events import NullSink
+from auctionengine.money import LAKHS_PER_CRORE, ledger, to_crore, to_lakhs
+from auctionengine.team import Team
+
+
+class BatchResult:
+    def __init__(self, budgets, counts, stars, winners, prices, orders):
+        """
+        Outcome arrays of a batch of auctions.
+
+        Args:
+            budgets (numpy.ndarray): Remaining budget in lakhs per auction and seat (K x T)
+            counts (numpy.ndarray): Players bought per auction and seat (K x T)
+            stars (numpy.ndarray): Stars collected per auction and seat (K x T)
+            winners (numpy.ndarray): Winning seat per auction and lot, -1 if unsold (K x N)
+            prices (numpy.ndarray): Sale price in lakhs per auction and lot, 0 if unsold (K x N)
+            orders (numpy.ndarray): Pool index auctioned at each lot (K x N)
+        """
+        self.budgets = budgets
+        self.counts = counts
+        self.stars = stars
+        self.winners = winners
+        self.prices = prices
+        self.orders = orders
+
+    def spent(self, budget):
+        """Amount spent in Cr per auction and seat given the common starting budget in Cr."""
+        return (to_lakhs(budget) - self.budgets) / LAKHS_PER_CRORE
+
+
+def run_batch(players, strategies, n_auctions, budget=40.0, max_players=11, seed=None):
+    """
+    Run ``n_auctions`` independent auctions in lockstep.
+
+    Args:
+        players (list): Player pool shared by every auction
+        strategies (list): One strategy per seat, in bidding order; each must provide
+            batch_values and decide_bids
+        n_auctions (int): Number of concurrent auctions (K)
+        budget (float): Starting budget of every seat
+        max_players (int): Squad size limit of every seat
+        seed (int, optional): Seed for lot orders and strategy randomness
+
+    Returns:
+        BatchResult: Final state and per-lot outcomes of every auction
+    """
+    rng = np.random.default_rng(seed)
+    K, T, N = n_auctions, len(strategies), len(players)
+
+    base_prices = ledger([p.base_price for p in players])
+    player_stars = np.array([p.stats.get('stars', 0) for p in players])
+    values = [s.batch_values(players) for s in strategies]
+
+    budgets = ledger(budget, (K, T))
+    counts = np.zeros((K, T), dtype=np.int64)
+    stars = np.zeros((K, T), dtype=np.int64)
+    winners = np.full((K, N), -1, dtype=np.int64)
+    prices = np.zeros((K, N), dtype=np.int64)
+    # Independent shuffle per auction, as random.shuffle does in Dealer.start_auction
+    orders = np.argsort(rng.random((K, N)), axis=1)
+    auctions = np.arange(K)
+
+    for lot in range(N):
+        on_block = orders[:, lot]
+        current = base_prices[on_block].copy()
+        highest = np.full(K, -1, dtype=np.int64)
+        active = np.ones(K, dtype=bool)
+
+        while active.any():
+            raised = np.zeros(K, dtype=bool)
+            for t, strategy in enumerate(strategies):
+                eligible = active & (budgets[:, t] >= current) & (counts[:, t] < max_players)
+                idx = np.flatnonzero(eligible)
+                if len(idx) == 0:
+                    continue
+                bids = strategy.decide_bids(values[t][on_block[idx]], current[idx] / LAKHS_PER_CRORE,
+                                            budgets[idx, t] / LAKHS_PER_CRORE, rng)
+                bids = np.rint(bids * LAKHS_PER_CRORE).astype(np.int64)
+                accept = (bids > current[idx]) & (budgets[idx, t] >= bids)
+                hit = idx[accept]
+                current[hit] = bids[accept]
+                highest[hit] = t
+                raised[hit] = True
+            active = raised
+
+        sold = highest >= 0
+        k, t = auctions[sold], highest[sold]
+        budgets[k, t] -= current[sold]
+        counts[k, t] += 1
+        stars[k, t] += player_stars[on_block[sold]]
+        winners[:, lot] = highest
+        prices[sold, lot] = current[sold]
+
+    return BatchResult(budgets, counts, stars, winners, prices, orders)
+
+
+def _summary(values):
+    values = np.asarray(values, dtype=float)
+    return float(values.mean()), float(values.std(ddof=1) / math.sqrt(len(values)))
+
+
+def _ks_statistic(a, b):
+    """Two-sample Kolmogorov-Smirnov statistic."""
+    a, b = np.sort(a), np.sort(b)
+    grid = np.concatenate([a, b])
+    cdf_a = np.searchsorted(a, grid, side="right") / len(a)
+    cdf_b = np.searchsorted(b, grid, side="right") / len(b)
+    return float(np.max(np.abs(cdf_a - cdf_b)))
+
+
+def cross_check(players, strategies, n_auctions=200, budget=40.0, max_players=11, seed=0):
+    """
+    Compare outcome distributions of the batch engine and the scalar Dealer.
+
+    Both engines play ``n_auctions`` auctions with the same strategy objects. For every
+    seat, the stars collected and the amount spent are compared by difference of means
+    (z-score) and by the two-sample KS statistic against its 0.1% critical value.
+
+    Args:
+        players (list): Player pool
+        strategies (list): One strategy per seat, supporting both decide_bid and decide_bids
+        n_auctions (int): Auctions per engine
+        budget (float): Starting budget of every seat
+        max_players (int): Squad size limit of every seat
+        seed (int): Seed for both engines
+
+    Returns:
+        list: One dict per seat with scalar and batch means, z-scores, KS statistics
+        and a ``matches`` flag
+    """
+    T = len(strategies)
+    scalar_stars = np.zeros((n_auctions, T))
+    scalar_spent = np.zeros((n_auctions, T))
+    for i in range(n_auctions):
+        random.seed(seed + i)
+        np.random.seed((seed + i) % 2**32)
+        teams = [Team(name=f"Seat {t + 1}", budget=budget, max_players=max_players) for t in range(T)]
+        dealer = Dealer(players=list(players), teams=teams,
+                        strategies={team.name: s for team, s in zip(teams, strategies)},
+                        events=NullSink())
+        dealer.start_auction()
+        scalar_stars[i] = [sum(p.stats.get('stars', 0) for p in team.players) for team in teams]
+        scalar_spent[i] = [to_crore(to_lakhs(budget) - team.purse) for team in teams]
+
+    batch = run_batch(players, strategies, n_auctions, budget=budget, max_players=max_players, seed=seed)
+    batch_spent = batch.spent(budget)
+
+    # KS critical value at alpha = 0.001 for two samples of equal size
+    critical = 1.95 * math.sqrt(2 / n_auctions)
+    report = []
+    for t in range(T):
+        row = {"seat": t, "strategy": type(strategies[t]).__name__}
+        ok = True
+        for metric, scalar, batched in (("stars", scalar_stars[:, t], batch.stars[:, t]),
+                                        ("spent", scalar_spent[:, t], batch_spent[:, t])):
+            m1, se1 = _summary(scalar)
+            m2, se2 = _summary(batched)
+            se = math.hypot(se1, se2)
+            z = (m2 - m1) / se if se > 0 else (0.0 if m1 == m2 else math.inf)
+            ks = _ks_statistic(scalar, batched)
+            row[metric] = {"scalar_mean": m1, "batch_mean": m2, "z": z, "ks": ks}
+            ok = ok and abs(z) < 4 and ks < critical
+        row["matches"] = ok
+        report.append(row)
+    return report
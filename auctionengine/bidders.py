@@ -0,0 +1,90 @@
+"""
+Index of the teams able to bid, for auctions with many teams.
+
+The bid loop polls teams in seat order and skips any team that cannot afford the
+current bid or has a full squad. With hundreds of teams most of them are broke or
+full late in an auction, yet a plain scan still visits every one on every pass.
+
+EligibleBidderIndex keeps a max segment tree over the seats, holding each team's
+remaining purse in lakhs (or -1 once its squad is full). ``next_eligible(seat, price)``
+finds the next seat at or after ``seat`` whose team can afford ``price`` lakhs in
+O(log T), so a pass visits only teams that can actually bid, in the same seat order
+as the scan and with the same eligibility test. Leaves are laid out at
+``tree[size + seat]``, so a caller can test the next seat directly and only search
+the tree to jump over ineligible ones. Teams notify the index on every purchase and
+when their budget is set, which updates one leaf and its ancestors in O(log T).
+"""
+
+
+class EligibleBidderIndex:
+    def __init__(self, teams):
+        """
+        Build the index over teams in seat order and subscribe to their purchases.
+
+        Args:
+            teams (list): Team objects in seat order
+        """
+        self.teams = list(teams)
+        self.seats = {id(team): seat for seat, team in enumerate(self.teams)}
+        self.n = len(self.teams)
+        self.size = 1 << max(len(self.teams) - 1, 0).bit_length()
+        self.tree = [-1] * (2 * self.size)
+        for seat, team in enumerate(self.teams):
+            self.tree[self.size + seat] = self._key(team)
+            team.listeners.append(self)
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    @staticmethod
+    def _key(team):
+        return team.purse if len(team.players) < team.max_players else -1
+
+    def team_changed(self, team):
+        """
+        Refresh a team's entry after its budget or squad changed.
+
+        Args:
+            team: Team object in the index
+        """
+        tree = self.tree
+        node = self.size + self.seats[id(team)]
+        tree[node] = self._key(team)
+        node >>= 1
+        while node:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            node >>= 1
+
+    def next_eligible(self, seat, price):
+        """
+        Return the first seat at or after ``seat`` whose team can bid ``price``.
+
+        Args:
+            seat (int): Seat to start from
+            price (int): Current bid in lakhs
+
+        Returns:
+            int: Seat index, or None if no later team can bid
+        """
+        if seat >= self.n:
+            return None
+        tree = self.tree
+        node = self.size + seat
+        if tree[node] < price:
+            # Climb until a right sibling subtree holds an eligible team
+            while True:
+                if not node & 1 and tree[node + 1] >= price:
+                    node += 1
+                    break
+                node >>= 1
+                if node <= 1:
+                    return None
+            # Descend to its leftmost eligible leaf
+            while node < self.size:
+                node = 2 * node if tree[2 * node] >= price else 2 * node + 1
+        return node - self.size
+
+    def detach(self):
+        """Stop listening to the teams."""
+        for team in self.teams:
+            if self in team.listeners:
+                team.listeners.remove(self)
@@ -0,0 +1,314 @@
+"""
+Compact binary bid log and model-free replay of logged auctions.
+
+BidLogSink records every auction a Dealer runs: the seats with their budgets and
+squad limits, and for every lot the player and each accepted bid as a
+(seat, amount) pair. Lots resolved by the fast clearing engine, which reports no
+individual bids, are logged with their winning bid only.
+
+File layout (little-endian)::
+
+    b"AUCTLOG1"
+    per auction:  b"A" seed:i8 seats:u2, then per seat budget:f8 max_players:u2 name
+                  per lot: b"L" lot:u4 role:u1 base_price:f8 bids:u2 name,
+                           then bids x (seat:u2 amount:f8)
+                  b"E"
+
+where a name is a u2 byte length followed by UTF-8, and a seed of -1 means the
+auction was not seeded.
+
+``read_bid_log`` iterates the auctions of a log as AuctionRecord objects, whose
+``outcome()`` gives squads and spending straight from the bids, so large logs can be
+analyzed without re-simulating anything. ``replay`` re-drives a real Dealer from a
+record: the lot order comes from the log and every seat is played by a stand-in that
+repeats its logged bids, so no model is called, and any divergence between the log
+and the Dealer's rules raises ReplayError. It makes a fast regression check of the
+Dealer and Team logic.
+"""
+
+import struct
+
+import numpy as np
+
+from auctionengine.dealer import Dealer
+from auctionengine.events import EventSink, TeeSink
+from auctionengine.money import to_crore, to_lakhs
+from auctionengine.player_table import ROLES
+from auctionengine.team import Team
+
+MAGIC = b"AUCTLOG1"
+_AUCTION = struct.Struct("<qH")
+_SEAT = struct.Struct("<dH")
+_LOT = struct.Struct("<IBdH")
+_NAME = struct.Struct("<H")
+BID = np.dtype([("seat", "<u2"), ("amount", "<f8")])
+
+
+class ReplayError(RuntimeError):
+    """A logged auction cannot be reproduced under the Dealer's rules."""
+
+
+def _name(text):
+    data = text.encode()
+    return _NAME.pack(len(data)) + data
+
+
+class BidLogSink(EventSink):
+    """
+    Event sink writing the binary bid log. Several auctions may share one log.
+    """
+
+    def __init__(self, path, buffer_bytes=1 << 20):
+        """
+        Args:
+            path (str): Output file, truncated on open
+            buffer_bytes (int): Bytes kept in memory before writing
+        """
+        self.path = path
+        self.buffer_bytes = buffer_bytes
+        self._file = open(path, "wb")
+        self._buffer = bytearray(MAGIC)
+        self._seats = {}
+        self._bids = []
+
+    def _write(self, data):
+        self._buffer += data
+        if len(self._buffer) >= self.buffer_bytes:
+            self.flush()
+
+    def auction_started(self, teams, seed):
+        self._seats = {id(team): i for i, team in enumerate(teams)}
+        parts = [b"A", _AUCTION.pack(-1 if seed is None else seed, len(teams))]
+        for team in teams:
+            parts += [_SEAT.pack(team.budget, team.max_players), _name(team.name)]
+        self._write(b"".join(parts))
+
+    def lot_started(self, lot, player):
+        self._bids = []
+
+    def bid_placed(self, lot, team, player, amount):
+        self._bids.append((self._seats[id(team)], amount))
+
+    def _lot(self, lot, player):
+        bids = np.array(self._bids, dtype=BID)
+        self._write(b"".join([b"L", _LOT.pack(lot, ROLES.index(player.role), player.base_price, len(bids)),
+                              _name(player.name), bids.tobytes()]))
+
+    def player_sold(self, lot, team, player, price):
+        if not self._bids:
+            # Fast clearing reports only the outcome
+            self._bids.append((self._seats[id(team)], price))
+        self._lot(lot, player)
+
+    def player_unsold(self, lot, player):
+        self._lot(lot, player)
+
+    def auction_ended(self, teams):
+        self._write(b"E")
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+class LotRecord:
+    def __init__(self, lot, player_name, role, base_price, bids):
+        """
+        One logged lot.
+
+        Args:
+            lot (int): Lot index within the auction
+            player_name (str): Name of the player auctioned
+            role (str): Player role
+            base_price (float): Opening price
+            bids (numpy.ndarray): Accepted bids in order, as BID records
+        """
+        self.lot = lot
+        self.player_name = player_name
+        self.role = role
+        self.base_price = base_price
+        self.bids = bids
+
+    @property
+    def winner(self):
+        """Seat that bought the player, or None if unsold."""
+        return int(self.bids["seat"][-1]) if len(self.bids) else None
+
+    @property
+    def price(self):
+        """Sale price, 0.0 if unsold."""
+        return float(self.bids["amount"][-1]) if len(self.bids) else 0.0
+
+
+class AuctionRecord:
+    def __init__(self, seed, seats, lots):
+        """
+        One logged auction.
+
+        Args:
+            seed (int): Dealer root seed, or None
+            seats (list): (team name, starting budget, max players) per seat
+            lots (list): LotRecord per lot, in auction order
+        """
+        self.seed = seed
+        self.seats = seats
+        self.lots = lots
+
+    def outcome(self):
+        """
+        Squads and spending per seat, computed from the bids alone.
+
+        Returns:
+            list: Per seat, a dict with name, budget (remaining), spent and players
+            (names in purchase order)
+        """
+        # Summed in lakhs, so the remaining budgets are exact
+        result = [{"name": name, "budget": to_lakhs(budget), "spent": 0, "players": []}
+                  for name, budget, _ in self.seats]
+        for lot in self.lots:
+            if lot.winner is not None:
+                seat = result[lot.winner]
+                seat["budget"] -= to_lakhs(lot.price)
+                seat["spent"] += to_lakhs(lot.price)
+                seat["players"].append(lot.player_name)
+        for seat in result:
+            seat["budget"], seat["spent"] = to_crore(seat["budget"]), to_crore(seat["spent"])
+        return result
+
+
+def _read_name(f):
+    (length,) = _NAME.unpack(f.read(_NAME.size))
+    return f.read(length).decode()
+
+
+def read_bid_log(path):
+    """
+    Iterate the auctions of a bid log.
+
+    Args:
+        path (str): Log written by BidLogSink
+
+    Yields:
+        AuctionRecord: One per logged auction, in order
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a bid log")
+        while True:
+            tag = f.read(1)
+            if not tag:
+                return
+            if tag != b"A":
+                raise ValueError(f"{path}: expected an auction record, found {tag!r}")
+            seed, n_seats = _AUCTION.unpack(f.read(_AUCTION.size))
+            seats = []
+            for _ in range(n_seats):
+                budget, max_players = _SEAT.unpack(f.read(_SEAT.size))
+                seats.append((_read_name(f), budget, max_players))
+            lots = []
+            while (tag := f.read(1)) == b"L":
+                lot, role, base_price, n_bids = _LOT.unpack(f.read(_LOT.size))
+                name = _read_name(f)
+                bids = np.frombuffer(f.read(n_bids * BID.itemsize), dtype=BID)
+                lots.append(LotRecord(lot, name, ROLES[role], base_price, bids))
+            if tag != b"E":
+                raise ValueError(f"{path}: truncated auction record")
+            yield AuctionRecord(None if seed == -1 else seed, seats, lots)
+
+
+class _LoggedOrder:
+    """Lot source replaying the logged lot order."""
+
+    def __init__(self, players):
+        self.players = players
+
+    def chunks(self, rng=None):
+        yield self.players
+
+
+class _ReplaySeat:
+    """Strategy stand-in that repeats one seat's logged bids."""
+
+    def __init__(self, script, seat):
+        self.script = script
+        self.seat = seat
+
+    def decide_bid(self, player, current_bid):
+        return self.script.next_bid(self.seat, current_bid)
+
+
+class _ReplayScript(EventSink):
+    """Feeds logged bids to the seats and checks each lot's outcome against the log."""
+
+    def __init__(self, record, teams):
+        self.record = record
+        self.seat_of = {id(team): i for i, team in enumerate(teams)}
+        self.bids = None
+        self.position = 0
+
+    def next_bid(self, seat, current_bid):
+        # Offered until the Dealer accepts it, which advances the script in bid_placed
+        if self.position < len(self.bids) and self.bids[self.position]["seat"] == seat:
+            return float(self.bids[self.position]["amount"])
+        return current_bid
+
+    def lot_started(self, lot, player):
+        self.bids = self.record.lots[lot].bids
+        self.position = 0
+
+    def bid_placed(self, lot, team, player, amount):
+        expected = self.bids[self.position] if self.position < len(self.bids) else None
+        if expected is None or expected["seat"] != self.seat_of[id(team)] or expected["amount"] != amount:
+            raise ReplayError(f"lot {lot}: unexpected bid of {amount} by seat {self.seat_of[id(team)]}")
+        self.position += 1
+
+    def _check(self, lot, winner, price):
+        logged = self.record.lots[lot]
+        if self.position != len(self.bids) or winner != logged.winner or price != logged.price:
+            raise ReplayError(f"lot {lot} ({logged.player_name}): logged seat {logged.winner} at "
+                              f"{logged.price}, replayed seat {winner} at {price} after "
+                              f"{self.position} of {len(self.bids)} bids")
+
+    def player_sold(self, lot, team, player, price):
+        self._check(lot, self.seat_of[id(team)], price)
+
+    def player_unsold(self, lot, player):
+        self._check(lot, None, 0.0)
+
+
+def replay(record, players, events=None):
+    """
+    Re-drive a logged auction through the Dealer without calling any model.
+
+    Args:
+        record (AuctionRecord): Logged auction
+        players (iterable): Players of the original pool; logged lots are matched to
+            them by name and role
+        events (EventSink, optional): Sink receiving the replayed auction's events
+
+    Returns:
+        list: Teams in seat order, in their final state
+
+    Raises:
+        ReplayError: If a logged bid is not accepted or a lot ends differently
+    """
+    pool = {(p.name, p.role): p for p in players}
+    try:
+        order = [pool[(lot.player_name, lot.role)] for lot in record.lots]
+    except KeyError as e:
+        raise ReplayError(f"player {e.args[0]} of the log is not in the pool") from None
+
+    teams = [Team(name=name, budget=budget, max_players=max_players)
+             for name, budget, max_players in record.seats]
+    script = _ReplayScript(record, teams)
+    dealer = Dealer(players=_LoggedOrder(order), teams=teams,
+                    strategies={team.name: _ReplaySeat(script, i) for i, team in enumerate(teams)},
+                    events=TeeSink(script, events) if events is not None else script)
+    dealer.start_auction()
+    return teams
@@ -0,0 +1,153 @@
+"""
+Fast clearing engine that resolves a lot without polling every bid increment.
+
+A deterministic strategy can describe how it bids as a piecewise policy: a list of
+``(threshold, increment)`` segments. Called with a current bid ``c``, it raises to
+``c + increment`` for the first segment where ``c < threshold``, and holds
+when no segment matches. Given such a policy for every eligible team, the price path
+of ``Dealer.conduct_bidding`` can be reproduced in passes. Whenever every team's
+decision is known to stay the same for several passes, those passes are skipped in
+one step. Prices are tracked in integer lakhs like the loop's (see auctionengine.money),
+so the result matches it exactly.
+"""
+
+import math
+
+from auctionengine.money import LAKHS_PER_CRORE, to_crore, to_lakhs
+
+
+def _exact_lakhs(amount):
+    """Return an amount in Cr as lakhs, or None if it has more than two decimals."""
+    lakhs = to_lakhs(amount)
+    return lakhs if to_crore(lakhs) == amount else None
+
+
+def _first_lakhs_at_or_above(threshold):
+    """Smallest integer c such that c lakhs in Cr >= threshold under float comparison."""
+    c = math.floor(threshold * LAKHS_PER_CRORE) - 1
+    while to_crore(c) < threshold:
+        c += 1
+    return c
+
+
+class _LotBidder:
+    """A team's piecewise policy for one lot, expressed in lakhs."""
+
+    def __init__(self, team, segments):
+        self.team = team
+        self.purse = team.purse
+        # (first price in lakhs at which the segment no longer applies, increment in lakhs)
+        self.segments = [(_first_lakhs_at_or_above(t), inc) for t, inc in segments]
+        # Every price at which the team's decision can change.
+        points = {limit for limit, _ in self.segments}
+        points.add(self.purse + 1)
+        for _, inc in self.segments:
+            points.add(self.purse - inc + 1)
+        self.breakpoints = sorted(points)
+
+    def decide(self, price):
+        """Return the increment in lakhs the team raises by at this price, or 0 to hold."""
+        if self.purse < price:
+            return 0
+        for limit, inc in self.segments:
+            if price < limit:
+                return inc if self.purse >= price + inc else 0
+        return 0
+
+    def stable_until(self, price):
+        """First price above ``price`` at which ``decide`` may return something else."""
+        for point in self.breakpoints:
+            if point > price:
+                return point
+        return math.inf
+
+
+def clear_lot(player, teams, strategies):
+    """
+    Resolve a lot in passes without simulating every increment.
+
+    Args:
+        player: Player object being auctioned
+        teams (list): Team objects in bidding order
+        strategies (dict): Team name to strategy mapping
+
+    Returns:
+        tuple: (final price in lakhs, winning Team or None), or None when some eligible team's
+        strategy does not provide a ``bid_policy`` and the lot has to be run by the loop.
+    """
+    start = _exact_lakhs(player.base_price)
+    if start is None:
+        return None
+
+    bidders = []
+    for team in teams:
+        # Full squads and teams that cannot meet the base price never bid on this lot.
+        if len(team.players) >= team.max_players or not team.can_bid_lakhs(start):
+            continue
+        strategy = strategies[team.name]
+        if not hasattr(strategy, "bid_policy"):
+            return None
+        segments = strategy.bid_policy(player)
+        if segments is None:
+            return None
+        incs = [_exact_lakhs(inc) for _, inc in segments]
+        if any(inc is None or inc <= 0 for inc in incs):
+            return None
+        bidders.append(_LotBidder(team, [(t, inc) for (t, _), inc in zip(segments, incs)]))
+
+    price = start
+    winner = None
+    while True:
+        # Run one pass exactly as the loop would, remembering each decision.
+        visits = []
+        last_raiser = None
+        pass_start = price
+        for bidder in bidders:
+            inc = bidder.decide(price)
+            visits.append((bidder, price, inc))
+            if inc:
+                price += inc
+                last_raiser = bidder
+        step = price - pass_start
+        if step == 0:
+            break
+        winner = last_raiser.team
+
+        # Every later pass repeats this one while no team crosses a breakpoint.
+        skip = math.inf
+        for bidder, seen, inc in visits:
+            limit = bidder.stable_until(seen)
+            skip = min(skip, (limit - 1 - seen) // step)
+        if skip > 0:
+            price += skip * step
+
+    return price, winner
+
+
+def verify_against_loop(dealer, players=None):
+    """
+    Run an auction with the bid loop and check that clear_lot agrees on every lot.
+
+    Sales are applied from the loop's result, so later lots are compared against
+    the same team state the loop would see. Lots the fast engine declines to
+    resolve (stochastic strategies) are skipped.
+
+    Args:
+        dealer: Dealer whose teams and strategies are used; teams are modified
+        players (list, optional): Lots in auction order. Defaults to dealer.players.
+
+    Returns:
+        list: (player name, loop result, fast result) for every lot that disagreed
+    """
+    players = dealer.players if players is None else players
+    dealer.prepare_strategies(dealer.players)
+    mismatches = []
+    for player in players:
+        fast = clear_lot(player, dealer.teams, dealer.strategies)
+        price, winner = dealer.run_bid_loop(player)
+        if fast is not None and fast != (price, winner):
+            mismatches.append((player.name, (price, winner), fast))
+        if winner:
+            player.winning_bid = to_crore(price)
+            winner.add_player_lakhs(player, price)
+    return mismatches
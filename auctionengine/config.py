@@ -0,0 +1,108 @@
+"""
+League configuration: the teams of an auction, their budgets and strategies.
+
+A config is a JSON file::
+
+    {
+        "dataset": "dataset",
+        "budget": 40.0,
+        "max_players": 11,
+        "teams": [
+            {"name": "Team A", "strategy": "random_forest"},
+            {"name": "Team C", "budget": 50.0, "strategy": {"name": "statistical_planner",
+                                                             "params": {"budget_unit": 0.1}}},
+            {"name": "Bot {i}", "count": 96, "strategy": "statistical"}
+        ]
+    }
+
+Top-level ``budget`` and ``max_players`` are defaults that a team entry may
+override. A strategy is a registry name (see strategies.registry) or an object with
+``name`` and constructor ``params``; strategies that take a ``total_budget`` get
+their team's budget. An entry with ``count`` stands for that many teams named by
+formatting ``name`` with ``i`` = 1..count, so a league of any size stays a few
+lines long. Teams bid in the order they are listed.
+"""
+
+import json
+
+from auctionengine.team import Team
+
+DEFAULT_CONFIG = "configs/default.json"
+
+
+def load_config(path):
+    """
+    Read and check a league config.
+
+    Args:
+        path (str): JSON config file
+
+    Returns:
+        dict: The config, with one entry per team (``count`` expanded) carrying
+        name, budget, max_players, strategy and params
+
+    Raises:
+        ValueError: If the config is malformed
+    """
+    with open(path) as f:
+        config = json.load(f)
+    return expand_config(config, source=path)
+
+
+def expand_config(config, source="config"):
+    """
+    Check a config dict and expand it to one entry per team.
+
+    Args:
+        config (dict): Parsed config
+        source (str): Name used in error messages
+
+    Returns:
+        dict: See load_config
+    """
+    if not isinstance(config.get("teams"), list) or not config["teams"]:
+        raise ValueError(f"{source}: 'teams' must be a non-empty list")
+    teams = []
+    for n, entry in enumerate(config["teams"]):
+        where = f"{source}: teams[{n}]"
+        strategy = entry.get("strategy")
+        if isinstance(strategy, str):
+            strategy = {"name": strategy}
+        if not isinstance(strategy, dict) or "name" not in strategy:
+            raise ValueError(f"{where}: 'strategy' must be a name or an object with a 'name'")
+        budget = entry.get("budget", config.get("budget"))
+        max_players = entry.get("max_players", config.get("max_players"))
+        if budget is None or max_players is None:
+            raise ValueError(f"{where}: 'budget' and 'max_players' are required here or at the top level")
+        count = entry.get("count")
+        names = [entry["name"]] if count is None else [entry["name"].format(i=i) for i in range(1, count + 1)]
+        for name in names:
+            teams.append({"name": name, "budget": float(budget), "max_players": int(max_players),
+                          "strategy": strategy["name"], "params": dict(strategy.get("params", {}))})
+    seen = set()
+    for team in teams:
+        if team["name"] in seen:
+            raise ValueError(f"{source}: duplicate team name {team['name']!r}")
+        seen.add(team["name"])
+    return dict(config, teams=teams)
+
+
+def build_league(config):
+    """
+    Create the teams and strategies a config describes. Strategy modules are
+    imported only for the strategies the config uses.
+
+    Args:
+        config (dict): Config from load_config or expand_config
+
+    Returns:
+        tuple: (list of Team in seat order, dict of team name -> strategy)
+    """
+    from strategies import registry
+
+    teams, strategies = [], {}
+    for entry in config["teams"]:
+        team = Team(name=entry["name"], budget=entry["budget"], max_players=entry["max_players"])
+        teams.append(team)
+        strategies[team.name] = registry.create(entry["strategy"], budget=team.budget, **entry["params"])
+    return teams, strategies
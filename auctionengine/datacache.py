@@ -0,0 +1,174 @@
+"""
+Compiled binary cache for the dataset CSVs.
+
+Parsing a CSV on every run, and again in every worker process of a simulation batch,
+is wasted work. The first load of a file writes its PlayerTable columns as ``.npy``
+files, with names, nationality, span and high score stored as fixed-width string
+columns. Later loads open them with ``mmap_mode='r'``, so the OS page cache is shared
+between every process reading the same dataset. A compiled copy is rebuilt when its
+source changes: a changed mtime or size triggers a content hash check, and only a
+changed hash triggers a rebuild.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from auctionengine.player_table import PlayerTable, stat_schema
+
+# Bump when the on-disk layout changes so old caches are rebuilt
+CACHE_VERSION = 1
+
+CACHE_DIRNAME = ".cache"
+
+
+def _file_hash(filepath):
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def compiled_dir(filepath, role, cache_dir=None):
+    """
+    Return the directory holding the compiled copy of a CSV file.
+
+    Args:
+        filepath (str): Source CSV path
+        role (str): Role the file is loaded as
+        cache_dir (str, optional): Cache root. Defaults to a .cache directory next to the CSV.
+
+    Returns:
+        str: Directory path
+    """
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(filepath)), CACHE_DIRNAME)
+    stem = os.path.splitext(os.path.basename(filepath))[0]
+    return os.path.join(cache_dir, f"{stem}-{role}")
+
+
+def _read_meta(directory):
+    try:
+        with open(os.path.join(directory, "meta.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(directory, meta):
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, os.path.join(directory, "meta.json"))
+
+
+def _is_current(directory, filepath, role):
+    """Check a compiled copy against its source, refreshing the stored mtime if only that changed."""
+    meta = _read_meta(directory)
+    if meta is None or meta.get("version") != CACHE_VERSION or meta.get("role") != role:
+        return False
+    stat = os.stat(filepath)
+    source = meta["source"]
+    if source["mtime_ns"] == stat.st_mtime_ns and source["size"] == stat.st_size:
+        return True
+    # Touched but possibly unchanged (e.g. a fresh checkout): compare contents.
+    if source["size"] != stat.st_size or source["sha256"] != _file_hash(filepath):
+        return False
+    source["mtime_ns"] = stat.st_mtime_ns
+    try:
+        _write_meta(directory, meta)
+    except OSError:
+        pass
+    return True
+
+
+def compile_dataset(filepath, role, cache_dir=None):
+    """
+    Parse a CSV and write its compiled copy, replacing any previous one.
+
+    Args:
+        filepath (str): Source CSV path
+        role (str): Player role of every row
+        cache_dir (str, optional): Cache root (see compiled_dir)
+
+    Returns:
+        str: Directory the compiled copy was written to
+    """
+    directory = compiled_dir(filepath, role, cache_dir)
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+
+    stat = os.stat(filepath)
+    # pandas is only needed to parse CSVs, not to read the compiled cache
+    import pandas as pd
+    table = PlayerTable.from_frame(pd.read_csv(filepath), role)
+
+    # Write into a private directory, then swap it in so readers never see a partial copy.
+    staging = tempfile.mkdtemp(dir=parent, prefix=".build-")
+    try:
+        np.save(os.path.join(staging, "names.npy"), table.names)
+        np.save(os.path.join(staging, "nationalities.npy"), table.nationalities)
+        np.save(os.path.join(staging, "base_prices.npy"), table.base_prices)
+        np.save(os.path.join(staging, "features.npy"), table.features)
+        for key in table.stat_columns:
+            np.save(os.path.join(staging, f"stat_{key}.npy"), table.columns[key])
+        _write_meta(staging, {
+            "version": CACHE_VERSION,
+            "role": role,
+            "rows": len(table),
+            "source": {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": _file_hash(filepath)},
+        })
+        retired = None
+        if os.path.isdir(directory):
+            retired = tempfile.mkdtemp(dir=parent, prefix=".old-")
+            os.replace(directory, os.path.join(retired, "data"))
+        os.replace(staging, directory)
+        if retired:
+            shutil.rmtree(retired, ignore_errors=True)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        # Another process may have installed a copy first; that copy is equally valid.
+        if not os.path.isdir(directory):
+            raise
+    return directory
+
+
+def open_compiled(directory, role):
+    """
+    Open a compiled copy as a PlayerTable backed by read-only memory maps.
+
+    Args:
+        directory (str): Directory written by compile_dataset
+        role (str): Player role of every row
+
+    Returns:
+        PlayerTable: Table whose columns are memory-mapped .npy files
+    """
+    def load(name):
+        return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+
+    columns = {key: load(f"stat_{key}") for key, _, _, _ in stat_schema(role)}
+    return PlayerTable(role, load("names"), load("nationalities"), load("base_prices"), columns,
+                       features=load("features"))
+
+
+def load_compiled(filepath, role, cache_dir=None):
+    """
+    Load a CSV through its compiled copy, building or rebuilding the copy when needed.
+
+    Args:
+        filepath (str): Source CSV path
+        role (str): Player role of every row
+        cache_dir (str, optional): Cache root (see compiled_dir)
+
+    Returns:
+        PlayerTable: Memory-mapped player table
+    """
+    directory = compiled_dir(filepath, role, cache_dir)
+    if not _is_current(directory, filepath, role):
+        directory = compile_dataset(filepath, role, cache_dir)
+    return open_compiled(directory, role)
@@ -4,62 +4,325 @@ The Dealer handles player bidding, team assignments, and auction flow control.
 """
 
 import random
+from auctionengine.bidders import EligibleBidderIndex
+from auctionengine.clearing import clear_lot
+from auctionengine.events import ConsoleSink
+from auctionengine.money import to_crore, to_lakhs
+from auctionengine.profiling import AuctionProfiler
+from auctionengine.rng import RngStreams, seed_strategy
+from auctionengine.state import AuctionState
 
 class Dealer:
-    def __init__(self, players, teams, strategies):
+    def __init__(self, players, teams, strategies, fast_clearing=False, events=None, profile=False,
+                 seed=None, bidder_index=False, antithetic=False, lot_streams=False):
         """
         Initialize the Dealer with players, teams and bidding strategies.
 
-        :param players: List of Player objects representing available players for auction
+        :param players: List of Player objects representing available players for auction,
+            or a lot source (see auctionengine.lots) that streams them in chunks
         :param teams: List of Team objects that will participate in bidding
         :param strategies: Dict mapping team names to their BiddingStrategy objects
+        :param fast_clearing: Resolve lots with auctionengine.clearing when every eligible
+            strategy provides a bid_policy, falling back to the bid loop otherwise
+        :param events: EventSink receiving auction events (see auctionengine.events).
+            Defaults to a ConsoleSink, which prints the usual auction log.
+        :param profile: True, or an AuctionProfiler to share between auctions, to record
+            strategy call latencies and per-lot rounds (see auctionengine.profiling)
+        :param seed: Root seed. When given, the lot order and every seat's strategy draw
+            from their own streams derived from it (see auctionengine.rng) instead of the
+            global random state. Strategies are reseeded when the auction starts.
+        :param bidder_index: Poll only teams that can bid, through an EligibleBidderIndex
+            (see auctionengine.bidders). Whether it beats a plain scan depends on the
+            number of teams and on how cheap the strategies are, so it is opt-in.
+        :param antithetic: Auction the shuffled players in reverse order. With the same seed,
+            this pairs every lot order with its mirror image: lots that came early come late.
+            Only supported for a player list, not a lot source.
+        :param lot_streams: With a seed, restart every seat's random stream at each lot from
+            the seat and lot number. Two runs of the same seed then feed a seat the same
+            numbers on every lot, even after their decisions (and so their draw counts) differ.
         """
+        if antithetic and hasattr(players, "chunks"):
+            raise ValueError("antithetic lot orders need a player list, not a lot source")
         self.players = players
         self.teams = teams
         self.strategies = strategies
+        self.fast_clearing = fast_clearing
+        self.events = events if events is not None else ConsoleSink()
+        # Checked on the hot path so a NullSink costs nothing per lot or bid
+        self._report = self.events.enabled
+        self._report_bids = self.events.enabled and self.events.records_bids
+        self.lot = 0
+        self.profiler = AuctionProfiler() if profile is True else (profile or None)
+        self.seed = seed
+        self.random = RngStreams(seed).python("dealer") if seed is not None else random
+        self.antithetic = antithetic
+        self.lot_streams = lot_streams and seed is not None
+        # (team, strategy) pairs with a random stream, reseeded per lot when lot_streams is set
+        self._seeded = []
+        # (seat, strategy) pairs given a live AuctionState, and those states
+        self._watchers = []
+        self._states = []
+        # (team, strategy) pairs told about every closed lot, see start_strategies
+        self._lot_listeners = []
+        self.use_bidder_index = bidder_index
+        # Built when the auction starts and detached from the teams when it ends
+        self.bidder_index = None
 
     def start_auction(self):
         """
         Start the auction process for all players.
         Players are shuffled randomly to ensure fair auction order.
+        A lot source supplies its own shuffled order, one chunk at a time.
         """
-        # Randomize the order of players for auction
-        random.shuffle(self.players)
+        self.start_strategies()
+        if self._report:
+            self.events.auction_started(self.teams, self.seed)
+        if self.profiler:
+            self.profiler.instrument(self.strategies)
+            self.profiler.auction_started()
+        if self.use_bidder_index:
+            self.bidder_index = EligibleBidderIndex(self.teams)
 
-        # Auction each player one by one
-        for player in self.players:
-            print(f"\nAuctioning {player.name} ({player.role}) - Base Price: {player.base_price} Cr")
-            self.conduct_bidding(player)
+        try:
+            # Auction each player one by one
+            for chunk in self.lot_chunks():
+                for player in chunk:
+                    self.conduct_bidding(player)
+        finally:
+            if self.profiler:
+                self.profiler.auction_finished()
+                self.profiler.uninstrument()
+            if self.bidder_index is not None:
+                # Teams outlive the auction; don't keep notifying a dead index
+                self.bidder_index.detach()
+                self.bidder_index = None
+            if self._report:
+                # Buffered sinks write out the lots played so far, even if one failed
+                self.events.flush()
+
+        if self._report:
+            self.events.auction_ended(self.teams)
+
+    def lot_chunks(self):
+        """
+        Yield the players in auction order, as one shuffled list or, for a lot
+        source, chunk by chunk. Strategies are prepared before each chunk and
+        released after it.
+        """
+        if hasattr(self.players, "chunks"):
+            for chunk in self.players.chunks(rng=self.random):
+                self.prepare_strategies(chunk)
+                yield chunk
+                # Nothing should keep the finished lots alive except their buyers
+                self.release_strategies(chunk)
+        else:
+            # Randomize the order of players for auction
+            self.random.shuffle(self.players)
+            if self.antithetic:
+                # Same draws as the plain order, so every other stream is unaffected
+                self.players.reverse()
+
+            # Let strategies score the whole pool before the first lot
+            self.prepare_strategies(self.players)
+            yield self.players
+
+    def start_strategies(self):
+        """
+        Get strategies ready for a new auction: give each seat its own random stream
+        when the Dealer has a seed, call new_auction() on strategies that define it,
+        and collect those that want lot_closed(player, price, won) after every lot and
+        those that want an AuctionState through watch_auction(state, seat).
+        """
+        streams = RngStreams(self.seed) if self.seed is not None else None
+        self._lot_listeners = []
+        self._seeded = []
+        self._watchers = []
+        self._states = []
+        self._seats = {team.name: seat for seat, team in enumerate(self.teams)}
+        for seat, team in enumerate(self.teams):
+            strategy = self.strategies[team.name]
+            if streams:
+                seed_strategy(strategy, streams, f"team:{team.name}")
+                if self.lot_streams and getattr(strategy, "rng", None) is not None:
+                    self._seeded.append((team, strategy))
+            if hasattr(strategy, "new_auction"):
+                strategy.new_auction()
+            if hasattr(strategy, "lot_closed"):
+                self._lot_listeners.append((team, strategy))
+            if hasattr(strategy, "watch_auction"):
+                self._watchers.append((seat, strategy))
+
+    def prepare_strategies(self, players):
+        """
+        Give every strategy that supports it a chance to precompute valuations
+        for the upcoming players (see auctionengine.valuation.ValuationCache), and
+        give watchers a fresh AuctionState of the upcoming lots.
+        With a lot source this runs once per chunk.
+
+        :param players: Players about to be auctioned
+        """
+        for strategy in self.strategies.values():
+            if hasattr(strategy, "begin_auction"):
+                strategy.begin_auction(players)
+        # Each watcher gets its own state, drawing from its own random stream
+        self._states = []
+        for seat, strategy in self._watchers:
+            state = AuctionState.from_teams(self.teams, players, rng=getattr(strategy, "rng", None))
+            strategy.watch_auction(state, seat)
+            self._states.append(state)
+
+    def release_strategies(self, players):
+        """
+        Drop cached valuations of players whose lots have finished, and call
+        release_players(players) on strategies that define it.
+
+        :param players: Players already auctioned
+        """
+        for strategy in self.strategies.values():
+            cache = getattr(strategy, "valuations", None)
+            if cache is not None:
+                cache.invalidate(players)
+            if hasattr(strategy, "release_players"):
+                strategy.release_players(players)
 
     def conduct_bidding(self, player):
         """
         Conduct the bidding process for a single player.
-        
+
+        Events may stay buffered in the sink; callers that drive lots themselves
+        instead of through start_auction call ``events.flush()`` when done.
+
+        :param player: Player object for whom bidding is being conducted
+        """
+        if self._report:
+            self.events.lot_started(self.lot, player)
+        if self._seeded:
+            streams = RngStreams(self.seed)
+            for team, strategy in self._seeded:
+                seed_strategy(strategy, streams, f"team:{team.name}:lot:{self.lot}")
+
+        # The fast engine reports only the outcome, not the individual bids
+        result = clear_lot(player, self.teams, self.strategies) if self.fast_clearing else None
+        if result is None:
+            result = self.run_bid_loop(player)
+        elif self.profiler:
+            self.profiler.record_fast_lot()
+        self.finish_lot(player, *result)
+
+    def finish_lot(self, player, current_bid, highest_bidder):
+        """
+        Record the outcome of a lot and move on to the next one.
+
+        :param player: Player object that was auctioned
+        :param current_bid: Final bid in lakhs
+        :param highest_bidder: Winning Team, or None if nobody bid
+        """
+        price = to_crore(current_bid)
+        # Finalize the auction for the player
+        if highest_bidder:
+            player.winning_bid = price  # Set the winning bid amount
+            highest_bidder.add_player_lakhs(player, current_bid)
+            if self._report:
+                self.events.player_sold(self.lot, highest_bidder, player, price)
+        else:
+            player.winning_bid = 0.0  # No winning bid
+            if self._report:
+                self.events.player_unsold(self.lot, player)
+        if self._states:
+            bought = highest_bidder is not None and bool(highest_bidder.players) \
+                and highest_bidder.players[-1] is player
+            seat = self._seats[highest_bidder.name] if bought else None
+            for state in self._states:
+                state.close_lot(seat, current_bid if bought else 0)
+        for team, strategy in self._lot_listeners:
+            strategy.lot_closed(player, price if highest_bidder else 0.0, team is highest_bidder)
+        self.lot += 1
+
+    def run_bid_loop(self, player):
+        """
+        Poll every team on every increment until a full pass produces no higher bid.
+
+        Bids are compared in lakhs. Strategies are asked with the current bid in Cr,
+        and a bid that is not at least one lakh higher is no raise.
+
         :param player: Player object for whom bidding is being conducted
+        :return: Tuple of (final bid in lakhs, highest bidding Team or None)
         """
-        current_bid = player.base_price
+        if self.bidder_index is not None:
+            return self.run_indexed_bid_loop(player)
+
+        current_bid = to_lakhs(player.base_price)
+        asked = to_crore(current_bid)
         highest_bidder = None
 
+        rounds = increments = 0
+
         # Continue bidding until no team makes a higher bid
         bidding_active = True
         while bidding_active:
             bidding_active = False
+            rounds += 1
             for team in self.teams:
                 # Check if team can participate in bidding
-                if team.can_bid(current_bid) and len(team.players) < team.max_players:
+                if team.purse >= current_bid and len(team.players) < team.max_players:
                     # Get next bid amount based on team's strategy
-                    next_bid = self.strategies[team.name].decide_bid(player, current_bid)
-                    # Update highest bid if team can afford it
-                    if next_bid > current_bid and team.budget >= next_bid:
+                    bid = self.strategies[team.name].decide_bid(player, asked)
+                    # Update highest bid if team can afford it. A hold returns the
+                    # current bid, so only a higher bid needs reading as lakhs.
+                    if bid > asked and (next_bid := to_lakhs(bid)) > current_bid and team.purse >= next_bid:
                         current_bid = next_bid
+                        asked = to_crore(next_bid)
                         highest_bidder = team
                         bidding_active = True
+                        increments += 1
+                        if self._report_bids:
+                            self.events.bid_placed(self.lot, team, player, asked)
 
-        # Finalize the auction for the player
-        if highest_bidder:
-            player.winning_bid = current_bid  # Set the winning bid amount
-            highest_bidder.add_player(player, current_bid)
-            print(f"{highest_bidder.name} wins {player.name} for {current_bid} Cr")
-        else:
-            player.winning_bid = 0.0  # No winning bid
-            print(f"No bids placed for {player.name}. Player remains unsold.")
\ No newline at end of file
+        if self.profiler:
+            self.profiler.record_lot(rounds, increments)
+        return current_bid, highest_bidder
+
+    def run_indexed_bid_loop(self, player):
+        """
+        run_bid_loop visiting, in each pass, only the teams the bidder index reports
+        as able to afford the current bid.
+
+        :param player: Player object for whom bidding is being conducted
+        :return: Tuple of (final bid in lakhs, highest bidding Team or None)
+        """
+        teams = self.teams
+        index = self.bidder_index
+        tree, first_leaf, n = index.tree, index.size, index.n
+        next_eligible = index.next_eligible
+        current_bid = to_lakhs(player.base_price)
+        asked = to_crore(current_bid)
+        highest_bidder = None
+
+        rounds = increments = 0
+
+        bidding_active = True
+        while bidding_active:
+            bidding_active = False
+            rounds += 1
+            seat = 0
+            while seat < n:
+                if tree[first_leaf + seat] < current_bid:
+                    # Jump over the teams that cannot afford the current bid
+                    seat = next_eligible(seat, current_bid)
+                    if seat is None:
+                        break
+                team = teams[seat]
+                bid = self.strategies[team.name].decide_bid(player, asked)
+                if bid > asked and (next_bid := to_lakhs(bid)) > current_bid and team.purse >= next_bid:
+                    current_bid = next_bid
+                    asked = to_crore(next_bid)
+                    highest_bidder = team
+                    bidding_active = True
+                    increments += 1
+                    if self._report_bids:
+                        self.events.bid_placed(self.lot, team, player, asked)
+                seat += 1
+
+        if self.profiler:
+            self.profiler.record_lot(rounds, increments)
+        return current_bid, highest_bidder
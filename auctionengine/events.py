@@ -0,0 +1,217 @@
+"""
+Structured auction events and the sinks that consume them.
+
+The Dealer reports what happens in an auction (lot started, bid placed, player sold
+or unsold, auction ended) to an event sink instead of printing. Sinks receive the
+live Team and Player objects and build any record themselves, so the Dealer
+constructs nothing when the NullSink is active: it only checks a flag.
+
+- NullSink: discards everything (batch simulation)
+- ConsoleSink: buffered version of the Dealer's console output
+- JsonlSink: buffered JSON Lines file, one event per line, written in bulk
+- TeeSink: forwards every event to several sinks
+- BidLogSink (auctionengine.bidlog): compact binary log for replay
+"""
+
+import json
+import sys
+
+
+class EventSink:
+    """
+    Base class for event sinks. Every handler is a no-op.
+
+    ``enabled`` tells the Dealer whether to report events at all, and ``records_bids``
+    whether to report individual bids, which are by far the most frequent event.
+    """
+
+    enabled = True
+    records_bids = True
+
+    def auction_started(self, teams, seed):
+        """The first lot is about to start. ``seed`` is the Dealer's root seed, or None."""
+
+    def lot_started(self, lot, player):
+        """A player goes under the hammer. ``lot`` counts from 0 within the auction."""
+
+    def bid_placed(self, lot, team, player, amount):
+        """A team raised the current bid to ``amount``."""
+
+    def bid_timed_out(self, lot, team, player):
+        """``team`` missed its bid deadline and holds (see auctionengine.async_dealer)."""
+
+    def player_sold(self, lot, team, player, price):
+        """The lot closed with ``team`` buying ``player`` for ``price``."""
+
+    def player_unsold(self, lot, player):
+        """The lot closed without a bid."""
+
+    def auction_ended(self, teams):
+        """Every lot has been auctioned."""
+
+    def flush(self):
+        """Write out anything buffered."""
+
+    def close(self):
+        """Flush and release any underlying resource."""
+        self.flush()
+
+
+class NullSink(EventSink):
+    """Sink that discards every event; the Dealer skips reporting entirely."""
+
+    enabled = False
+    records_bids = False
+
+
+class ConsoleSink(EventSink):
+    """
+    Human-readable auction log, matching the Dealer's original console output.
+
+    Lines are collected and written in one call every ``buffer_lines`` lines and when
+    the auction ends, instead of one write per line.
+    """
+
+    records_bids = False
+
+    def __init__(self, stream=None, buffer_lines=256):
+        """
+        Args:
+            stream: Text stream to write to. Defaults to sys.stdout at write time.
+            buffer_lines (int): Lines kept in memory before writing
+        """
+        self.stream = stream
+        self.buffer_lines = buffer_lines
+        self._lines = []
+
+    def _write(self, line):
+        self._lines.append(line)
+        if len(self._lines) >= self.buffer_lines:
+            self.flush()
+
+    def lot_started(self, lot, player):
+        self._write(f"\nAuctioning {player.name} ({player.role}) - Base Price: {player.base_price} Cr")
+
+    def player_sold(self, lot, team, player, price):
+        self._write(f"{team.name} wins {player.name} for {price} Cr")
+
+    def player_unsold(self, lot, player):
+        self._write(f"No bids placed for {player.name}. Player remains unsold.")
+
+    def auction_ended(self, teams):
+        self.flush()
+
+    def flush(self):
+        if self._lines:
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(self._lines) + "\n")
+            self._lines = []
+
+
+class JsonlSink(EventSink):
+    """
+    Machine-readable event log in JSON Lines format.
+
+    Records are buffered and written ``flush_every`` at a time. Bid events can be
+    left out with ``record_bids=False`` to keep logs of large batches small.
+    """
+
+    def __init__(self, path, flush_every=4096, record_bids=True):
+        """
+        Args:
+            path (str): Output file, truncated on open
+            flush_every (int): Records kept in memory before writing
+            record_bids (bool): Log every accepted bid, not just lot outcomes
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.records_bids = record_bids
+        self._file = open(path, "w")
+        self._records = []
+
+    def _emit(self, record):
+        self._records.append(record)
+        if len(self._records) >= self.flush_every:
+            self.flush()
+
+    def lot_started(self, lot, player):
+        self._emit({"event": "lot_start", "lot": lot, "player": player.name,
+                    "role": player.role, "base_price": player.base_price})
+
+    def bid_placed(self, lot, team, player, amount):
+        self._emit({"event": "bid", "lot": lot, "team": team.name, "amount": amount})
+
+    def bid_timed_out(self, lot, team, player):
+        self._emit({"event": "timeout", "lot": lot, "team": team.name})
+
+    def player_sold(self, lot, team, player, price):
+        self._emit({"event": "sold", "lot": lot, "player": player.name, "team": team.name, "price": price})
+
+    def player_unsold(self, lot, player):
+        self._emit({"event": "unsold", "lot": lot, "player": player.name})
+
+    def auction_ended(self, teams):
+        self._emit({"event": "auction_end", "teams": [
+            {"name": t.name, "budget": t.budget, "players": [p.name for p in t.players]} for t in teams
+        ]})
+        self.flush()
+
+    def flush(self):
+        if self._records:
+            self._file.write("".join(json.dumps(r) + "\n" for r in self._records))
+            self._records = []
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+class TeeSink(EventSink):
+    """Sink that forwards every event to each of several sinks."""
+
+    def __init__(self, *sinks):
+        """
+        Args:
+            *sinks: EventSink objects, called in order
+        """
+        self.sinks = [sink for sink in sinks if sink.enabled]
+        self.enabled = bool(self.sinks)
+        self.records_bids = any(sink.records_bids for sink in self.sinks)
+        self._bid_sinks = [sink for sink in self.sinks if sink.records_bids]
+
+    def auction_started(self, teams, seed):
+        for sink in self.sinks:
+            sink.auction_started(teams, seed)
+
+    def lot_started(self, lot, player):
+        for sink in self.sinks:
+            sink.lot_started(lot, player)
+
+    def bid_placed(self, lot, team, player, amount):
+        for sink in self._bid_sinks:
+            sink.bid_placed(lot, team, player, amount)
+
+    def bid_timed_out(self, lot, team, player):
+        for sink in self.sinks:
+            sink.bid_timed_out(lot, team, player)
+
+    def player_sold(self, lot, team, player, price):
+        for sink in self.sinks:
+            sink.player_sold(lot, team, player, price)
+
+    def player_unsold(self, lot, player):
+        for sink in self.sinks:
+            sink.player_unsold(lot, player)
+
+    def auction_ended(self, teams):
+        for sink in self.sinks:
+            sink.auction_ended(teams)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
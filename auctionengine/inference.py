@@ -0,0 +1,291 @@
+"""
+Flat NumPy inference kernels for the strategies' fitted models.
+
+sklearn and xgboost validate their input and dispatch through several layers on
+every ``predict``. For the three to five features the strategies use, that overhead
+is far larger than the arithmetic, most of all for the single-row predicts a
+ValuationCache makes on a miss. ``compile_model`` exports a fitted model into plain
+arrays and returns a kernel whose ``predict(X)`` takes a 2-D feature matrix, like the
+model's, and gives the same predictions:
+
+- LinearRegression, BayesianRidge: ``X @ coef + intercept``.
+- MLPRegressor: dense layer weights with the hidden activation, identity output.
+- RandomForestRegressor, XGBRegressor: every tree packed into shared node arrays
+  (feature, threshold, children, value, default direction), walked level by level
+  for all rows and trees at once. Leaves are their own children, so a level is a few
+  gathers with no per-node branching; walkers that reached a leaf are dropped every
+  few levels, since fully grown trees are far from balanced.
+
+Kernels reproduce each library's arithmetic, not just its result: forests compare
+float32 feature values the way sklearn's trees do (``x <= threshold``) and xgboost's
+do (``x < split`` in float32), and leaf values are accumulated tree by tree in the
+library's order and precision. Predictions therefore match the libraries bit for bit;
+``verify_kernel`` checks that for a model and a feature matrix. Models the kernels do not cover (other estimators,
+non-identity objectives, multi-output) compile to None, and callers keep using
+``model.predict``. ValuationCache compiles its strategy's model on first use, so
+every strategy picks the kernels up without changes.
+"""
+
+import json
+
+import numpy as np
+
+
+class LinearKernel:
+    def __init__(self, coef, intercept):
+        """
+        Args:
+            coef (numpy.ndarray): Coefficients, one per feature
+            intercept (float): Intercept
+        """
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept = float(intercept)
+
+    def predict(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.coef + self.intercept
+
+
+class MLPKernel:
+    _ACTIVATIONS = {
+        "identity": lambda a: a,
+        "relu": lambda a: np.maximum(a, 0, out=a),
+        "tanh": lambda a: np.tanh(a, out=a),
+        "logistic": lambda a: np.divide(1.0, 1.0 + np.exp(-a, out=a), out=a),
+    }
+
+    def __init__(self, coefs, intercepts, activation):
+        """
+        Args:
+            coefs (list): Weight matrix per layer
+            intercepts (list): Bias vector per layer
+            activation (str): Hidden layer activation name, as in MLPRegressor
+        """
+        self.coefs = [np.ascontiguousarray(w, dtype=np.float64) for w in coefs]
+        self.intercepts = [np.ascontiguousarray(b, dtype=np.float64) for b in intercepts]
+        self.activation = self._ACTIVATIONS[activation]
+
+    def predict(self, X):
+        a = np.asarray(X, dtype=np.float64)
+        last = len(self.coefs) - 1
+        for i, (w, b) in enumerate(zip(self.coefs, self.intercepts)):
+            a = a @ w
+            a += b
+            if i != last:
+                a = self.activation(a)
+        return a.ravel()
+
+
+class ForestKernel:
+    # Levels between passes that drop walkers already at a leaf
+    COMPACT_EVERY = 8
+
+    def __init__(self, trees, threshold_dtype, strict, value_dtype, base=0.0, divisor=1.0):
+        """
+        Pack trees into shared node arrays.
+
+        Args:
+            trees (list): Per tree, a dict of equal-length node arrays: ``feature``,
+                ``threshold``, ``left``, ``right`` (-1 at leaves), ``value`` and
+                ``default_left`` (where missing values go)
+            threshold_dtype: dtype thresholds are compared in
+            strict (bool): Go left on ``x < threshold`` rather than ``x <= threshold``
+            value_dtype: dtype leaf values are accumulated in
+            base (float): Starting value of the accumulation
+            divisor (float): The sum is divided by it (the tree count for an average)
+        """
+        sizes = [len(tree["feature"]) for tree in trees]
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.intp)
+        n = int(sum(sizes))
+        self.roots = offsets
+        self.feature = np.zeros(n, dtype=np.intp)
+        self.threshold = np.full(n, np.inf, dtype=threshold_dtype)
+        # children[2 * node + go_right]; leaves are their own children
+        self.children = np.repeat(np.arange(n, dtype=np.intp), 2)
+        self.value = np.empty(n, dtype=value_dtype)
+        self.default_left = np.zeros(n, dtype=bool)
+        depth = 0
+        for offset, tree in zip(offsets, trees):
+            nodes = slice(offset, offset + len(tree["feature"]))
+            split = np.asarray(tree["left"]) != -1
+            idx = np.flatnonzero(split)
+            self.feature[nodes][idx] = np.asarray(tree["feature"])[idx]
+            self.threshold[nodes][idx] = np.asarray(tree["threshold"])[idx]
+            self.children[2 * (offset + idx)] = np.asarray(tree["left"])[idx] + offset
+            self.children[2 * (offset + idx) + 1] = np.asarray(tree["right"])[idx] + offset
+            self.value[nodes] = tree["value"]
+            self.default_left[nodes] = tree["default_left"]
+            depth = max(depth, self._depth(tree["left"], tree["right"]))
+        self.depth = depth
+        self.strict = strict
+        self.base = value_dtype(base)
+        self.divisor = divisor
+
+    @staticmethod
+    def _depth(left, right):
+        depth, level = 0, [0]
+        while True:
+            level = [c for node in level if left[node] != -1 for c in (left[node], right[node])]
+            if not level:
+                return depth
+            depth += 1
+
+    def leaves(self, X):
+        """
+        Leaf reached in every tree by every row.
+
+        Returns:
+            numpy.ndarray: Packed node indices, shape (n_trees, n_rows)
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n, width = X.shape
+        flat = X.ravel()
+        # One walker per (tree, row), flattened tree-major
+        node = np.repeat(self.roots, n)
+        row_start = np.tile(np.arange(n, dtype=np.intp) * width, len(self.roots))
+        position = np.arange(len(node))
+        leaves = np.empty(len(node), dtype=np.intp)
+        missing = np.isnan(flat).any()
+        for level in range(1, self.depth + 1):
+            x = flat[row_start + self.feature[node]]
+            threshold = self.threshold[node]
+            # NaN compares false either way, so it goes right unless routed below
+            go_right = ~(x < threshold) if self.strict else ~(x <= threshold)
+            if missing:
+                go_right = np.where(np.isnan(x), ~self.default_left[node], go_right)
+            node = self.children[2 * node + go_right]
+            if level % self.COMPACT_EVERY == 0 and level < self.depth:
+                # Retire walkers that reached a leaf; trees are rarely balanced
+                walking = self.children[2 * node] != node
+                if not walking.all():
+                    leaves[position[~walking]] = node[~walking]
+                    node, row_start, position = node[walking], row_start[walking], position[walking]
+        leaves[position] = node
+        return leaves.reshape(len(self.roots), n)
+
+    def predict(self, X):
+        values = self.value[self.leaves(X)]
+        values[0] += self.base
+        # A running sum adds tree by tree, in the libraries' order, whatever the shape
+        out = np.cumsum(values, axis=0, dtype=values.dtype)[-1]
+        if self.divisor != 1.0:
+            out /= self.divisor
+        return out
+
+
+def _sklearn_forest(model):
+    trees = []
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        if tree.n_outputs != 1:
+            return None
+        missing_left = getattr(tree, "missing_go_to_left", None)
+        trees.append({
+            "feature": tree.feature,
+            "threshold": tree.threshold,
+            "left": tree.children_left,
+            "right": tree.children_right,
+            "value": tree.value[:, 0, 0],
+            "default_left": np.zeros(tree.node_count, bool) if missing_left is None else missing_left.astype(bool),
+        })
+    # sklearn trees compare float32 features against float64 thresholds, and the
+    # forest sums float64 leaf values tree by tree before dividing by the tree count
+    return ForestKernel(trees, np.float64, strict=False, value_dtype=np.float64,
+                        divisor=float(len(model.estimators_)))
+
+
+def _xgboost(model):
+    booster = model.get_booster()
+    learner = json.loads(booster.save_raw("json"))["learner"]
+    params = learner["learner_model_param"]
+    gbtree = learner["gradient_booster"]
+    if (learner["objective"]["name"] != "reg:squarederror" or gbtree["name"] != "gbtree"
+            or int(params.get("num_target", 1)) > 1 or int(params.get("num_class", 0)) > 0):
+        return None
+    trees = gbtree["model"]["trees"]
+    best = getattr(model, "best_iteration", None)
+    if best is not None:
+        # XGBRegressor.predict stops at the early-stopping iteration
+        trees = trees[:gbtree["model"]["iteration_indptr"][best + 1]]
+    packed = []
+    for tree in trees:
+        if any(tree["split_type"]):
+            return None  # categorical splits
+        left = np.asarray(tree["left_children"])
+        packed.append({
+            "feature": tree["split_indices"],
+            "threshold": tree["split_conditions"],
+            "left": left,
+            "right": tree["right_children"],
+            # Leaves keep their value in split_conditions
+            "value": tree["split_conditions"],
+            "default_left": np.asarray(tree["default_left"], dtype=bool),
+        })
+    # xgboost compares and accumulates in float32, starting from the base score
+    base = float(np.float32(params["base_score"].strip("[]")))
+    return ForestKernel(packed, np.float32, strict=True, value_dtype=np.float32, base=base)
+
+
+def compile_model(model):
+    """
+    Export a fitted model to a NumPy inference kernel.
+
+    Args:
+        model: Fitted LinearRegression, BayesianRidge (or any linear model exposing
+            ``coef_`` and ``intercept_``), MLPRegressor, RandomForestRegressor or
+            XGBRegressor
+
+    Returns:
+        Kernel with ``predict(X)``, or None if the model is not supported
+    """
+    name = type(model).__name__
+    try:
+        if name == "XGBRegressor":
+            return _xgboost(model)
+        if name == "RandomForestRegressor":
+            return _sklearn_forest(model)
+        if name == "MLPRegressor":
+            if model.out_activation_ != "identity":
+                return None
+            return MLPKernel(model.coefs_, model.intercepts_, model.activation)
+        if name in ("LinearRegression", "BayesianRidge", "Ridge", "ARDRegression"):
+            coef = np.asarray(model.coef_)
+            if coef.ndim != 1 or np.ndim(model.intercept_) != 0:
+                return None
+            return LinearKernel(coef, model.intercept_)
+    except (AttributeError, KeyError):
+        # Not fitted, or a library layout the exporter does not know
+        return None
+    return None
+
+
+def verify_kernel(model, X, rtol=1e-6, atol=1e-6):
+    """
+    Compare a model's compiled kernel with ``model.predict`` on a feature matrix.
+
+    Args:
+        model: Fitted model
+        X (numpy.ndarray): Feature matrix to predict on, in batch and row by row
+        rtol (float): Relative tolerance
+        atol (float): Absolute tolerance
+
+    Returns:
+        dict: ``supported``, ``max_abs_diff`` over batch and single-row predictions,
+        ``exact`` (bitwise equal) and ``ok`` (within tolerance)
+    """
+    kernel = compile_model(model)
+    if kernel is None:
+        return {"supported": False, "max_abs_diff": None, "exact": None, "ok": False}
+    X = np.asarray(X, dtype=np.float64)
+    # Libraries may round a single row differently from a batch, so compare like with like
+    expected = np.asarray(model.predict(X), dtype=np.float64).ravel()
+    expected_rows = np.array([float(np.ravel(model.predict(X[i:i + 1]))[0]) for i in range(len(X))])
+    batch = np.asarray(kernel.predict(X), dtype=np.float64)
+    rows = np.array([float(kernel.predict(X[i:i + 1])[0]) for i in range(len(X))])
+    diff = max(np.max(np.abs(batch - expected), initial=0.0), np.max(np.abs(rows - expected_rows), initial=0.0))
+    return {
+        "supported": True,
+        "max_abs_diff": float(diff),
+        "exact": bool(np.array_equal(batch, expected) and np.array_equal(rows, expected_rows)),
+        "ok": bool(np.allclose(batch, expected, rtol=rtol, atol=atol)
+                   and np.allclose(rows, expected_rows, rtol=rtol, atol=atol)),
+    }
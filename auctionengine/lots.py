@@ -0,0 +1,204 @@
+"""
+Lot sources: streams of players for the Dealer, read a chunk at a time.
+
+A Dealer normally receives a materialized player list and shuffles it in place. A
+lot source instead yields the auction order as a sequence of chunks (lists of
+Player views), so only the current chunk is held in memory:
+
+- CsvLotSource: reads the role CSVs with pandas in ``chunk_size`` rows at a time
+  and shuffles through a bounded buffer (an approximate shuffle whose quality
+  grows with ``buffer_size``)
+- CompiledLotSource: opens the compiled datasets (see auctionengine.datacache) as
+  memory maps and walks a seeded permutation of the global row indices, so the
+  order is a true uniform shuffle at the cost of one index array
+
+Every chunk is copied into small PlayerTables of its own (see compact). After its
+lots finish the Dealer drops the chunk and clears it from strategy caches; only
+players bought by a team stay referenced. Peak memory therefore depends on ``chunk_size`` (and the
+shuffle buffer), not on the pool size.
+
+Without a seed, a source draws one when iterated, from the Dealer's lot-order stream
+(see auctionengine.rng) or the ``random`` module, so a streamed auction is exactly
+as reproducible as a list auction.
+"""
+
+import abc
+import os
+import random
+
+import numpy as np
+import pandas as pd
+
+from auctionengine.datacache import load_compiled
+from auctionengine.player_table import PlayerTable
+from auctionengine.utils import DATASET_FILES
+
+
+def dataset_files(dataset_dir="dataset"):
+    """
+    Return the (path, role) pairs of a dataset directory, in load_all_players order.
+
+    Args:
+        dataset_dir (str): Directory containing the per-role CSV files
+
+    Returns:
+        list: (CSV path, role) tuples
+    """
+    return [(os.path.join(dataset_dir, filename), role) for role, filename in DATASET_FILES.items()]
+
+
+def _seed(seed, rng=None):
+    return seed if seed is not None else (rng or random).getrandbits(64)
+
+
+def compact(players):
+    """
+    Copy players into fresh tables, one per role, so they no longer keep their
+    source tables alive.
+
+    Args:
+        players (list): Player views, possibly spread over many tables
+
+    Returns:
+        list: New Player views in the same order
+    """
+    pieces = {}
+    for position, player in enumerate(players):
+        pieces.setdefault(id(player.table), (player.table, [], []))
+        _, rows, positions = pieces[id(player.table)]
+        rows.append(player.row)
+        positions.append(position)
+
+    by_role = {}
+    for table, rows, positions in pieces.values():
+        by_role.setdefault(table.role, []).append((table, np.asarray(rows), positions))
+
+    out = [None] * len(players)
+    for role, parts in by_role.items():
+        def gather(get):
+            return np.concatenate([np.asarray(get(table)[rows]) for table, rows, _ in parts])
+
+        first = parts[0][0]
+        table = PlayerTable(role, gather(lambda t: t.names), gather(lambda t: t.nationalities),
+                            gather(lambda t: t.base_prices),
+                            {key: gather(lambda t, key=key: t.columns[key]) for key in first.columns},
+                            features=gather(lambda t: t.features))
+        positions = [p for _, _, part_positions in parts for p in part_positions]
+        for position, player in zip(positions, table.players()):
+            out[position] = player
+    return out
+
+
+class LotSource(abc.ABC):
+    """
+    Base class for lot sources. Iterating a source yields every player once, chunk
+    by chunk; each iteration starts a new pass with a fresh order.
+    """
+
+    @abc.abstractmethod
+    def chunks(self, rng=None):
+        """
+        Yield the auction order as lists of Player objects.
+
+        Args:
+            rng (random.Random, optional): Draws the shuffle seed when the source has
+                none. Defaults to the random module.
+        """
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+
+class CsvLotSource(LotSource):
+    def __init__(self, files, chunk_size=1024, buffer_size=16384, seed=None):
+        """
+        Stream players straight from CSV files.
+
+        The files are read in parallel, one ``chunk_size`` block from each in turn, and
+        rows pass through a shuffle buffer of ``buffer_size`` players: once the buffer
+        is full, each incoming row evicts a uniformly chosen buffered row into the
+        output. A buffer at least as large as the pool gives a uniform shuffle.
+
+        Args:
+            files (list): (CSV path, role) tuples, e.g. from dataset_files()
+            chunk_size (int): Rows read per CSV block and players per yielded chunk
+            buffer_size (int): Players held in the shuffle buffer
+            seed (int, optional): Seed for the shuffle
+        """
+        self.files = list(files)
+        self.chunk_size = chunk_size
+        self.buffer_size = max(buffer_size, 1)
+        self.seed = seed
+
+    def _blocks(self):
+        """Yield lists of players, one CSV block at a time, alternating between files."""
+        readers = [(pd.read_csv(path, chunksize=self.chunk_size), role) for path, role in self.files]
+        while readers:
+            for reader in list(readers):
+                frame, role = next(reader[0], None), reader[1]
+                if frame is None:
+                    readers.remove(reader)
+                    continue
+                yield PlayerTable.from_frame(frame, role).players()
+
+    def chunks(self, rng=None):
+        rng = random.Random(_seed(self.seed, rng))
+        buffer = []
+        chunk = []
+        since_compact = 0
+        for block in self._blocks():
+            for player in block:
+                if len(buffer) < self.buffer_size:
+                    buffer.append(player)
+                    continue
+                i = rng.randrange(len(buffer))
+                chunk.append(buffer[i])
+                buffer[i] = player
+                if len(chunk) == self.chunk_size:
+                    yield compact(chunk)
+                    chunk = []
+            since_compact += len(block)
+            # Buffered players pin the blocks they came from; regathering them
+            # into one table per role every buffer_size rows lets old blocks go.
+            if since_compact >= self.buffer_size:
+                buffer = compact(buffer)
+                since_compact = 0
+        rng.shuffle(buffer)
+        chunk += buffer
+        for start in range(0, len(chunk), self.chunk_size):
+            yield compact(chunk[start:start + self.chunk_size])
+
+
+class CompiledLotSource(LotSource):
+    def __init__(self, files, chunk_size=1024, seed=None, cache_dir=None):
+        """
+        Stream players from the compiled, memory-mapped copies of CSV files.
+
+        Args:
+            files (list): (CSV path, role) tuples, e.g. from dataset_files()
+            chunk_size (int): Players per yielded chunk
+            seed (int, optional): Seed for the permutation of row indices
+            cache_dir (str, optional): Cache root (see auctionengine.datacache.compiled_dir)
+        """
+        self.files = list(files)
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.cache_dir = cache_dir
+
+    def chunks(self, rng=None):
+        # Memory-mapped: only the rows gathered for a chunk are paged in
+        tables = [load_compiled(path, role, self.cache_dir) for path, role in self.files]
+        offsets = np.cumsum([0] + [len(table) for table in tables])
+        order = np.random.default_rng(_seed(self.seed, rng)).permutation(offsets[-1])
+
+        for start in range(0, len(order), self.chunk_size):
+            rows = order[start:start + self.chunk_size]
+            owner = np.searchsorted(offsets, rows, side="right") - 1
+            chunk = [None] * len(rows)
+            for t in np.unique(owner):
+                positions = np.flatnonzero(owner == t)
+                views = tables[t].take(rows[positions] - offsets[t]).players()
+                for position, player in zip(positions, views):
+                    chunk[position] = player
+            yield chunk
@@ -0,0 +1,125 @@
+"""
+Fixed-point money: amounts as integer lakhs.
+
+Prices and budgets are quoted in crore (Cr) with two decimals, which is a whole
+number of lakhs (1 Cr = 100 lakhs). Inside the engine every amount is an int
+number of lakhs: Team purses, the current bid of a lot, sale prices, the bidder
+index, the fast clearing engine and the array-backed ledgers of the batch engine
+and AuctionState. Adding an increment and comparing a bid with a purse are then
+exact, and a budget that started at 40 Cr is 4000 lakhs again after its purchases
+are refunded, never 39.99999999.
+
+Amounts are converted at the boundaries only:
+
+- configs, command line options and player data give crore, read with ``to_lakhs``;
+- strategies see and return crore (``decide_bid``, ``decide_bids``, ``bid_policy``,
+  ``lot_closed``), because they are written against the published Cr prices and may
+  run out of process. A strategy's bid is read back with ``to_lakhs``, so anything
+  below one lakh is not a raise. ``raise_bid`` and ``raise_bids`` do a strategy's
+  increment in lakhs and return crore on the grid;
+- events, bid logs, reports and ``Team.budget`` give crore through ``to_crore``, and
+  ``Team.can_bid`` and ``Team.add_player`` take crore; the engine uses their
+  ``_lakhs`` variants.
+
+``ledger`` builds an integer array of lakhs for many teams or auctions. int64 is
+the default; int32 holds purses up to about 21 million Cr and halves the memory of
+a large league.
+"""
+
+import numpy as np
+
+LAKHS_PER_CRORE = 100
+
+
+def to_lakhs(crore):
+    """
+    Read an amount in crore as whole lakhs.
+
+    The rule is ``round(crore * 100)``: the float product, rounded to the nearest
+    lakh, with an exact half going to the even lakh. ``raise_bids`` and ``ledger``
+    round with ``np.rint``, which follows the same rule, so scalar and vectorized
+    engines read every amount alike. Two-decimal amounts and sums of them land within
+    far less than half a lakh of their value, so the tie rule only decides for
+    amounts between grid points, e.g. 0.125 reads as 12 lakhs.
+
+    Args:
+        crore (float): Amount in Cr
+
+    Returns:
+        int: Amount in lakhs
+    """
+    return round(crore * LAKHS_PER_CRORE)
+
+
+def to_crore(lakhs):
+    """
+    Amount in lakhs as crore, for strategies, events and reports.
+
+    Args:
+        lakhs (int): Amount in lakhs
+
+    Returns:
+        float: Amount in Cr, the float nearest to the two-decimal value
+    """
+    return lakhs / LAKHS_PER_CRORE
+
+
+def raise_bid(current_bid, step, cap=None):
+    """
+    A strategy's raise, rounded once to whole lakhs.
+
+    Args:
+        current_bid (float): Current bid in Cr
+        step (float): Increment in Cr
+        cap (float, optional): Most the strategy allows itself to bid, in Cr
+
+    Returns:
+        float: New bid in Cr, on the two-decimal grid
+    """
+    # The float sum is off by far less than a lakh, so on-grid amounts add exactly
+    bid = to_lakhs(current_bid + step)
+    if cap is not None:
+        bid = min(bid, to_lakhs(cap))
+    return bid / LAKHS_PER_CRORE
+
+
+def raise_bids(current_bids, steps, caps=None):
+    """
+    Vectorized ``raise_bid`` for strategies' ``decide_bids``.
+
+    Args:
+        current_bids (numpy.ndarray): Current bids in Cr
+        steps (float or numpy.ndarray): Increments in Cr
+        caps (float or numpy.ndarray, optional): Most the strategy allows itself to bid, in Cr
+
+    Returns:
+        numpy.ndarray: New bids in Cr, on the two-decimal grid
+    """
+    bids = np.rint((np.asarray(current_bids) + steps) * LAKHS_PER_CRORE)
+    if caps is not None:
+        bids = np.minimum(bids, np.rint(np.asarray(caps) * LAKHS_PER_CRORE))
+    return bids / LAKHS_PER_CRORE
+
+
+def ledger(crore, shape=None, dtype=np.int64):
+    """
+    Integer array of amounts in lakhs, e.g. the purses of a league.
+
+    Args:
+        crore (float or array-like): Amounts in Cr
+        shape (tuple, optional): Shape to broadcast the amounts to
+        dtype: np.int64, or np.int32 for large leagues with modest purses
+
+    Returns:
+        numpy.ndarray: Amounts in lakhs
+
+    Raises:
+        OverflowError: If an amount does not fit the dtype
+    """
+    lakhs = np.rint(np.asarray(crore, dtype=np.float64) * LAKHS_PER_CRORE)
+    if shape is not None:
+        lakhs = np.broadcast_to(lakhs, shape)
+    info = np.iinfo(dtype)
+    if lakhs.size and (lakhs.min() < info.min or lakhs.max() > info.max):
+        raise OverflowError(f"amounts do not fit {np.dtype(dtype).name} lakhs")
+    return lakhs.astype(dtype)
@@ -1,27 +1,108 @@
 """
 Player class represents a cricket player in the auction system.
+
+Player data lives in a columnar PlayerTable (see auctionengine.player_table); a Player
+is a lightweight view holding only the table and its row index.
 """
 
+class PlayerStats:
+    """
+    Read-only, dict-like view of one player's statistics.
+
+    Only the statistics that apply to the player's role are present, matching the
+    dictionaries the loader used to build per player.
+    """
+
+    __slots__ = ("table", "row")
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, key):
+        if key not in self.table.stat_columns:
+            raise KeyError(key)
+        return self.table.columns[key][self.row].item()
+
+    def get(self, key, default=None):
+        """
+        Return a statistic, or default if the player's role does not record it.
+        """
+        if key not in self.table.stat_columns:
+            return default
+        return self.table.columns[key][self.row].item()
+
+    def __contains__(self, key):
+        return key in self.table.stat_columns
+
+    def __iter__(self):
+        return iter(self.table.stat_columns)
+
+    def __len__(self):
+        return len(self.table.stat_columns)
+
+    def keys(self):
+        return list(self.table.stat_columns)
+
+    def items(self):
+        return [(key, self[key]) for key in self.table.stat_columns]
+
+    def values(self):
+        return [self[key] for key in self.table.stat_columns]
+
+
 class Player:
-    def __init__(self, name, role, age, nationality, stats, base_price, winning_bid):
+    __slots__ = ("table", "row")
+
+    def __init__(self, table, row):
         """
-        Initialize a new Player instance.
+        Initialize a view of one row of a player table.
 
         Args:
-            name (str): Full name of the player
-            role (str): Player's role (e.g., batsman, bowler, all-rounder)
-            age (int): Player's age
-            nationality (str): Player's country of origin
-            stats (dict): Dictionary containing player's performance statistics
-            base_price (float): Starting bid price for the player
+            table (PlayerTable): Table holding the player's data
+            row (int): Row index of the player in the table
         """
-        self.name = name
-        self.role = role
-        self.age = age
-        self.nationality = nationality
-        self.stats = stats
-        self.base_price = base_price
-        self.winning_bid = 0.0
+        self.table = table
+        self.row = row
+
+    @property
+    def name(self):
+        """str: Full name of the player"""
+        return str(self.table.names[self.row])
+
+    @property
+    def role(self):
+        """str: Player's role (e.g., batsman, bowler, allrounder)"""
+        return self.table.role
+
+    @property
+    def age(self):
+        """int: Player's age"""
+        return self.table.columns["age"][self.row].item()
+
+    @property
+    def nationality(self):
+        """str: Player's country of origin"""
+        return str(self.table.nationalities[self.row])
+
+    @property
+    def stats(self):
+        """PlayerStats: Dictionary-like view of the player's performance statistics"""
+        return PlayerStats(self.table, self.row)
+
+    @property
+    def base_price(self):
+        """float: Starting bid price for the player"""
+        return self.table.base_prices[self.row].item()
+
+    @property
+    def winning_bid(self):
+        """float: Price the player was sold for, 0.0 if unsold"""
+        return self.table.winning_bids[self.row].item()
+
+    @winning_bid.setter
+    def winning_bid(self, amount):
+        self.table.winning_bids[self.row] = amount
 
     def __str__(self):
         """
@@ -31,4 +112,3 @@ class Player:
             str: Player's name and role in format 'name - role'
         """
         return f"{self.name} - {self.role}"
-        
\ No newline at end of file
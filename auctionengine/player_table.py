@@ -0,0 +1,179 @@
+"""
+Columnar storage for player data.
+
+A PlayerTable holds every player of one role as typed NumPy arrays, one per statistic,
+plus the feature matrix used by the model-backed strategies. Players handed to the
+Dealer and strategies are lightweight Player views (table, row index) into it, so a
+pool of hundreds of thousands of players costs a few arrays rather than a dict each.
+"""
+
+import numpy as np
+from auctionengine.player import Player
+
+ROLES = ("batsman", "bowler", "allrounder", "wicketkeeper")
+
+# (stat key, CSV column, dtype, default when the column is missing)
+COMMON_STATS = [
+    ("matches", "Matches", np.int64, 0),
+    ("stars", "Stars", np.int64, 0),
+    ("age", "Age", np.int64, 0),
+    ("span", "Span", str, ""),
+]
+
+BATTING_STATS = [
+    ("runs", "Runs", np.int64, 0),
+    ("high_score", "High Score", str, "0"),
+    ("batting_avg", "Average", np.float64, 0.0),
+    ("strike_rate", "Strike Rates", np.float64, 0.0),
+    ("hundreds", "100", np.int64, 0),
+    ("fifties", "50", np.int64, 0),
+    ("fours", "4s", np.int64, 0),
+    ("sixes", "6s", np.int64, 0),
+    ("ducks", "Ducks", np.int64, 0),
+]
+
+BOWLING_STATS = [
+    ("wickets", "Wkts", np.int64, 0),
+    ("economy", "Economy", np.float64, 0.0),
+    ("bowling_avg", "Avg", np.float64, 0.0),
+    ("bowling_sr", "SR", np.float64, 0.0),
+    ("four_wickets", "4", np.int64, 0),
+    ("five_wickets", "5", np.int64, 0),
+]
+
+KEEPING_STATS = [
+    ("catches", "Ct", np.int64, 0),
+    ("stumpings", "St", np.int64, 0),
+]
+
+# Raw model features shared by the ML strategies, with the defaults they assume
+# for roles that do not record a statistic.
+FEATURE_COLUMNS = ("batting_avg", "strike_rate", "economy")
+FEATURE_DEFAULTS = (20.0, 120.0, 8.0)
+
+
+def stat_schema(role):
+    """
+    Return the statistics recorded for a role, in loader order.
+
+    Args:
+        role (str): Player role ('batsman', 'bowler', 'wicketkeeper', 'allrounder')
+
+    Returns:
+        list: (stat key, CSV column, dtype, default) tuples
+    """
+    schema = list(COMMON_STATS)
+    # Batting stats for batsmen, wicketkeepers, and all-rounders
+    if role in ["batsman", "wicketkeeper", "allrounder"]:
+        schema += BATTING_STATS
+    # Bowling stats for bowlers and all-rounders
+    if role in ["bowler", "allrounder"]:
+        schema += BOWLING_STATS
+    # Wicketkeeping stats for wicketkeepers
+    if role == "wicketkeeper":
+        schema += KEEPING_STATS
+    return schema
+
+
+class PlayerTable:
+    def __init__(self, role, names, nationalities, base_prices, columns, features=None):
+        """
+        Initialize a table from per-column arrays.
+
+        Args:
+            role (str): Role shared by every player in the table
+            names (numpy.ndarray): Player names
+            nationalities (numpy.ndarray): Nationality codes
+            base_prices (numpy.ndarray): Base prices in Cr
+            columns (dict): Stat key to array, for every stat in stat_schema(role)
+            features (numpy.ndarray, optional): Precomputed feature matrix, built from
+                the columns when omitted
+        """
+        self.role = role
+        self.role_codes = np.full(len(names), ROLES.index(role), dtype=np.int8)
+        self.names = names
+        self.nationalities = nationalities
+        self.base_prices = base_prices
+        self.columns = columns
+        self.stat_columns = tuple(key for key, _, _, _ in stat_schema(role))
+        if features is None:
+            features = np.column_stack([
+                self.column(key, default) for key, default in zip(FEATURE_COLUMNS, FEATURE_DEFAULTS)
+            ])
+        self.features = features
+        # Auction outcome, written through Player.winning_bid
+        self.winning_bids = np.zeros(len(names), dtype=np.float64)
+        self._players = None
+
+    @classmethod
+    def from_frame(cls, df, role):
+        """
+        Build a table from a DataFrame with the dataset CSV layout.
+
+        Args:
+            df (pandas.DataFrame): Player rows
+            role (str): Role of every player in the frame
+
+        Returns:
+            PlayerTable: Table with one row per DataFrame row
+        """
+        n = len(df)
+        columns = {}
+        for key, source, dtype, default in stat_schema(role):
+            if source not in df.columns:
+                columns[key] = np.full(n, default, dtype=dtype)
+            elif dtype is str:
+                columns[key] = np.asarray(df[source].astype(str), dtype=str)
+            else:
+                columns[key] = df[source].to_numpy(dtype=dtype)
+        names = np.asarray(df["Player"].astype(str), dtype=str)
+        nationalities = (np.asarray(df["Nationality"].astype(str), dtype=str)
+                         if "Nationality" in df.columns else np.full(n, "", dtype=str))
+        base_prices = df["Base Price (Cr)"].to_numpy(dtype=np.float64)
+        return cls(role, names, nationalities, base_prices, columns)
+
+    def __len__(self):
+        return len(self.names)
+
+    def column(self, key, default=0):
+        """
+        Return a stat column, or a constant array of default if the role does not record it.
+        """
+        if key in self.columns:
+            return self.columns[key]
+        return np.full(len(self), default, dtype=np.float64)
+
+    def take(self, rows):
+        """
+        Copy a subset of rows into a new, independent table.
+
+        Args:
+            rows (numpy.ndarray): Row indices to copy, in the order wanted
+
+        Returns:
+            PlayerTable: Table holding only those rows
+        """
+        rows = np.asarray(rows)
+        columns = {key: np.asarray(values[rows]) for key, values in self.columns.items()}
+        return PlayerTable(self.role, np.asarray(self.names[rows]), np.asarray(self.nationalities[rows]),
+                           np.asarray(self.base_prices[rows]), columns,
+                           features=np.asarray(self.features[rows]))
+
+    def __getstate__(self):
+        # Pickle plain arrays (memory maps are copied) without the cached views
+        state = dict(self.__dict__, _players=None)
+        for name in ("names", "nationalities", "base_prices", "features"):
+            state[name] = np.asarray(state[name])
+        state["columns"] = {key: np.asarray(values) for key, values in self.columns.items()}
+        return state
+
+    def players(self):
+        """
+        Return a Player view for every row. The same view objects are returned on every call.
+
+        Returns:
+            list: Player objects in row order
+        """
+        if self._players is None:
+            self._players = [Player(self, row) for row in range(len(self))]
+        return self._players
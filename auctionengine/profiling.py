@@ -0,0 +1,223 @@
+"""
+Hot-path instrumentation for auctions.
+
+An AuctionProfiler records, per strategy, the call count and a latency histogram of
+``decide_bid``, ``estimate_value`` and ``bid_policy``, plus the number of
+``model.predict`` calls and rows scored through its ValuationCache. Per lot it
+records bid rounds (passes over the teams) and accepted increments, and per auction
+the lots per second.
+
+Profiling is off unless ``Dealer(profile=...)`` is given. Timing wrappers are
+installed on the strategy instances only for the duration of a profiled auction, so
+an unprofiled auction runs the plain methods. The summary renders as a text table,
+and ``to_dict``/``dump`` produce a JSON document with sorted keys that can be diffed
+between versions.
+"""
+
+import json
+import time
+
+# Strategy methods timed when present
+TIMED_METHODS = ("decide_bid", "estimate_value", "bid_policy")
+
+
+class LatencyHistogram:
+    """Call latencies in power-of-two nanosecond buckets."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = {}
+
+    def record(self, ns):
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        bucket = ns.bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, q):
+        """Upper bound in ns of the bucket holding the q-th percentile (0-100)."""
+        if not self.count:
+            return 0
+        target = q / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return 1 << bucket
+        return self.max_ns
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns / self.count if self.count else 0.0,
+            "p50_ns": self.percentile(50),
+            "p99_ns": self.percentile(99),
+            "max_ns": self.max_ns,
+            # Keys are the upper bound of each bucket in ns
+            "buckets": {str(1 << b): n for b, n in sorted(self.buckets.items())},
+        }
+
+
+class AuctionProfiler:
+    def __init__(self):
+        """
+        Initialize an empty profile. One profiler can be shared by several auctions.
+        """
+        self.latencies = {}
+        self.predict_calls = {}
+        self.rows_predicted = {}
+        self.lot_rounds = []
+        self.lot_increments = []
+        self.fast_lots = 0
+        self.auctions = []
+        self._installed = []
+        self._predict_start = {}
+        self._auction_start = None
+        self._auction_lots = 0
+
+    def _timed(self, histogram, method):
+        perf_counter_ns = time.perf_counter_ns
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.record(perf_counter_ns() - start)
+        return wrapper
+
+    def instrument(self, strategies):
+        """
+        Install timing wrappers on strategy instances.
+
+        Args:
+            strategies (dict): Team name to strategy mapping, as given to the Dealer
+        """
+        for team_name, strategy in strategies.items():
+            label = f"{team_name} ({type(strategy).__name__})"
+            for name in TIMED_METHODS:
+                method = getattr(strategy, name, None)
+                if method is None:
+                    continue
+                histogram = self.latencies.setdefault(label, {}).setdefault(name, LatencyHistogram())
+                # An instance attribute shadows the class method, including self.method() calls.
+                setattr(strategy, name, self._timed(histogram, method))
+                self._installed.append((strategy, name))
+            cache = getattr(strategy, "valuations", None)
+            if cache is not None:
+                self._predict_start[label] = (cache, cache.predict_calls, cache.rows_predicted)
+
+    def uninstrument(self):
+        """
+        Remove the timing wrappers and collect predict counters.
+        """
+        for strategy, name in self._installed:
+            strategy.__dict__.pop(name, None)
+        self._installed = []
+        for label, (cache, calls, rows) in self._predict_start.items():
+            self.predict_calls[label] = self.predict_calls.get(label, 0) + cache.predict_calls - calls
+            self.rows_predicted[label] = self.rows_predicted.get(label, 0) + cache.rows_predicted - rows
+        self._predict_start = {}
+
+    def auction_started(self):
+        self._auction_start = time.perf_counter()
+        self._auction_lots = 0
+
+    def auction_finished(self):
+        seconds = time.perf_counter() - self._auction_start
+        self.auctions.append({
+            "lots": self._auction_lots,
+            "seconds": seconds,
+            "lots_per_second": self._auction_lots / seconds if seconds > 0 else 0.0,
+        })
+
+    def record_lot(self, rounds, increments):
+        """
+        Record a lot resolved by the bid loop.
+
+        Args:
+            rounds (int): Passes over the teams, including the final pass without a raise
+            increments (int): Accepted raises
+        """
+        self._auction_lots += 1
+        self.lot_rounds.append(rounds)
+        self.lot_increments.append(increments)
+
+    def record_fast_lot(self):
+        """Record a lot resolved by the fast clearing engine."""
+        self._auction_lots += 1
+        self.fast_lots += 1
+
+    def to_dict(self):
+        """
+        Return the profile as plain data.
+
+        Returns:
+            dict: strategies, lots and auctions sections
+        """
+        def spread(values):
+            if not values:
+                return {"count": 0, "mean": 0.0, "max": 0}
+            return {"count": len(values), "mean": sum(values) / len(values), "max": max(values)}
+
+        return {
+            "strategies": {
+                label: {
+                    "methods": {name: h.to_dict() for name, h in methods.items()},
+                    # None for strategies without a ValuationCache
+                    "predict_calls": self.predict_calls.get(label),
+                    "rows_predicted": self.rows_predicted.get(label),
+                }
+                for label, methods in self.latencies.items()
+            },
+            "lots": {
+                "loop_lots": len(self.lot_rounds),
+                "fast_lots": self.fast_lots,
+                "rounds": spread(self.lot_rounds),
+                "increments": spread(self.lot_increments),
+            },
+            "auctions": self.auctions,
+        }
+
+    def dump(self, path):
+        """
+        Write the profile as JSON with sorted keys.
+
+        Args:
+            path (str): Output file
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+
+    def summary_table(self):
+        """
+        Render the profile as a text table.
+
+        Returns:
+            str: Per-strategy latencies followed by lot and auction totals
+        """
+        data = self.to_dict()
+        lines = [f"{'Strategy':<44}{'Method':<16}{'Calls':>9}{'Mean us':>10}{'p99 us':>10}{'Total ms':>10}"]
+        for label, entry in sorted(data["strategies"].items()):
+            for name, h in sorted(entry["methods"].items()):
+                if not h["count"]:
+                    continue
+                lines.append(f"{label:<44}{name:<16}{h['count']:>9}{h['mean_ns'] / 1e3:>10.1f}"
+                             f"{h['p99_ns'] / 1e3:>10.1f}{h['total_ns'] / 1e6:>10.1f}")
+            if entry["predict_calls"] is not None:
+                lines.append(f"{label:<44}{'model.predict':<16}{entry['predict_calls']:>9}"
+                             f"{'':>30}  ({entry['rows_predicted']} rows)")
+        lots = data["lots"]
+        lines.append("")
+        lines.append(f"Lots: {lots['loop_lots']} via bid loop, {lots['fast_lots']} via fast clearing")
+        lines.append(f"Rounds per lot: mean {lots['rounds']['mean']:.2f}, max {lots['rounds']['max']}")
+        lines.append(f"Increments per lot: mean {lots['increments']['mean']:.2f}, max {lots['increments']['max']}")
+        for i, auction in enumerate(data["auctions"]):
+            lines.append(f"Auction {i + 1}: {auction['lots']} lots in {auction['seconds']:.3f}s "
+                         f"({auction['lots_per_second']:.0f} lots/s)")
+        return "\n".join(lines)
@@ -0,0 +1,75 @@
+"""
+Named random streams derived from one root seed.
+
+Without a seed, the Dealer and strategies draw from the global ``random`` and
+``numpy.random`` states, as they always have. Given a root seed, a Dealer instead
+derives independent streams with numpy's SeedSequence: one for its own lot order and
+one per seat for the seat's strategy. A stream is keyed by its name rather than by
+creation order, so adding a team or a draw elsewhere never shifts the numbers any
+other stream sees, and auctions with different root seeds can run in parallel with
+no shared state.
+
+Strategies expose their source of randomness as an ``rng`` attribute: the
+``random`` module (or a random.Random) for strategies calling ``rng.random()``, and
+``numpy.random`` (or a Generator) for those calling ``rng.uniform(...)``.
+``seed_strategy`` swaps in a stream of the same kind.
+"""
+
+import random
+import zlib
+
+import numpy as np
+
+
+class RngStreams:
+    def __init__(self, root_seed):
+        """
+        Args:
+            root_seed (int): Seed every stream is derived from
+        """
+        self.root_seed = root_seed
+
+    def _sequence(self, name):
+        # crc32 is stable across processes, unlike hash()
+        return np.random.SeedSequence(self.root_seed, spawn_key=(zlib.crc32(name.encode()),))
+
+    def numpy(self, name):
+        """
+        Return the numpy Generator for a named stream.
+        """
+        return np.random.Generator(np.random.PCG64(self._sequence(name)))
+
+    def python(self, name):
+        """
+        Return a random.Random for a named stream.
+        """
+        return random.Random(int.from_bytes(self._sequence(name).generate_state(4).tobytes(), "little"))
+
+    def seed(self, name):
+        """
+        Return a 64-bit integer seed for a named stream, for APIs that take a seed.
+        """
+        return int(self._sequence(name).generate_state(1, np.uint64)[0])
+
+
+def seed_strategy(strategy, streams, name):
+    """
+    Give a strategy its own stream, of the kind its ``rng`` attribute already is.
+
+    A strategy draws its randomness from ``rng``, set at construction to the
+    ``random`` or ``numpy.random`` module; a Dealer with a seed replaces it here with
+    a stream of the same kind. Strategies without an ``rng`` attribute are
+    deterministic and left alone.
+
+    Args:
+        strategy: Strategy object
+        streams (RngStreams): Stream source
+        name (str): Stream name, e.g. the team name
+    """
+    current = getattr(strategy, "rng", None)
+    if current is None:
+        return
+    if current is random or isinstance(current, random.Random):
+        strategy.rng = streams.python(name)
+    else:
+        strategy.rng = streams.numpy(name)
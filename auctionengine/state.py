@@ -0,0 +1,249 @@
+"""
+Compact, array-backed auction state for lookahead.
+
+A strategy that wants to ask "what happens to the rest of the auction if I win this
+lot at X" cannot copy the Dealer, its Team objects and every strategy's models for
+each question. An AuctionState holds only what a cheap simulation of the remaining
+lots needs:
+
+- the pool of the current chunk as arrays (base price, stars, role), which never
+  change and are shared by every copy;
+- the lot queue (pool indices in auction order) and the position of the lot on the block;
+- per team: budget in integer lakhs (see auctionengine.money), squad size limit,
+  players bought, stars and players per role;
+- a numpy Generator the simulations draw from.
+
+``snapshot`` and ``restore`` copy the per-team arrays, the position and the generator
+state, which is O(teams x roles) and independent of the pool, so a strategy can apply
+a hypothetical outcome with ``close_lot`` and undo it. Restoring the generator makes
+the next simulation draw the same numbers, so two hypotheses can be compared on
+common random numbers.
+
+``fork(n)`` copies the state into n independent worlds (Rollouts) that play the
+following lots together as (n x teams) arrays. A lot is cleared in one step from a
+willingness-to-pay matrix: the most willing eligible team buys at the second-highest
+willingness, or the base price, which is how an English auction with small
+increments ends. Willingness comes from a RolloutPolicy: a value per player, a
+per-team log price factor and lognormal noise. Rollout prices come from that
+continuous model rather than from bids on the lakh grid, so rollouts keep budgets
+as floats in Cr.
+
+A Dealer keeps a live AuctionState for every strategy with a
+``watch_auction(state, seat)`` method and closes each lot on it as the lot closes.
+"""
+
+import math
+
+import numpy as np
+
+from auctionengine.money import LAKHS_PER_CRORE
+
+
+class LotPool:
+    def __init__(self, players):
+        """
+        Per-player arrays for players in auction order.
+
+        Args:
+            players (list): Player objects
+        """
+        self.players = list(players)
+        self.roles = sorted({p.role for p in self.players})
+        role_index = {role: i for i, role in enumerate(self.roles)}
+        self.base_price = np.array([p.base_price for p in self.players], dtype=np.float64)
+        self.stars = np.array([p.stats.get('stars', 0) for p in self.players], dtype=np.float64)
+        self.role = np.array([role_index[p.role] for p in self.players], dtype=np.intp)
+
+    def __len__(self):
+        return len(self.players)
+
+
+class AuctionState:
+    def __init__(self, pool, budgets, max_players, counts=None, stars=None, role_counts=None, rng=None):
+        """
+        Args:
+            pool (LotPool): Players still to be auctioned, in order
+            budgets (array-like): Remaining budget per team in lakhs
+            max_players (array-like): Squad size limit per team
+            counts (array-like, optional): Players bought per team
+            stars (array-like, optional): Stars collected per team
+            role_counts (array-like, optional): Players bought per team and pool role
+            rng (numpy.random.Generator, optional): Stream simulations draw from
+        """
+        n = len(budgets)
+        self.pool = pool
+        self.queue = np.arange(len(pool), dtype=np.intp)
+        self.position = 0
+        self.budgets = np.array(budgets, dtype=np.int64)
+        self.max_players = np.array(max_players, dtype=np.int64)
+        self.counts = np.zeros(n, np.int64) if counts is None else np.array(counts, dtype=np.int64)
+        self.stars = np.zeros(n) if stars is None else np.array(stars, dtype=np.float64)
+        self.role_counts = (np.zeros((n, len(pool.roles)), np.int64) if role_counts is None
+                            else np.array(role_counts, dtype=np.int64))
+        self.rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng()
+        # (pool index, seat or None, price) of the last lot closed
+        self.last_sale = None
+
+    @classmethod
+    def from_teams(cls, teams, players, rng=None):
+        """
+        State of live teams about to auction ``players`` in order.
+
+        Args:
+            teams (list): Team objects in seat order
+            players (list): Player objects still to be auctioned, in order
+            rng (numpy.random.Generator, optional): Stream simulations draw from;
+                anything else (e.g. the numpy.random module) gets a fresh Generator
+        """
+        pool = LotPool(players)
+        roles = pool.roles
+        return cls(pool,
+                   budgets=[team.purse for team in teams],
+                   max_players=[team.max_players for team in teams],
+                   counts=[len(team.players) for team in teams],
+                   stars=[team.total_stars for team in teams],
+                   role_counts=[[team.role_counts.get(role, 0) for role in roles] for team in teams],
+                   rng=rng)
+
+    @property
+    def lot(self):
+        """Pool index of the lot on the block, or None once the queue is done."""
+        return int(self.queue[self.position]) if self.position < len(self.queue) else None
+
+    def remaining(self):
+        """Pool indices of the lots not yet closed, the one on the block first."""
+        return self.queue[self.position:]
+
+    def close_lot(self, seat, price):
+        """
+        Close the lot on the block and move to the next. The sale is kept in ``last_sale``.
+
+        Args:
+            seat (int): Buying team, or None if the lot went unsold
+            price (int): Sale price in lakhs
+        """
+        i = int(self.queue[self.position])
+        self.last_sale = (i, seat, price)
+        if seat is not None:
+            self.budgets[seat] -= price
+            self.counts[seat] += 1
+            self.stars[seat] += self.pool.stars[i]
+            self.role_counts[seat, self.pool.role[i]] += 1
+        self.position += 1
+
+    def snapshot(self):
+        """
+        Capture the mutable state: per-team arrays, position and generator state.
+
+        Returns:
+            tuple: Opaque snapshot for ``restore``
+        """
+        return (self.budgets.copy(), self.counts.copy(), self.stars.copy(), self.role_counts.copy(),
+                self.position, self.rng.bit_generator.state)
+
+    def restore(self, snapshot, rng=True):
+        """
+        Return to a snapshot.
+
+        Args:
+            snapshot (tuple): From ``snapshot``
+            rng (bool): Also rewind the generator, so the next simulation repeats the
+                draws made since the snapshot
+        """
+        budgets, counts, stars, role_counts, position, rng_state = snapshot
+        np.copyto(self.budgets, budgets)
+        np.copyto(self.counts, counts)
+        np.copyto(self.stars, stars)
+        np.copyto(self.role_counts, role_counts)
+        self.position = position
+        if rng:
+            self.rng.bit_generator.state = rng_state
+
+    def fork(self, n):
+        """
+        Copy the state into ``n`` worlds for rollouts.
+
+        Returns:
+            Rollouts
+        """
+        return Rollouts(self, n)
+
+
+class RolloutPolicy:
+    def __init__(self, values, log_factors, noise=0.25):
+        """
+        Cheap bidding policy for every team in a rollout.
+
+        Team t is willing to pay ``values[i] * exp(log_factors[t] + noise * z)`` for
+        pool player i, with z standard normal per world, team and lot, capped by its budget.
+
+        Args:
+            values (numpy.ndarray): Value per pool player in Cr
+            log_factors (numpy.ndarray): Log price factor per team
+            noise (float): Standard deviation of the log willingness
+        """
+        self.values = np.asarray(values, dtype=np.float64)
+        self.log_factors = np.asarray(log_factors, dtype=np.float64)
+        self.noise = noise
+
+
+class Rollouts:
+    def __init__(self, state, n):
+        """
+        ``n`` copies of a state's teams, advancing together. Use AuctionState.fork.
+        """
+        self.state = state
+        self.n = n
+        self.position = state.position
+        self.budgets = np.tile(state.budgets / LAKHS_PER_CRORE, (n, 1))
+        self.counts = np.tile(state.counts, (n, 1))
+        self.stars = np.tile(state.stars, (n, 1))
+
+    def play(self, policy, lots=None):
+        """
+        Clear the next lots in every world with a policy.
+
+        Args:
+            policy (RolloutPolicy): Willingness to pay of every team
+            lots (int, optional): Number of lots to play; defaults to the rest of the queue
+        """
+        state = self.state
+        pool = state.pool
+        end = len(state.queue) if lots is None else min(len(state.queue), self.position + lots)
+        rows = np.arange(self.n)
+        room = self.counts < state.max_players
+        for position in range(self.position, end):
+            i = state.queue[position]
+            base = pool.base_price[i]
+            z = state.rng.standard_normal(self.budgets.shape)
+            willing = np.minimum(policy.values[i] * np.exp(policy.log_factors + policy.noise * z), self.budgets)
+            willing = np.where(room & (willing >= base), willing, -np.inf)
+            winner = willing.argmax(axis=1)
+            best = willing[rows, winner]
+            willing[rows, winner] = -np.inf
+            # The most willing team buys once the runner-up drops out, or at the base price
+            price = np.maximum(willing.max(axis=1), base)
+            sold = np.isfinite(best)
+            worlds, winners = rows[sold], winner[sold]
+            self.budgets[worlds, winners] -= price[sold]
+            self.counts[worlds, winners] += 1
+            self.stars[worlds, winners] += pool.stars[i]
+            room[worlds, winners] = self.counts[worlds, winners] < state.max_players[winners]
+        self.position = end
+
+    def terminal_value(self, seat, policy):
+        """
+        Stars a seat can still expect from the lots after the rollout ended, per world.
+
+        The seat's leftover budget buys stars at the rest of the queue's stars per Cr of
+        policy value, limited by its open squad slots at the rest's mean stars.
+        """
+        state = self.state
+        rest = state.queue[self.position:]
+        if len(rest) == 0:
+            return np.zeros(self.n)
+        stars = state.pool.stars[rest]
+        cost = policy.values[rest] * math.exp(float(np.mean(policy.log_factors)))
+        rate = stars.sum() / max(cost.sum(), 1e-9)
+        slots = state.max_players[seat] - self.counts[:, seat]
+        return np.minimum(self.budgets[:, seat] * rate, slots * stars.mean())
@@ -0,0 +1,706 @@
+"""
+Out-of-process strategy hosting over a compact binary protocol.
+
+Strategies normally run inside the Dealer's process, where a heavy model holds the
+GIL while everything else waits. A strategy host is a separate worker process that
+loads strategy classes from ``strategies/`` and answers bid requests. A
+StrategyHostPool starts one or more hosts and connects to them over
+multiprocessing pipes or Unix domain sockets; RemoteStrategy and AsyncRemoteStrategy
+are drop-in strategy objects for the Dealer and AsyncDealer that forward
+``decide_bid`` and the lifecycle hooks to the pool.
+
+The in-process path is unchanged and remains the default: nothing here is used
+unless a remote strategy is handed to a dealer.
+
+Protocol
+--------
+Every frame is a 5-byte header, ``struct("<BI")`` of (opcode, handle), followed by
+a payload. Over Unix sockets frames carry a 4-byte little-endian length prefix;
+pipes frame messages themselves. Hot-path payloads are raw NumPy record arrays:
+
+- LOAD: JSON ``{"spec": "module:Class", "kwargs": {...}, "seed": int}``;
+  the reply's handle identifies the loaded strategy instance and its JSON payload
+  lists the hooks the instance has and the kind of its ``rng``
+- TABLE: pickled PlayerTable under a client-chosen table id; sent once per table,
+  after which players travel as (table id, row) pairs
+- RELEASE: ``[table u4]`` ids of tables the client no longer uses; the host drops
+  them and their players' cached valuations
+- BEGIN: ``[(table u4, row u4)]`` players about to be auctioned
+- DECIDE: ``[(table u4, row u4, bid f8)]`` bid requests; the reply is RESULT with
+  one f8 bid per request
+- NEW_AUCTION: no payload, calls ``new_auction``
+- SEED: a pickled random.Random or numpy Generator that becomes the strategy's ``rng``
+- WATCH: pickled arrays of an AuctionState and the seat; the host builds its own
+  copy of the state and passes it to ``watch_auction``
+- LOT_CLOSED: ``[(table u4, row u4, price f8, won u1, seat i4, lakhs i8)]``; the
+  sale (seat -1 if unsold) closes the lot on the host's state before ``lot_closed``
+- OK / RESULT / ERROR replies; ERROR carries a UTF-8 traceback
+
+A DECIDE frame may carry requests from many auctions. The host scores all of its
+players through the strategy's ValuationCache in one ``model.predict`` call before
+answering them, and AsyncRemoteStrategy coalesces every request issued in the same
+event loop iteration, e.g. by several AsyncDealers sharing a loop, into one frame.
+
+Each RemoteStrategy is loaded once, on a host picked round robin, and every call it
+makes goes to that one instance over one of that host's connections, so state kept
+between calls is never split. The proxy offers the Dealer exactly the hooks the
+hosted class has, and has an ``rng`` attribute when the hosted strategy does:
+``seed_strategy`` assigning a seat's stream to it sends the stream to the host, so a
+hosted strategy plays a seeded auction exactly like an in-process one. A strategy's
+global ``random`` draws still happen in the host process, seeded from LOAD.
+
+The pool holds its tables weakly. A table the client process has dropped, or whose
+chunk of lots the Dealer has released (``release_players``), is released on every
+host that has it the next time a connection to that host is used.
+
+Hosts are started with the "spawn" method, so scripts that create a pool must do so
+under an ``if __name__ == "__main__":`` guard.
+"""
+
+import asyncio
+import collections
+import contextlib
+import importlib
+import itertools
+import json
+import os
+import pickle
+import queue
+import socket
+import struct
+import tempfile
+import threading
+import traceback
+import weakref
+import multiprocessing as mp
+import random
+
+import numpy as np
+
+from auctionengine.dealer import Dealer
+from auctionengine.events import NullSink
+from auctionengine.state import AuctionState, LotPool
+from auctionengine.team import Team
+
+HEADER = struct.Struct("<BI")
+LENGTH = struct.Struct("<I")
+
+OP_LOAD, OP_TABLE, OP_BEGIN, OP_DECIDE, OP_CLOSE, OP_OK, OP_RESULT, OP_ERROR = range(1, 9)
+OP_NEW_AUCTION, OP_SEED, OP_WATCH, OP_LOT_CLOSED, OP_RELEASE = range(9, 14)
+
+PLAYER_REF = np.dtype([("table", "<u4"), ("row", "<u4")])
+BID_REQUEST = np.dtype([("table", "<u4"), ("row", "<u4"), ("bid", "<f8")])
+LOT_CLOSED = np.dtype([("table", "<u4"), ("row", "<u4"), ("price", "<f8"), ("won", "u1"), ("seat", "<i4"),
+                       ("lakhs", "<i8")])
+
+# Optional strategy methods the Dealer looks for, forwarded when the hosted class has them
+HOOKS = ("new_auction", "begin_auction", "watch_auction", "lot_closed")
+
+TRANSPORTS = ("pipe", "unix")
+
+
+class StrategyHostError(RuntimeError):
+    """A strategy host reported an error or went away."""
+
+
+def load_class(spec):
+    """
+    Import a class from a "module:Class" spec.
+
+    Args:
+        spec (str): e.g. "strategies.random_forest:RandomForestBiddingStrategy"
+
+    Returns:
+        type: The class
+    """
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+class _PipeChannel:
+    """Frames over a multiprocessing Connection, which delimits messages itself."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def send(self, op, handle, payload=b""):
+        self.conn.send_bytes(HEADER.pack(op, handle) + payload)
+
+    def recv(self):
+        data = self.conn.recv_bytes()
+        op, handle = HEADER.unpack_from(data)
+        return op, handle, data[HEADER.size:]
+
+    def close(self):
+        self.conn.close()
+
+
+class _SocketChannel:
+    """Length-prefixed frames over a stream socket."""
+
+    def __init__(self, sock):
+        self.sock = sock
+
+    def send(self, op, handle, payload=b""):
+        header = HEADER.pack(op, handle)
+        self.sock.sendall(LENGTH.pack(len(header) + len(payload)) + header + payload)
+
+    def _read(self, n):
+        buf = bytearray(n)
+        view = memoryview(buf)
+        while n:
+            got = self.sock.recv_into(view[-n:], n)
+            if not got:
+                raise EOFError("strategy host connection closed")
+            n -= got
+        return bytes(buf)
+
+    def recv(self):
+        (length,) = LENGTH.unpack(self._read(LENGTH.size))
+        data = self._read(length)
+        op, handle = HEADER.unpack_from(data)
+        return op, handle, data[HEADER.size:]
+
+    def close(self):
+        self.sock.close()
+
+
+class _Host:
+    """Strategy instances and player tables served by one host process."""
+
+    def __init__(self):
+        self.strategies = []
+        # One lock per strategy, since several connections may share a host
+        self.locks = []
+        # handle -> the host's copy of the AuctionState given to watch_auction
+        self.states = {}
+        self.tables = {}
+        self.lock = threading.Lock()
+
+    def _players(self, refs):
+        return [self.tables[t].players()[r] for t, r in zip(refs["table"].tolist(), refs["row"].tolist())]
+
+    def handle(self, op, handle, payload):
+        """Answer one request with an (opcode, handle, payload) reply."""
+        if op == OP_LOAD:
+            message = json.loads(payload)
+            if message.get("seed") is not None:
+                random.seed(message["seed"])
+                np.random.seed(message["seed"] % 2**32)
+            strategy = load_class(message["spec"])(**message.get("kwargs", {}))
+            rng = getattr(strategy, "rng", None)
+            reply = json.dumps({
+                "hooks": [hook for hook in HOOKS if hasattr(strategy, hook)],
+                "rng": None if rng is None else "python" if rng is random or isinstance(rng, random.Random)
+                else "numpy",
+            }).encode()
+            with self.lock:
+                self.strategies.append(strategy)
+                self.locks.append(threading.Lock())
+                return OP_OK, len(self.strategies) - 1, reply
+        if op == OP_TABLE:
+            self.tables[handle] = pickle.loads(payload)
+            return OP_OK, handle, b""
+        if op == OP_RELEASE:
+            self._release(np.frombuffer(payload, "<u4").tolist())
+            return OP_OK, handle, b""
+
+        with self.locks[handle]:
+            return self._call(self.strategies[handle], op, handle, payload)
+
+    def _release(self, table_ids):
+        players = [player for t in table_ids if t in self.tables for player in self.tables.pop(t).players()]
+        if not players:
+            return
+        with self.lock:
+            hosted = list(zip(self.strategies, self.locks))
+        for strategy, lock in hosted:
+            cache = getattr(strategy, "valuations", None)
+            if cache is not None:
+                with lock:
+                    cache.invalidate(players)
+
+    def _call(self, strategy, op, handle, payload):
+        if op == OP_DECIDE:
+            requests = np.frombuffer(payload, BID_REQUEST)
+            players = self._players(requests)
+            cache = getattr(strategy, "valuations", None)
+            if cache is not None:
+                # One predict call for every player in the batch not yet scored
+                cache.warm(players)
+            bids = np.array([strategy.decide_bid(p, b) for p, b in zip(players, requests["bid"].tolist())],
+                            dtype="<f8")
+            return OP_RESULT, handle, bids.tobytes()
+        if op == OP_LOT_CLOSED:
+            sale = np.frombuffer(payload, LOT_CLOSED)
+            state = self.states.get(handle)
+            if state is not None:
+                seat = int(sale["seat"][0])
+                state.close_lot(seat if seat >= 0 else None, int(sale["lakhs"][0]))
+            if hasattr(strategy, "lot_closed"):
+                strategy.lot_closed(self._players(sale)[0], float(sale["price"][0]), bool(sale["won"][0]))
+            return OP_OK, handle, b""
+        if op == OP_BEGIN:
+            if hasattr(strategy, "begin_auction"):
+                strategy.begin_auction(self._players(np.frombuffer(payload, PLAYER_REF)))
+            return OP_OK, handle, b""
+        if op == OP_WATCH:
+            message = pickle.loads(payload)
+            seat = message.pop("seat")
+            pool = LotPool(self._players(message.pop("players")))
+            state = AuctionState(pool, rng=getattr(strategy, "rng", None), **message)
+            self.states[handle] = state
+            strategy.watch_auction(state, seat)
+            return OP_OK, handle, b""
+        if op == OP_NEW_AUCTION:
+            self.states.pop(handle, None)
+            if hasattr(strategy, "new_auction"):
+                strategy.new_auction()
+            return OP_OK, handle, b""
+        if op == OP_SEED:
+            strategy.rng = pickle.loads(payload)
+            return OP_OK, handle, b""
+        raise ValueError(f"unknown opcode {op}")
+
+    def serve(self, channel):
+        """Answer requests on a channel until it closes."""
+        try:
+            while True:
+                try:
+                    op, handle, payload = channel.recv()
+                except (EOFError, OSError):
+                    return
+                if op == OP_CLOSE:
+                    return
+                try:
+                    reply = self.handle(op, handle, payload)
+                except Exception:
+                    reply = (OP_ERROR, handle, traceback.format_exc().encode())
+                channel.send(*reply)
+        finally:
+            channel.close()
+
+
+def serve_pipe(conn):
+    """Entry point of a pipe-connected host process."""
+    _Host().serve(_PipeChannel(conn))
+
+
+def serve_unix(path, ready=None):
+    """
+    Entry point of a socket-connected host process, serving every connection on its
+    own thread until the process is terminated.
+
+    Args:
+        path (str): Unix socket path to listen on
+        ready (multiprocessing.Event, optional): Set once the socket is listening
+    """
+    host = _Host()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    if ready is not None:
+        ready.set()
+    while True:
+        sock, _ = server.accept()
+        threading.Thread(target=host.serve, args=(_SocketChannel(sock),), daemon=True).start()
+
+
+class HostConnection:
+    """
+    Client end of one channel to a host. Tracks which tables the host behind it
+    already knows, and which of them were released since the connection was last used.
+    """
+
+    def __init__(self, channel, host_index):
+        self.channel = channel
+        self.host_index = host_index
+        self.tables = set()
+        # Appended to from any thread, including garbage collection finalizers
+        self.released = collections.deque()
+
+    def send_released(self):
+        """Tell the host to drop the tables released since the last call."""
+        table_ids = set()
+        while self.released:
+            table_ids.add(self.released.popleft())
+        table_ids &= self.tables
+        if table_ids:
+            self.tables -= table_ids
+            self.call(OP_RELEASE, 0, np.array(sorted(table_ids), dtype="<u4").tobytes())
+
+    def call(self, op, handle, payload=b""):
+        try:
+            self.channel.send(op, handle, payload)
+            reply, handle, payload = self.channel.recv()
+        except (EOFError, OSError) as e:
+            raise StrategyHostError(f"strategy host {self.host_index} is unreachable: {e}") from e
+        if reply == OP_ERROR:
+            raise StrategyHostError(payload.decode())
+        return handle, payload
+
+
+def _release_on(connections, table_id):
+    for conn in connections:
+        if table_id in conn.tables:
+            conn.released.append(table_id)
+
+
+class StrategyHostPool:
+    def __init__(self, workers=1, transport="pipe", connections_per_worker=1):
+        """
+        Start strategy host processes and open pooled connections to them.
+
+        Args:
+            workers (int): Host processes to start
+            transport (str): "pipe" (one connection per host) or "unix" (Unix domain
+                sockets, ``connections_per_worker`` connections per host)
+            connections_per_worker (int): Connections per host with the "unix" transport
+        """
+        if transport not in TRANSPORTS:
+            raise ValueError(f"transport must be one of {TRANSPORTS}, got {transport!r}")
+        context = mp.get_context("spawn")
+        self.processes = []
+        # Idle connections per host
+        self._idle = []
+        self._next_host = 0
+        self._connections = []
+        # Weakly keyed, so the pool never keeps a table alive
+        self._table_ids = weakref.WeakKeyDictionary()
+        self._table_counter = itertools.count()
+        self._lock = threading.Lock()
+        self._socket_dir = tempfile.mkdtemp(prefix="strategy-host-") if transport == "unix" else None
+
+        for i in range(workers):
+            if transport == "pipe":
+                parent, child = context.Pipe()
+                process = context.Process(target=serve_pipe, args=(child,), daemon=True)
+                process.start()
+                child.close()
+                channels = [_PipeChannel(parent)]
+            else:
+                path = os.path.join(self._socket_dir, f"host-{i}.sock")
+                ready = context.Event()
+                process = context.Process(target=serve_unix, args=(path, ready), daemon=True)
+                process.start()
+                if not ready.wait(60):
+                    raise StrategyHostError(f"strategy host {i} did not start")
+                channels = []
+                for _ in range(connections_per_worker):
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    sock.connect(path)
+                    channels.append(_SocketChannel(sock))
+            self.processes.append(process)
+            self._idle.append(queue.Queue())
+            for channel in channels:
+                conn = HostConnection(channel, i)
+                self._connections.append(conn)
+                self._idle[i].put(conn)
+
+    def assign(self):
+        """Pick the host a new strategy is loaded on, round robin."""
+        with self._lock:
+            host = self._next_host % len(self.processes)
+            self._next_host += 1
+        return host
+
+    def acquire(self, host):
+        """Take an idle connection to a host, waiting for one if all are busy."""
+        return self._idle[host].get()
+
+    def release(self, conn):
+        self._idle[conn.host_index].put(conn)
+
+    def table_id(self, table):
+        """Return the wire id of a PlayerTable, assigning one on first use."""
+        with self._lock:
+            table_id = self._table_ids.get(table)
+            if table_id is None:
+                table_id = self._table_ids[table] = next(self._table_counter)
+                # Ids are never reused, so a late release of a dead table is harmless
+                weakref.finalize(table, _release_on, self._connections, table_id)
+            return table_id
+
+    def release_tables(self, players):
+        """
+        Release the tables of players whose lots are over, on every host. Players of
+        those tables sent again later travel under a new table id.
+
+        Args:
+            players (list): Players whose tables are no longer needed
+        """
+        tables = {id(player.table): player.table for player in players}
+        with self._lock:
+            table_ids = [self._table_ids.pop(table, None) for table in tables.values()]
+        for table_id in table_ids:
+            if table_id is not None:
+                _release_on(self._connections, table_id)
+
+    def encode_players(self, conn, players, dtype=PLAYER_REF):
+        """
+        Pack players as (table id, row) records, sending unseen tables first.
+        """
+        conn.send_released()
+        records = np.empty(len(players), dtype=dtype)
+        for i, player in enumerate(players):
+            table_id = self.table_id(player.table)
+            if table_id not in conn.tables:
+                conn.call(OP_TABLE, table_id, pickle.dumps(player.table, pickle.HIGHEST_PROTOCOL))
+                conn.tables.add(table_id)
+            records[i]["table"] = table_id
+            records[i]["row"] = player.row
+        return records
+
+    def __len__(self):
+        """Number of pooled connections."""
+        return len(self._connections)
+
+    def close(self):
+        """Ask every host to stop and wait for the processes to exit."""
+        for conn in self._connections:
+            try:
+                conn.channel.send(OP_CLOSE, 0)
+            except OSError:
+                pass
+            conn.channel.close()
+        for process in self.processes:
+            # Socket hosts serve until terminated
+            process.join(1)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        if self._socket_dir:
+            for name in os.listdir(self._socket_dir):
+                os.unlink(os.path.join(self._socket_dir, name))
+            os.rmdir(self._socket_dir)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RemoteStrategy:
+    """
+    Strategy proxy that runs a strategy class inside a StrategyHostPool.
+    """
+
+    def __init__(self, pool, spec, seed=None, **kwargs):
+        """
+        Load the strategy on one of the pool's hosts.
+
+        Args:
+            pool (StrategyHostPool): Hosts to run on
+            spec (str): "module:Class" of the strategy, e.g.
+                "strategies.random_forest:RandomForestBiddingStrategy"
+            seed (int, optional): Seed for random and numpy.random in the host when
+                the strategy is loaded there
+            **kwargs: Constructor arguments of the strategy (JSON-serializable)
+        """
+        self.pool = pool
+        self.spec = spec
+        self.seed = seed
+        self.kwargs = kwargs
+        self.host = pool.assign()
+        self._state = None
+        with self._connection() as conn:
+            self.handle, reply = conn.call(OP_LOAD, 0, json.dumps({"spec": spec, "kwargs": kwargs,
+                                                                   "seed": seed}).encode())
+        reply = json.loads(reply)
+        # A stand-in of the same kind, so seed_strategy knows which stream to assign
+        self._rng = {"python": random, "numpy": np.random}.get(reply["rng"])
+        # The Dealer detects hooks with hasattr, so offer only those the hosted class has
+        hooks = set(reply["hooks"])
+        if "new_auction" in hooks:
+            self.new_auction = self._new_auction
+        if "begin_auction" in hooks:
+            self.begin_auction = self._begin_auction
+        if "watch_auction" in hooks:
+            self.watch_auction = self._watch_auction
+        if hooks & {"lot_closed", "watch_auction"}:
+            # The host's AuctionState is closed through lot_closed too
+            self.lot_closed = self._lot_closed
+
+    @contextlib.contextmanager
+    def _connection(self):
+        conn = self.pool.acquire(self.host)
+        try:
+            yield conn
+        finally:
+            self.pool.release(conn)
+
+    @property
+    def rng(self):
+        """The hosted strategy's source of randomness as last assigned, None if it has none."""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng):
+        # The host continues the stream from the state it has here
+        self._rng = rng
+        with self._connection() as conn:
+            conn.call(OP_SEED, self.handle, pickle.dumps(rng, pickle.HIGHEST_PROTOCOL))
+
+    def decide_many(self, requests):
+        """
+        Ask for many bids in one round trip.
+
+        Args:
+            requests (list): (player, current_bid) pairs, possibly from different auctions
+
+        Returns:
+            list: Bid per request
+        """
+        with self._connection() as conn:
+            records = self.pool.encode_players(conn, [player for player, _ in requests], BID_REQUEST)
+            records["bid"] = [bid for _, bid in requests]
+            _, payload = conn.call(OP_DECIDE, self.handle, records.tobytes())
+        return np.frombuffer(payload, "<f8").tolist()
+
+    def decide_bid(self, player, current_bid):
+        return self.decide_many([(player, current_bid)])[0]
+
+    def _new_auction(self):
+        self._state = None
+        with self._connection() as conn:
+            conn.call(OP_NEW_AUCTION, self.handle)
+
+    def _begin_auction(self, players):
+        with self._connection() as conn:
+            conn.call(OP_BEGIN, self.handle, self.pool.encode_players(conn, players).tobytes())
+
+    def _watch_auction(self, state, seat):
+        # The Dealer closes lots on this state; lot_closed forwards each sale
+        self._state = state
+        with self._connection() as conn:
+            message = {"players": self.pool.encode_players(conn, state.pool.players), "seat": seat,
+                       "budgets": state.budgets, "max_players": state.max_players, "counts": state.counts,
+                       "stars": state.stars, "role_counts": state.role_counts}
+            conn.call(OP_WATCH, self.handle, pickle.dumps(message, pickle.HIGHEST_PROTOCOL))
+
+    def release_players(self, players):
+        """
+        Release the players of a finished chunk of lots from the pool's hosts.
+
+        Args:
+            players (list): Players already auctioned
+        """
+        self.pool.release_tables(players)
+        with self._connection() as conn:
+            conn.send_released()
+
+    def _lot_closed(self, player, price, won):
+        sale = self._state.last_sale if self._state is not None else None
+        with self._connection() as conn:
+            record = self.pool.encode_players(conn, [player], LOT_CLOSED)
+            record["price"] = price
+            record["won"] = won
+            record["seat"] = -1 if sale is None or sale[1] is None else sale[1]
+            record["lakhs"] = 0 if sale is None else sale[2]
+            conn.call(OP_LOT_CLOSED, self.handle, record.tobytes())
+
+
+class AsyncRemoteStrategy(RemoteStrategy):
+    """
+    RemoteStrategy with a coroutine ``decide_bid`` for the AsyncDealer. Requests made
+    in the same event loop iteration are sent to a host as one DECIDE frame.
+    """
+
+    def __init__(self, pool, spec, seed=None, max_batch=4096, **kwargs):
+        """
+        Args:
+            pool, spec, seed, **kwargs: As for RemoteStrategy
+            max_batch (int): Most requests carried by one frame
+        """
+        super().__init__(pool, spec, seed=seed, **kwargs)
+        self.max_batch = max_batch
+        self._pending = []
+
+    async def decide_bid(self, player, current_bid):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._pending:
+            # Flush once everything runnable in this iteration has queued its request
+            loop.call_soon(self._flush)
+        self._pending.append((player, current_bid, future))
+        return await future
+
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        loop = asyncio.get_running_loop()
+        for start in range(0, len(pending), self.max_batch):
+            batch = pending[start:start + self.max_batch]
+            task = loop.run_in_executor(None, self.decide_many, [(p, b) for p, b, _ in batch])
+            task.add_done_callback(lambda task, batch=batch: self._resolve(task, batch))
+
+    @staticmethod
+    def _resolve(task, batch):
+        error = task.exception()
+        for i, (_, _, future) in enumerate(batch):
+            if future.done():
+                # Cancelled, e.g. by a missed deadline
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(task.result()[i])
+
+
+def verify_against_local(players, spec, seed=0, bids=(0.5, 1.0, 2.0, 5.0), transport="pipe", seats=4,
+                         budget=40.0, max_players=11, **kwargs):
+    """
+    Check that a hosted strategy behaves exactly like a local instance.
+
+    First both instances, seeded alike, are asked for the same bids in the same
+    order. Then ``seats`` teams play a seeded Dealer auction of ``players`` twice,
+    once with a local instance per seat and once with a RemoteStrategy per seat, so
+    the lifecycle hooks, watch_auction and the per-seat random streams are covered;
+    the squads and prices must match.
+
+    Args:
+        players (list): Players to ask about and to auction
+        spec (str): "module:Class" of the strategy
+        seed (int): Seed for random and numpy.random on both sides, and of the Dealer
+        bids (tuple): Current bids asked for each player
+        transport (str): Pool transport to check
+        seats (int): Teams in the auction
+        budget (float): Starting budget of every seat
+        max_players (int): Squad size limit of every seat
+        **kwargs: Strategy constructor arguments
+
+    Returns:
+        list: (what, local, remote) for every difference, where ``what`` is
+        (player name, current bid) for a bid request and a team name for the auction
+    """
+    requests = [(player, bid) for player in players for bid in bids]
+
+    def play(strategies):
+        teams = [Team(name=f"Seat {t + 1}", budget=budget, max_players=max_players) for t in range(seats)]
+        dealer = Dealer(players=list(players), teams=teams, strategies={t.name: s for t, s in zip(teams, strategies)},
+                        events=NullSink(), seed=seed)
+        dealer.start_auction()
+        outcome = {team.name: [(p.name, p.winning_bid) for p in team.players] for team in teams}
+        for player in players:
+            player.winning_bid = 0.0
+        return outcome
+
+    with StrategyHostPool(workers=min(seats, 2), transport=transport) as pool:
+        remote = RemoteStrategy(pool, spec, seed=seed, **kwargs)
+        if hasattr(remote, "begin_auction"):
+            remote.begin_auction(players)
+        remote_bids = remote.decide_many(requests)
+        remote_auction = play([RemoteStrategy(pool, spec, seed=seed, **kwargs) for _ in range(seats)])
+
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
+    local = load_class(spec)(**kwargs)
+    if hasattr(local, "begin_auction"):
+        local.begin_auction(players)
+    local_bids = [local.decide_bid(player, bid) for player, bid in requests]
+    local_auction = play([load_class(spec)(**kwargs) for _ in range(seats)])
+
+    differences = [(request, a, b) for request, a, b in zip(requests, local_bids, remote_bids) if a != b]
+    differences = [((player.name, bid), a, b) for (player, bid), a, b in differences]
+    return differences + [(name, local_auction[name], remote_auction[name]) for name in local_auction
+                          if local_auction[name] != remote_auction[name]]
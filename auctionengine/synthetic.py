@@ -0,0 +1,89 @@
+"""
+Deterministic synthetic league generator.
+
+Writes batsmen, bowlers, all-rounders and wicket-keepers CSVs with exactly the
+columns of the shipped dataset, at any scale. Each synthetic player is a real
+player of the same role resampled with multiplicative noise on the counting and
+rate statistics, so value distributions stay realistic. Output depends only on
+the seed and the requested size. Rows are generated and written in chunks, so
+a million-player league does not have to fit in memory at once.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from auctionengine.utils import DATASET_FILES
+
+# Share of the pool per role, matching the shipped dataset
+ROLE_SHARES = {"batsman": 0.38, "bowler": 0.28, "allrounder": 0.16, "wicketkeeper": 0.18}
+
+# Columns that are labels or bounded codes rather than noisy measurements
+_FIXED_COLUMNS = {"Player", "Nationality", "Span", "High Score", "Base Price (Cr)", "Stars", "Age"}
+
+BASE_PRICES = np.array([0.5, 1.0, 1.5, 2.0])
+
+
+def _role_counts(n_players):
+    counts = {role: int(n_players * share) for role, share in ROLE_SHARES.items()}
+    # Hand the rounding remainder to batsmen so the total is exact
+    counts["batsman"] += n_players - sum(counts.values())
+    return counts
+
+
+def _synthesize(template, role, start, count, rng):
+    """Build ``count`` synthetic rows resampled from ``template``."""
+    picks = template.iloc[rng.integers(0, len(template), count)].reset_index(drop=True)
+    out = pd.DataFrame(index=range(count))
+    for column in template.columns:
+        values = picks[column]
+        if column == "Player":
+            out[column] = [f"Synthetic {role.title()} {i:07d}" for i in range(start, start + count)]
+        elif column == "Stars":
+            out[column] = np.clip(values.to_numpy() + rng.integers(-1, 2, count), 1, 10)
+        elif column == "Age":
+            out[column] = np.clip(values.to_numpy() + rng.integers(-3, 4, count), 17, 45)
+        elif column == "Base Price (Cr)":
+            out[column] = rng.choice(BASE_PRICES, count)
+        elif column in _FIXED_COLUMNS or not pd.api.types.is_numeric_dtype(values):
+            out[column] = values.to_numpy()
+        else:
+            noise = rng.lognormal(0.0, 0.15, count)
+            scaled = values.to_numpy(dtype=np.float64) * noise
+            if pd.api.types.is_integer_dtype(values):
+                out[column] = np.rint(scaled).astype(np.int64)
+            else:
+                out[column] = np.round(scaled, 2)
+    return out
+
+
+def generate_league(out_dir, n_players, seed=0, template_dir="dataset", chunk_size=100_000):
+    """
+    Write a synthetic league of ``n_players`` players to ``out_dir``.
+
+    Args:
+        out_dir (str): Directory for the four CSV files (created if missing)
+        n_players (int): Total players across all roles
+        seed (int): Seed; the same seed and size always produce identical files
+        template_dir (str): Directory with the real CSVs used as templates
+        chunk_size (int): Rows generated and written per chunk
+
+    Returns:
+        dict: Role to written CSV path
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {}
+    for role_index, (role, count) in enumerate(_role_counts(n_players).items()):
+        filename = DATASET_FILES[role]
+        template = pd.read_csv(os.path.join(template_dir, filename))
+        # One stream per role so each file is independent of the others' sizes
+        rng = np.random.default_rng([seed, role_index])
+        path = os.path.join(out_dir, filename)
+        with open(path, "w", newline="") as f:
+            f.write(",".join(template.columns) + "\n")
+            for start in range(0, count, chunk_size):
+                chunk = _synthesize(template, role, start, min(chunk_size, count - start), rng)
+                chunk.to_csv(f, header=False, index=False)
+        paths[role] = path
+    return paths
@@ -1,7 +1,10 @@
 """
 Team class represents a team in an auction system with a budget and player management capabilities.
+Money is kept in integer lakhs (see auctionengine.money).
 """
 
+from auctionengine.money import to_crore, to_lakhs
+
 class Team:
     def __init__(self, name, budget, max_players):
         """
@@ -9,25 +12,48 @@ class Team:
         
         Args:
             name (str): Name of the team
-            budget (float): Initial budget for player purchases
+            budget (float): Initial budget for player purchases in Cr
             max_players (int): Maximum number of players allowed in the team
         """
         self.name = name
-        self.budget = budget
+        # Remaining budget in lakhs
+        self.purse = to_lakhs(budget)
         self.max_players = max_players
         self.players = []  # List to store player objects
+        # Running aggregates, maintained by add_player
+        self.total_stars = 0
+        self.role_counts = {}
+        self.spent_by_role = {}  # in lakhs
+        # Objects with a team_changed(team) method, e.g. the Dealer's EligibleBidderIndex
+        self.listeners = []
+
+    @property
+    def budget(self):
+        """float: Remaining budget in Cr"""
+        return to_crore(self.purse)
+
+    @budget.setter
+    def budget(self, amount):
+        self.purse = to_lakhs(amount)
+        self._changed()
 
     def can_bid(self, amount):
         """
         Check if team can afford to bid the specified amount.
         
         Args:
-            amount (float): Bid amount to check
+            amount (float): Bid amount to check, in Cr
             
         Returns:
             bool: True if team has sufficient budget, False otherwise
         """
-        return self.budget >= amount
+        return self.can_bid_lakhs(to_lakhs(amount))
+
+    def can_bid_lakhs(self, amount):
+        """
+        can_bid for an amount in lakhs, as the Dealer and clearing engine keep them.
+        """
+        return self.purse >= amount
 
     def add_player(self, player, bid_amount):
         """
@@ -35,19 +61,45 @@ class Team:
         
         Args:
             player (Player): Player object to add to the team
-            bid_amount (float): Amount paid for the player
+            bid_amount (float): Amount paid for the player, in Cr
+        """
+        self.add_player_lakhs(player, to_lakhs(bid_amount))
+
+    def add_player_lakhs(self, player, bid_amount):
         """
-        if self.can_bid(bid_amount) and len(self.players) < self.max_players:
+        add_player for an amount in lakhs, as the Dealer and clearing engine keep them.
+        """
+        if self.can_bid_lakhs(bid_amount) and len(self.players) < self.max_players:
             self.players.append(player)
-            self.budget -= bid_amount  # Deduct bid amount from team budget
+            self.purse -= bid_amount  # Deduct bid amount from team budget
+            role = player.role
+            self.total_stars += player.stats.get('stars', 0)
+            self.role_counts[role] = self.role_counts.get(role, 0) + 1
+            self.spent_by_role[role] = self.spent_by_role.get(role, 0) + bid_amount
+            self._changed()
+
+    def _changed(self):
+        for listener in self.listeners:
+            listener.team_changed(self)
+
+    def format_team_summary(self):
+        """
+        Build a formatted summary of the team including budget and player details.
+
+        Returns:
+            str: Multi-line summary
+        """
+        lines = [
+            f"\n--- {self.name} Summary ---",
+            f"Remaining Budget: {self.budget} Cr",
+            f"Players in Squad ({len(self.players)}):",
+        ]
+        lines += [f" • {p.name} ({p.role}) for {p.winning_bid} Cr" for p in self.players]
+        lines.append("---------------------------\n")
+        return "\n".join(lines)
 
     def print_team_summary(self):
         """
         Print a formatted summary of the team including budget and player details.
         """
-        print(f"\n--- {self.name} Summary ---")
-        print(f"Remaining Budget: {self.budget} Cr")
-        print(f"Players in Squad ({len(self.players)}):")
-        for p in self.players:
-            print(f" • {p.name} ({p.role}) for {p.winning_bid} Cr")
-        print("---------------------------\n")
+        print(self.format_team_summary())
@@ -0,0 +1,323 @@
+"""
+Monte Carlo tournament runner for comparing bidding strategies.
+
+A tournament plays many independent auctions, each fully determined by its seed:
+the seed is the Dealer's root seed, from which the lot order and every strategy's
+random stream are derived (see auctionengine.rng). Default
+models are seeded separately and come from the on-disk artifact store, so every
+auction bids with the same fitted models. Auctions are spread across a
+ProcessPoolExecutor and the per-team results are aggregated per strategy into win
+rate, mean stars and budget efficiency, each with a 95% confidence interval.
+``aggregate_tournament`` plays auctions the same way but keeps only mergeable
+aggregates (see auctionengine.aggregation), for runs too long to keep every result.
+Any single auction can be replayed on its own with ``run_auction(seed, ...)``.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from auctionengine.aggregation import ResultsAggregator
+from auctionengine.dealer import Dealer
+from auctionengine.events import NullSink
+from auctionengine.money import to_crore, to_lakhs
+from auctionengine.team import Team
+from auctionengine.utils import load_all_players
+
+# Strategy lineup used by auction.py, one entry per seat
+DEFAULT_LINEUP = ["random_forest", "xgboost", "statistical", "bayesian_ridge"]
+
+# z-score for a two-sided 95% confidence interval
+Z_95 = 1.96
+
+
+def make_strategy(name, budget, params=None):
+    """
+    Build a bidding strategy by name. Strategy modules are imported on demand.
+
+    Args:
+        name (str): Strategy registry name (see strategies.registry), e.g. statistical,
+            statistical_planner, random_forest, xgboost, mlp, bayesian_ridge
+        budget (float): Team budget, passed to strategies that track their own spending
+        params (dict, optional): Constructor arguments, e.g. bidding thresholds
+
+    Returns:
+        object: Bidding strategy instance
+    """
+    from strategies import registry
+    return registry.create(name, budget=budget, **(params or {}))
+
+
+def lineup_entry(entry):
+    """
+    Split a lineup entry into (label, strategy name, params).
+
+    An entry is a strategy name, or a dict with ``name`` and optional ``params`` and
+    ``label`` (the name results are reported under; defaults to ``name``).
+    """
+    if isinstance(entry, str):
+        return entry, entry, {}
+    return entry.get("label", entry["name"]), entry["name"], entry.get("params", {})
+
+
+def seat_lineup(lineup, index, rotate):
+    """
+    Return the strategy for each seat in a given auction.
+
+    With rotation, auction ``index`` shifts the lineup by ``index`` seats so every
+    strategy bids from every position in the team order equally often.
+    """
+    if not rotate:
+        return list(lineup)
+    shift = index % len(lineup)
+    return list(lineup[shift:]) + list(lineup[:shift])
+
+
+# Player pool cached per worker process so the CSVs are parsed once per worker
+_players = None
+
+
+def _load_pool(dataset_dir):
+    global _players
+    if _players is None:
+        _players = load_all_players(dataset_dir)
+    return _players
+
+
+def run_auction(seed, lineup, budget=40.0, max_players=11, fast_clearing=False,
+                dataset_dir="dataset", verbose=False, antithetic=False, lot_streams=False, aggregator=None):
+    """
+    Play one auction determined entirely by ``seed``.
+
+    Args:
+        seed (int): Seed for the lot order and strategy randomness
+        lineup (list): Strategy for each seat, in bidding order, as a name or a dict
+            (see lineup_entry)
+        budget (float): Starting budget for every team
+        max_players (int): Squad size limit for every team
+        fast_clearing (bool): Use the fast clearing engine where possible
+        dataset_dir (str): Directory containing the player CSVs
+        verbose (bool): Print the auction log as auction.py does
+        antithetic (bool): Auction the seed's lot order in reverse (see Dealer)
+        lot_streams (bool): Restart every seat's random stream at each lot (see Dealer)
+        aggregator (ResultsAggregator, optional): Also fold the auction, rosters
+            included, into this aggregator (see auctionengine.aggregation)
+
+    Returns:
+        list: One dict per seat with strategy, stars, spent, players and won keys
+    """
+    # Copy the pool so the dealer's shuffle does not depend on earlier auctions
+    players = list(_load_pool(dataset_dir))
+    teams = [Team(name=f"Seat {i + 1}", budget=budget, max_players=max_players)
+             for i in range(len(lineup))]
+    entries = [lineup_entry(entry) for entry in lineup]
+    strategies = {team.name: make_strategy(name, budget, params)
+                  for team, (_, name, params) in zip(teams, entries)}
+    dealer = Dealer(players=players, teams=teams, strategies=strategies, fast_clearing=fast_clearing,
+                    events=None if verbose else NullSink(), seed=seed, antithetic=antithetic,
+                    lot_streams=lot_streams)
+    dealer.start_auction()
+
+    stars = [team.total_stars for team in teams]
+    best = max(stars)
+    winners = stars.count(best)
+    seats = [{
+        "strategy": name,
+        "stars": team_stars,
+        "spent": to_crore(to_lakhs(budget) - team.purse),
+        "players": len(team.players),
+        # Ties share the win so win rates still sum to one per auction
+        "won": (1.0 / winners) if team_stars == best else 0.0,
+    } for (name, _, _), team, team_stars in zip(entries, teams, stars)]
+    if aggregator is not None:
+        aggregator.add_auction(seats, teams, players)
+    return seats
+
+
+def _run_batch(args):
+    seeds, lineup, rotate, options = args
+    return [(seed, run_auction(seed, seat_lineup(lineup, seed, rotate), **options)) for seed in seeds]
+
+
+def _aggregate_batch(args):
+    seeds, lineup, rotate, options, settings = args
+    aggregator = ResultsAggregator(**settings)
+    for seed in seeds:
+        run_auction(seed, seat_lineup(lineup, seed, rotate), aggregator=aggregator, **options)
+    return aggregator
+
+
+def mean_ci(values):
+    """Mean and normal-approximation 95% confidence half-width."""
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return mean, math.inf
+    var = sum((v - mean) ** 2 for v in values) / (n - 1)
+    return mean, Z_95 * math.sqrt(var / n)
+
+
+def _wilson(successes, n):
+    """Wilson score 95% interval for a proportion."""
+    p = successes / n
+    denom = 1 + Z_95 ** 2 / n
+    centre = (p + Z_95 ** 2 / (2 * n)) / denom
+    half = Z_95 * math.sqrt(p * (1 - p) / n + Z_95 ** 2 / (4 * n * n)) / denom
+    return centre - half, centre + half
+
+
+class TournamentResult:
+    def __init__(self, results):
+        """
+        Hold per-auction results and aggregate them per strategy.
+
+        Args:
+            results (list): (seed, seat results) tuples as returned by run_auction
+        """
+        self.results = sorted(results, key=lambda r: r[0])
+
+    def summary(self):
+        """
+        Aggregate results per strategy.
+
+        Returns:
+            dict: Strategy name to a dict of seats played, win rate (with Wilson
+            interval), mean stars, mean spend and stars per crore (each with a
+            95% half-width)
+        """
+        per_strategy = {}
+        for _, seats in self.results:
+            for seat in seats:
+                per_strategy.setdefault(seat["strategy"], []).append(seat)
+
+        summary = {}
+        for name, seats in per_strategy.items():
+            n = len(seats)
+            wins = sum(s["won"] for s in seats)
+            stars, stars_ci = mean_ci([s["stars"] for s in seats])
+            spent, spent_ci = mean_ci([s["spent"] for s in seats])
+            efficiency, efficiency_ci = mean_ci(
+                [s["stars"] / s["spent"] if s["spent"] > 0 else 0.0 for s in seats])
+            summary[name] = {
+                "seats": n,
+                "win_rate": wins / n,
+                "win_rate_ci": _wilson(wins, n),
+                "mean_stars": stars,
+                "mean_stars_ci": stars_ci,
+                "mean_spent": spent,
+                "mean_spent_ci": spent_ci,
+                "stars_per_cr": efficiency,
+                "stars_per_cr_ci": efficiency_ci,
+            }
+        return summary
+
+    def outliers(self, strategy, count=5):
+        """
+        Seeds where a strategy collected the fewest stars, for replaying with run_auction.
+
+        Args:
+            strategy (str): Strategy name
+            count (int): Number of seeds to return
+
+        Returns:
+            list: (seed, stars) tuples, worst first
+        """
+        rows = [(seed, seat["stars"]) for seed, seats in self.results
+                for seat in seats if seat["strategy"] == strategy]
+        return sorted(rows, key=lambda r: r[1])[:count]
+
+    def format_table(self):
+        """
+        Render the summary as a fixed-width text table.
+        """
+        lines = [f"{'Strategy':<16}{'Seats':>7}{'Win rate':>20}{'Stars':>16}{'Stars/Cr':>16}"]
+        for name, row in sorted(self.summary().items(), key=lambda kv: -kv[1]["win_rate"]):
+            lo, hi = row["win_rate_ci"]
+            lines.append(
+                f"{name:<16}{row['seats']:>7}"
+                f"{row['win_rate']:>8.3f} [{lo:.3f},{hi:.3f}]"
+                f"{row['mean_stars']:>9.2f} ±{row['mean_stars_ci']:<5.2f}"
+                f"{row['stars_per_cr']:>9.2f} ±{row['stars_per_cr_ci']:<5.2f}")
+        return "\n".join(lines)
+
+
+def run_tournament(n_auctions, lineup=None, base_seed=0, workers=None, rotate=True,
+                   batch_size=None, **options):
+    """
+    Run ``n_auctions`` seeded auctions across a process pool.
+
+    Auction ``i`` uses seed ``base_seed + i`` and the lineup rotated by that seed, so
+    any auction can be replayed alone with ``run_auction(seed, seat_lineup(lineup, seed, rotate))``.
+
+    Args:
+        n_auctions (int): Number of auctions to play
+        lineup (list, optional): Strategy per seat, as a name or a dict (see lineup_entry).
+            Defaults to DEFAULT_LINEUP.
+        base_seed (int): Seed of the first auction
+        workers (int, optional): Worker processes. Defaults to os.cpu_count().
+            With one worker the auctions run in the calling process.
+        rotate (bool): Rotate seats between auctions
+        batch_size (int, optional): Auctions per task sent to a worker
+        **options: Passed through to run_auction (budget, max_players, fast_clearing, dataset_dir)
+
+    Returns:
+        TournamentResult: Per-auction results with per-strategy aggregation
+    """
+    lineup = list(lineup or DEFAULT_LINEUP)
+    workers = workers or os.cpu_count() or 1
+    seeds = list(range(base_seed, base_seed + n_auctions))
+    # Several auctions per task amortize process round trips; keep enough tasks to balance load.
+    batch_size = batch_size or max(1, n_auctions // (workers * 4))
+    batches = [(seeds[i:i + batch_size], lineup, rotate, options)
+               for i in range(0, len(seeds), batch_size)]
+
+    results = []
+    if workers == 1:
+        for batch in batches:
+            results.extend(_run_batch(batch))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for batch_results in pool.map(_run_batch, batches):
+                results.extend(batch_results)
+    return TournamentResult(results)
+
+
+def aggregate_tournament(n_auctions, lineup=None, base_seed=0, workers=None, rotate=True,
+                         batch_size=None, aggregator=None, **options):
+    """
+    Run ``n_auctions`` seeded auctions like run_tournament, keeping only aggregates.
+
+    Each task folds its auctions into its own ResultsAggregator and the parent merges
+    them as they arrive, so memory does not grow with the number of auctions.
+
+    Args:
+        n_auctions (int): Number of auctions to play
+        lineup (list, optional): Strategy per seat. Defaults to DEFAULT_LINEUP.
+        base_seed (int): Seed of the first auction
+        workers (int, optional): Worker processes. Defaults to os.cpu_count().
+        rotate (bool): Rotate seats between auctions
+        batch_size (int, optional): Auctions per task sent to a worker
+        aggregator (ResultsAggregator, optional): Aggregator to add to, e.g. one loaded
+            from an earlier run. Defaults to a new one.
+        **options: Passed through to run_auction
+
+    Returns:
+        ResultsAggregator
+    """
+    lineup = list(lineup or DEFAULT_LINEUP)
+    workers = workers or os.cpu_count() or 1
+    aggregator = aggregator or ResultsAggregator()
+    settings = {"price_bin": aggregator.price_bin, "relative_accuracy": aggregator.relative_accuracy}
+    batch_size = batch_size or max(1, n_auctions // (workers * 4))
+    end = base_seed + n_auctions
+    batches = [(range(start, min(start + batch_size, end)), lineup, rotate, options, settings)
+               for start in range(base_seed, end, batch_size)]
+
+    if workers == 1:
+        for batch in batches:
+            aggregator.merge(_aggregate_batch(batch))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial in pool.map(_aggregate_batch, batches):
+                aggregator.merge(partial)
+    return aggregator
@@ -0,0 +1,411 @@
+"""
+Offline training pipeline for the model-backed strategies.
+
+Out of the box the random forest, xgboost, MLP and Bayesian ridge strategies fit
+their models to random noise. This pipeline fits them to the real player pool
+instead and publishes each fit as a new version in the artifact store (see
+auctionengine.artifacts), which a strategy loads in place of its default fit when
+constructed with ``trained_version`` ("latest" or a version number).
+
+Training data comes from the dataset CSVs, loaded once through the compiled cache.
+Each strategy's features are built by the strategy itself (``extract_feature_matrix``
+over the player tables), so a trained model always matches what the strategy feeds
+it at bid time. Two targets are supported:
+
+- ``stars``: the player's star rating, which is on the same 0-10 scale as the Cr
+  valuations the strategies' bid thresholds work with. A strategy whose features
+  include the star rating (``FEATURE_STATS``), such as Bayesian ridge, would see its
+  label among its inputs, so it is not trained on this target.
+- ``price``: winning bids from bid logs (see auctionengine.bidlog), one sample per
+  sold lot, matched to the pool by player name and role.
+
+Every model is scored with k-fold cross-validation (RMSE and R^2) before the final
+fit on all samples, and models are trained in parallel across a process pool.
+
+``retrain`` updates price-trained models from bid logs that are new since the
+version it starts from (logs are recognized by content hash) without refitting from
+scratch: the forest grows extra trees on the new samples (warm start), xgboost adds
+boosting rounds starting from the current booster, and the MLP takes
+``partial_fit`` passes. Bayesian ridge has no partial fit; it refits on all samples
+seen so far, warm-started from the previous noise and weight precisions, which costs
+little with five features. Each update is published as a new version that records
+its parent.
+"""
+
+import abc
+import datetime
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from auctionengine.artifacts import default_store, hash_arrays
+from auctionengine.utils import load_all_players
+
+DEFAULT_MODELS = ["random_forest", "xgboost", "mlp", "bayesian_ridge"]
+TARGETS = ("stars", "price")
+
+
+class ModelTrainer(abc.ABC):
+    """How one strategy's model is built, fitted and updated. Libraries are imported on use."""
+
+    def __init__(self, **params):
+        self.params = params
+
+    @abc.abstractmethod
+    def build(self, seed):
+        """Return a new, unfitted model."""
+
+    @abc.abstractmethod
+    def update(self, model, X, y, data, seed):
+        """
+        Fold new samples into a fitted model.
+
+        Args:
+            model: Fitted model, which may be updated in place
+            X (numpy.ndarray): New samples' features
+            y (numpy.ndarray): New samples' targets
+            data (dict): ``X`` and ``y`` of every sample seen so far, new ones included
+            seed (int): Seed for any randomness
+
+        Returns:
+            object: The updated model
+        """
+
+
+class ForestTrainer(ModelTrainer):
+    def __init__(self, n_estimators=100, update_trees=20):
+        super().__init__(n_estimators=n_estimators, update_trees=update_trees)
+
+    def build(self, seed):
+        from sklearn.ensemble import RandomForestRegressor
+        return RandomForestRegressor(n_estimators=self.params["n_estimators"], random_state=seed)
+
+    def update(self, model, X, y, data, seed):
+        # warm_start keeps the existing trees and fits only the added ones, on the new samples
+        model.set_params(warm_start=True, n_estimators=len(model.estimators_) + self.params["update_trees"])
+        model.fit(X, y)
+        return model
+
+
+class XGBoostTrainer(ModelTrainer):
+    def __init__(self, n_estimators=100, update_rounds=20):
+        super().__init__(n_estimators=n_estimators, update_rounds=update_rounds)
+
+    def build(self, seed):
+        import xgboost as xgb
+        return xgb.XGBRegressor(objective="reg:squarederror", n_estimators=self.params["n_estimators"],
+                                random_state=seed)
+
+    def update(self, model, X, y, data, seed):
+        import xgboost as xgb
+        updated = xgb.XGBRegressor(**dict(model.get_params(), n_estimators=self.params["update_rounds"]))
+        # Boosting continues from the current booster's predictions
+        updated.fit(X, y, xgb_model=model.get_booster())
+        return updated
+
+
+class MLPTrainer(ModelTrainer):
+    # With the default 0.001 step, adam stalls long before fitting a few hundred samples
+    def __init__(self, hidden_layer_sizes=(50,), learning_rate_init=0.01, max_iter=2000, update_epochs=50):
+        super().__init__(hidden_layer_sizes=list(hidden_layer_sizes), learning_rate_init=learning_rate_init,
+                         max_iter=max_iter, update_epochs=update_epochs)
+
+    def build(self, seed):
+        from sklearn.neural_network import MLPRegressor
+        return MLPRegressor(hidden_layer_sizes=tuple(self.params["hidden_layer_sizes"]),
+                            learning_rate_init=self.params["learning_rate_init"],
+                            max_iter=self.params["max_iter"], random_state=seed)
+
+    def update(self, model, X, y, data, seed):
+        for _ in range(self.params["update_epochs"]):
+            model.partial_fit(X, y)
+        return model
+
+
+class BayesianRidgeTrainer(ModelTrainer):
+    def __init__(self, alpha_1=1e-6, lambda_1=1e-6):
+        super().__init__(alpha_1=alpha_1, lambda_1=lambda_1)
+
+    def build(self, seed, alpha_init=None, lambda_init=None):
+        from sklearn.linear_model import BayesianRidge
+        return BayesianRidge(alpha_1=self.params["alpha_1"], lambda_1=self.params["lambda_1"],
+                             alpha_init=alpha_init, lambda_init=lambda_init)
+
+    def update(self, model, X, y, data, seed):
+        refit = self.build(seed, alpha_init=model.alpha_, lambda_init=model.lambda_)
+        refit.fit(data["X"], data["y"])
+        return refit
+
+
+# Strategy registry name -> trainer for its model
+TRAINERS = {
+    "random_forest": ForestTrainer(),
+    "xgboost": XGBoostTrainer(),
+    "mlp": MLPTrainer(),
+    "bayesian_ridge": BayesianRidgeTrainer(),
+}
+
+
+def _library_versions():
+    import sklearn
+    versions = {"numpy": np.__version__, "sklearn": sklearn.__version__}
+    try:
+        import xgboost
+        versions["xgboost"] = xgboost.__version__
+    except ImportError:
+        pass
+    return versions
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents, used to recognize logs already trained on."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def log_prices(paths, players):
+    """
+    Winning bids from bid logs, one sample per sold lot.
+
+    Args:
+        paths (list): Bid log files
+        players (list): Player pool; logged lots are matched by name and role, and lots
+            of players not in the pool are skipped
+
+    Returns:
+        tuple: (list of Player, numpy.ndarray of prices)
+    """
+    from auctionengine.bidlog import read_bid_log
+
+    pool = {(p.name, p.role): p for p in players}
+    sold, prices = [], []
+    for path in paths:
+        for record in read_bid_log(path):
+            for lot in record.lots:
+                player = pool.get((lot.player_name, lot.role))
+                if player is not None and lot.winner is not None:
+                    sold.append(player)
+                    prices.append(lot.price)
+    return sold, np.asarray(prices, dtype=np.float64)
+
+
+def training_samples(target, players, logs=()):
+    """
+    Players and targets for a target kind.
+
+    Args:
+        target (str): "stars" or "price"
+        players (list): Player pool
+        logs (list): Bid logs, for the price target
+
+    Returns:
+        tuple: (list of Player, numpy.ndarray of targets)
+    """
+    if target == "stars":
+        return list(players), np.array([p.stats.get("stars", 0) for p in players], dtype=np.float64)
+    if target == "price":
+        if not logs:
+            raise ValueError("the price target needs at least one bid log")
+        return log_prices(logs, players)
+    raise ValueError(f"Unknown target: {target} (expected one of {', '.join(TARGETS)})")
+
+
+def feature_matrix(name, players):
+    """
+    A strategy's model features for players, built by the strategy itself.
+
+    Args:
+        name (str): Strategy registry name
+        players (list): Player objects (repeats allowed)
+
+    Returns:
+        numpy.ndarray: One feature row per player
+    """
+    from strategies import registry
+
+    # Constructing a strategy does not load or train its model
+    return registry.create(name).valuations.feature_matrix(players)
+
+
+def leaks_target(name, target):
+    """
+    Whether a strategy's model features are computed from the target itself.
+
+    Args:
+        name (str): Strategy registry name
+        target (str): "stars" or "price"
+    """
+    from strategies import registry
+
+    return target in getattr(registry.resolve(name), "FEATURE_STATS", ())
+
+
+def _scores(y, predicted):
+    """RMSE and R^2 of predictions."""
+    residual = y - predicted
+    total = np.sum((y - y.mean()) ** 2)
+    r2 = 1.0 - np.sum(residual ** 2) / total if total > 0 else 0.0
+    return float(np.sqrt(np.mean(residual ** 2))), float(r2)
+
+
+def cross_validate(trainer, X, y, folds=5, seed=0):
+    """
+    K-fold cross-validation of a trainer's model.
+
+    Returns:
+        dict: Mean and standard deviation of RMSE and R^2 over the folds
+    """
+    from sklearn.model_selection import KFold
+
+    rmse, r2 = [], []
+    for train_rows, test_rows in KFold(n_splits=folds, shuffle=True, random_state=seed).split(X):
+        model = trainer.build(seed)
+        model.fit(X[train_rows], y[train_rows])
+        fold_rmse, fold_r2 = _scores(y[test_rows], np.asarray(model.predict(X[test_rows])).ravel())
+        rmse.append(fold_rmse)
+        r2.append(fold_r2)
+    return {"folds": folds, "rmse": float(np.mean(rmse)), "rmse_std": float(np.std(rmse)),
+            "r2": float(np.mean(r2)), "r2_std": float(np.std(r2))}
+
+
+def _fit(task):
+    """Worker: cross-validate and fit, or update, one model."""
+    name, X, y, options = task
+    trainer = TRAINERS[name]
+    start = time.perf_counter()
+    if options.get("base") is None:
+        cv = cross_validate(trainer, X, y, options["folds"], options["seed"]) if options["folds"] > 1 else None
+        model = trainer.build(options["seed"])
+        model.fit(X, y)
+        report = {"cv": cv}
+    else:
+        model, data = options["base"], options["data"]
+        before = _scores(y, np.asarray(model.predict(X)).ravel())[0]
+        model = trainer.update(model, X, y, data, options["seed"])
+        after = _scores(y, np.asarray(model.predict(X)).ravel())[0]
+        report = {"new_samples_rmse_before": before, "new_samples_rmse_after": after}
+    report["seconds"] = time.perf_counter() - start
+    return name, model, report
+
+
+def _run(tasks, workers):
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        return [_fit(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_fit, tasks))
+
+
+def _owner(name):
+    from strategies import registry
+    return registry.resolve(name).__name__
+
+
+def train_models(names=None, target="stars", logs=(), dataset_dir="dataset", folds=5, seed=0,
+                 workers=None, store=None):
+    """
+    Train models from scratch and publish each as a new version.
+
+    Args:
+        names (list, optional): Strategy registry names. Defaults to the DEFAULT_MODELS
+            whose features do not include the target.
+        target (str): "stars" or "price"
+        logs (list): Bid logs, for the price target
+        dataset_dir (str): Directory containing the player CSVs
+        folds (int): Cross-validation folds; below 2 skips cross-validation
+        seed (int): Seed for fold splits and estimators
+        workers (int, optional): Worker processes. Defaults to os.cpu_count().
+            With one worker the models are trained in the calling process.
+        store (ModelArtifactStore, optional): Defaults to the process-wide store
+
+    Returns:
+        list: Published metadata per model, in the order of names
+
+    Raises:
+        ValueError: If a named strategy's features include the target
+    """
+    names = list(names or [name for name in DEFAULT_MODELS if not leaks_target(name, target)])
+    for name in names:
+        if leaks_target(name, target):
+            raise ValueError(f"{name}: its features include {target}, the target; train it on another target")
+    store = store or default_store()
+    players = load_all_players(dataset_dir)
+    samples, y = training_samples(target, players, logs)
+    features = {name: feature_matrix(name, samples) for name in names}
+    tasks = [(name, features[name], y, {"folds": folds, "seed": seed}) for name in names]
+
+    published = []
+    for name, model, report in _run(tasks, workers):
+        X = features[name]
+        metadata = dict(report, strategy=name, target=target, samples=len(y), features=X.shape[1],
+                        data_hash=hash_arrays(X, y), params=TRAINERS[name].params, seed=seed,
+                        logs=[file_hash(path) for path in logs], parent=None, incremental=False,
+                        trained_at=datetime.datetime.now().isoformat(timespec="seconds"),
+                        libraries=_library_versions())
+        version = store.publish(_owner(name), model, metadata, data={"X": X, "y": y})
+        published.append(dict(metadata, version=version))
+    return published
+
+
+def retrain(logs, names=None, dataset_dir="dataset", seed=0, workers=None, store=None):
+    """
+    Update the newest price-trained models with bid logs they have not seen.
+
+    Args:
+        logs (list): Bid logs; ones already used by a model's version are skipped
+        names (list, optional): Strategy registry names. Defaults to DEFAULT_MODELS.
+        dataset_dir (str): Directory containing the player CSVs
+        seed (int): Seed for any randomness in the updates
+        workers (int, optional): Worker processes, as for train_models
+        store (ModelArtifactStore, optional): Defaults to the process-wide store
+
+    Returns:
+        list: Published metadata per updated model; models with no new logs are left
+        out
+
+    Raises:
+        ValueError: If a model has no published version, or was not trained on prices
+    """
+    names = list(names or DEFAULT_MODELS)
+    store = store or default_store()
+    players = load_all_players(dataset_dir)
+    hashes = {path: file_hash(path) for path in logs}
+
+    tasks, bases = [], {}
+    for name in names:
+        artifact = store.load_version(_owner(name))
+        if artifact is None:
+            raise ValueError(f"{name}: no trained version to update; run train_models first")
+        metadata = artifact["metadata"]
+        if metadata["target"] != "price":
+            raise ValueError(f"{name}: version {metadata['version']} was trained on {metadata['target']}, "
+                             f"and bid logs only provide prices")
+        new_logs = [path for path in logs if hashes[path] not in metadata["logs"]]
+        if not new_logs:
+            continue
+        samples, y = log_prices(new_logs, players)
+        if not len(y):
+            continue
+        X = feature_matrix(name, samples)
+        data = {"X": np.vstack([artifact["data"]["X"], X]), "y": np.concatenate([artifact["data"]["y"], y])}
+        bases[name] = (metadata, data, new_logs, y)
+        tasks.append((name, X, y, {"seed": seed, "base": artifact["model"], "data": data}))
+
+    published = []
+    for name, model, report in _run(tasks, workers) if tasks else []:
+        parent, data, new_logs, y = bases[name]
+        metadata = dict(parent, **report)
+        metadata.pop("cv", None)
+        metadata.update(samples=len(data["y"]), new_samples=len(y), data_hash=hash_arrays(data["X"], data["y"]),
+                        logs=parent["logs"] + [hashes[path] for path in new_logs], parent=parent["version"],
+                        incremental=True, seed=seed, trained_at=datetime.datetime.now().isoformat(timespec="seconds"),
+                        libraries=_library_versions())
+        version = store.publish(_owner(name), model, metadata, data=data)
+        published.append(dict(metadata, version=version))
+    return published
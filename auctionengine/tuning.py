@@ -0,0 +1,331 @@
+"""
+Bidding-parameter search with successive halving and Hyperband.
+
+The strategies' bidding thresholds and increments are constructor arguments whose
+defaults are the values the strategies always used. Each strategy has a box of
+plausible values in SPACES. A candidate configuration is scored by the mean stars
+its seat collects in seeded auctions against a fixed field of opponents. Seats are
+rotated by seed as in a tournament.
+
+Scoring every candidate on enough auctions to separate them is far too expensive,
+so candidates are raced instead. Successive halving scores every candidate on a few
+auctions, keeps the best 1/eta, and gives the survivors eta times as many auctions,
+until the last rung scores the survivors on ``max_auctions``. Every candidate
+in a race is scored on the same seeds, and a candidate promoted to the next rung
+keeps its earlier auctions and only plays the new seeds. Common seeds cancel most of
+the lot-order luck between candidates, so fewer auctions rank them reliably.
+
+Hyperband runs several such races (brackets). They trade many candidates on short
+first rungs against few candidates on long ones, which hedges against early rungs
+being too noisy to trust.
+
+The strategy's default configuration always enters the first bracket. The best
+candidate and the defaults are then replayed on fresh validation seeds and compared
+seed by seed, so the reported gain is not inflated by having picked the luckiest
+candidate. Auctions are spread across a ProcessPoolExecutor. Every seed used is
+recorded, so any result can be reproduced with ``tournament.run_auction``.
+"""
+
+import inspect
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from auctionengine.tournament import DEFAULT_LINEUP, mean_ci, run_auction, seat_lineup
+
+# The auction.py field without its first seat, which the tuned strategy takes
+DEFAULT_OPPONENTS = DEFAULT_LINEUP[1:]
+
+# Seeds for validation start here, well clear of the seeds used while racing
+VALIDATION_SEED_OFFSET = 1_000_000
+
+_INCREMENTAL = {"aggressive_below": (0.5, 1.0), "aggressive_step": (0.05, 0.5), "nudge_step": (0.01, 0.3)}
+_PROBABILISTIC = dict(_INCREMENTAL, nudge_probability=(0.0, 1.0))
+
+# Strategy name -> constructor argument -> (low, high), sampled uniformly
+SPACES = {
+    "base": _PROBABILISTIC,
+    "statistical": _PROBABILISTIC,
+    "statistical_planner": _PROBABILISTIC,
+    "random_forest": _INCREMENTAL,
+    "xgboost": _INCREMENTAL,
+    "mlp": _INCREMENTAL,
+    "bayesian_ridge": {
+        "aggressive_below": (0.4, 1.0),
+        "aggressive_step_min": (0.05, 0.5),
+        "aggressive_step_max": (0.1, 1.0),
+        "nudge_step_min": (0.01, 0.2),
+        "nudge_step_max": (0.05, 0.4),
+        "market_min": (0.7, 1.0),
+        "market_max": (1.0, 1.3),
+    },
+}
+
+CANDIDATE = "candidate"
+
+
+def default_config(strategy, space):
+    """
+    The strategy's own defaults for the parameters of a space.
+
+    Args:
+        strategy (str): Strategy registry name
+        space (dict): Parameter space
+
+    Returns:
+        dict: Parameter -> default value
+    """
+    from strategies import registry
+
+    parameters = inspect.signature(registry.resolve(strategy)).parameters
+    return {name: parameters[name].default for name in space}
+
+
+def sample_config(space, rng):
+    """
+    Draw a configuration uniformly from a space.
+
+    Parameters named ``<x>_min`` and ``<x>_max`` are drawn independently and then
+    ordered, so every sample is a valid range.
+
+    Args:
+        space (dict): Parameter -> (low, high)
+        rng (numpy.random.Generator): Random stream
+
+    Returns:
+        dict: Parameter -> value, rounded to 3 decimals
+    """
+    config = {name: round(float(rng.uniform(low, high)), 3) for name, (low, high) in space.items()}
+    for name in config:
+        if name.endswith("_min"):
+            upper = name[:-4] + "_max"
+            if upper in config and config[name] > config[upper]:
+                config[name], config[upper] = config[upper], config[name]
+    return config
+
+
+def _play(task):
+    """Worker: play seeds with a candidate configuration and report its seat."""
+    strategy, params, opponents, seeds, options = task
+    lineup = [{"name": strategy, "params": params, "label": CANDIDATE}] + list(opponents)
+    results = []
+    for seed in seeds:
+        seats = run_auction(seed, seat_lineup(lineup, seed, True), **options)
+        seat = next(s for s in seats if s["strategy"] == CANDIDATE)
+        results.append((seed, seat["stars"], seat["won"]))
+    return results
+
+
+class _Evaluator:
+    """Plays (configuration, seeds) requests across a process pool, caching every result."""
+
+    def __init__(self, strategy, opponents, options, workers):
+        self.strategy = strategy
+        self.opponents = opponents
+        self.options = options
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        self.auctions = 0
+
+    def play(self, requests):
+        """
+        Args:
+            requests (list): (trial, seeds) pairs; results are added to trial["results"]
+        """
+        tasks, owners = [], []
+        total = sum(len(seeds) for _, seeds in requests)
+        chunk = max(1, total // (self.workers * 4))
+        for trial, seeds in requests:
+            for i in range(0, len(seeds), chunk):
+                tasks.append((self.strategy, trial["params"], self.opponents, seeds[i:i + chunk], self.options))
+                owners.append(trial)
+        mapped = self.pool.map(_play, tasks) if self.pool else map(_play, tasks)
+        for trial, results in zip(owners, mapped):
+            for seed, stars, won in results:
+                trial["results"][seed] = (stars, won)
+        self.auctions += total
+
+    def close(self):
+        if self.pool:
+            self.pool.shutdown()
+
+
+def _mean_stars(trial, seeds):
+    return sum(trial["results"][seed][0] for seed in seeds) / len(seeds)
+
+
+def successive_halving(trials, evaluator, seeds, budgets, eta):
+    """
+    Race trials, keeping the best 1/eta at every rung.
+
+    Args:
+        trials (list): Trial dicts with ``params`` and a ``results`` dict
+        evaluator (_Evaluator): Plays the auctions
+        seeds (list): Seeds in the order rungs consume them
+        budgets (list): Auctions per trial at each rung, increasing
+        eta (int): Reduction factor
+
+    Returns:
+        list: One dict per rung with auctions and (trial id, mean stars) standings
+    """
+    rungs = []
+    alive = list(trials)
+    for budget in budgets:
+        rung_seeds = seeds[:budget]
+        evaluator.play([(trial, [s for s in rung_seeds if s not in trial["results"]]) for trial in alive])
+        standings = sorted(alive, key=lambda trial: -_mean_stars(trial, rung_seeds))
+        rungs.append({"auctions": budget,
+                      "standings": [(trial["id"], _mean_stars(trial, rung_seeds)) for trial in standings]})
+        for trial in standings:
+            trial["rung_auctions"] = budget
+        alive = standings[:max(1, len(standings) // eta)]
+    return rungs
+
+
+def _summary(trial, seeds):
+    stars = [trial["results"][seed][0] for seed in seeds]
+    wins = [trial["results"][seed][1] for seed in seeds]
+    mean, ci = mean_ci(stars)
+    return {"params": trial["params"], "mean_stars": mean, "mean_stars_ci": ci,
+            "win_rate": sum(wins) / len(wins), "auctions": len(seeds)}
+
+
+class TuningResult:
+    def __init__(self, strategy, opponents, defaults, best, validation, brackets, trials, seeds, auctions):
+        """
+        Outcome of tuning one strategy.
+
+        Args:
+            strategy (str): Strategy name
+            opponents (list): Fixed opponent field
+            defaults (dict): Summary of the default configuration on the racing seeds
+            best (dict): Summary of the best configuration on the racing seeds
+            validation (dict): Best against defaults on fresh seeds, compared seed by seed
+            brackets (list): Rungs per Hyperband bracket
+            trials (list): Every configuration tried, with the auctions it played
+            seeds (dict): ``racing`` and ``validation`` seed ranges as [first, last]
+            auctions (int): Auctions played in total
+        """
+        self.strategy = strategy
+        self.opponents = opponents
+        self.defaults = defaults
+        self.best = best
+        self.validation = validation
+        self.brackets = brackets
+        self.trials = trials
+        self.seeds = seeds
+        self.auctions = auctions
+
+    def to_dict(self):
+        """JSON-serializable form of the result."""
+        return {
+            "strategy": self.strategy,
+            "opponents": list(self.opponents),
+            "defaults": self.defaults,
+            "best": self.best,
+            "validation": self.validation,
+            "brackets": self.brackets,
+            "trials": self.trials,
+            "seeds": self.seeds,
+            "auctions": self.auctions,
+        }
+
+    def format_report(self):
+        """Render the best configuration and its validation as text."""
+        params = ", ".join(f"{k}={v}" for k, v in self.best["params"].items())
+        lines = [f"{self.strategy} vs {', '.join(self.opponents)} ({self.auctions} auctions)",
+                 f"  best:     {params}",
+                 f"            {self.best['mean_stars']:.1f} +/- {self.best['mean_stars_ci']:.1f} stars, "
+                 f"win rate {self.best['win_rate']:.1%} over {self.best['auctions']} auctions "
+                 f"(seeds {self.seeds['racing'][0]}-{self.seeds['racing'][1]})",
+                 f"  defaults: {self.defaults['mean_stars']:.1f} +/- {self.defaults['mean_stars_ci']:.1f} stars, "
+                 f"win rate {self.defaults['win_rate']:.1%}"]
+        if self.validation:
+            v = self.validation
+            lines.append(f"  validation on {v['auctions']} fresh seeds ({self.seeds['validation'][0]}-"
+                         f"{self.seeds['validation'][1]}): best {v['best_mean_stars']:.1f} vs defaults "
+                         f"{v['default_mean_stars']:.1f} stars, difference {v['difference']:+.1f} "
+                         f"+/- {v['difference_ci']:.1f}")
+        return "\n".join(lines)
+
+
+def hyperband(strategy, opponents=None, max_auctions=81, min_auctions=1, eta=3, validation_auctions=100,
+              base_seed=0, seed=0, workers=None, space=None, **options):
+    """
+    Tune a strategy's bidding parameters against a fixed opponent field.
+
+    Args:
+        strategy (str): Strategy registry name with an entry in SPACES (or ``space``)
+        opponents (list, optional): Opponent strategy names. Defaults to DEFAULT_OPPONENTS.
+        max_auctions (int): Most auctions any configuration is scored on
+        min_auctions (int): Auctions per configuration at the smallest rung
+        eta (int): Reduction factor between rungs
+        validation_auctions (int): Fresh seeds for the best-versus-defaults check; 0 skips it
+        base_seed (int): First racing seed; validation seeds start VALIDATION_SEED_OFFSET later
+        seed (int): Seed for sampling configurations
+        workers (int, optional): Worker processes. Defaults to os.cpu_count().
+            With one worker the auctions run in the calling process.
+        space (dict, optional): Parameter space, overriding SPACES[strategy]
+        **options: Passed through to run_auction (budget, max_players, fast_clearing, dataset_dir)
+
+    Returns:
+        TuningResult
+    """
+    opponents = list(opponents or DEFAULT_OPPONENTS)
+    space = space or SPACES[strategy]
+    rng = np.random.default_rng(seed)
+    racing_seeds = list(range(base_seed, base_seed + max_auctions))
+    s_max = int(math.floor(math.log(max_auctions / min_auctions, eta) + 1e-9))
+
+    evaluator = _Evaluator(strategy, opponents, options, workers or os.cpu_count() or 1)
+    trials, brackets = [], []
+    try:
+        for s in range(s_max, -1, -1):
+            n = int(math.ceil((s_max + 1) / (s + 1) * eta ** s))
+            configs = [sample_config(space, rng) for _ in range(n)]
+            if not trials:
+                configs[0] = default_config(strategy, space)
+            bracket = []
+            for params in configs:
+                trial = {"id": len(trials), "params": params, "results": {}, "rung_auctions": 0}
+                trials.append(trial)
+                bracket.append(trial)
+            # s + 1 rungs growing by eta, the last one scoring on every racing seed
+            budgets = [max(min_auctions, max_auctions // eta ** (s - i)) for i in range(s + 1)]
+            brackets.append(successive_halving(bracket, evaluator, racing_seeds, budgets, eta))
+
+        finalists = [trial for trial in trials if trial["rung_auctions"] == max_auctions]
+        best = max(finalists, key=lambda trial: _mean_stars(trial, racing_seeds))
+        default = trials[0]
+        # The defaults may have been dropped early; complete their record for the report
+        evaluator.play([(default, [s for s in racing_seeds if s not in default["results"]])])
+
+        validation, validation_seeds = None, []
+        if validation_auctions:
+            first = base_seed + VALIDATION_SEED_OFFSET
+            validation_seeds = list(range(first, first + validation_auctions))
+            checks = [{"params": best["params"], "results": {}}, {"params": default["params"], "results": {}}]
+            evaluator.play([(check, validation_seeds) for check in checks])
+            differences = [checks[0]["results"][s][0] - checks[1]["results"][s][0] for s in validation_seeds]
+            difference, difference_ci = mean_ci(differences)
+            validation = {"auctions": validation_auctions,
+                          "best_mean_stars": _mean_stars(checks[0], validation_seeds),
+                          "default_mean_stars": _mean_stars(checks[1], validation_seeds),
+                          "difference": difference, "difference_ci": difference_ci}
+    finally:
+        evaluator.close()
+
+    return TuningResult(
+        strategy, opponents,
+        defaults=_summary(default, racing_seeds),
+        best=_summary(best, racing_seeds),
+        validation=validation,
+        brackets=brackets,
+        trials=[{"id": t["id"], "params": t["params"], "auctions": len(t["results"]),
+                 "mean_stars": sum(r[0] for r in t["results"].values()) / len(t["results"])} for t in trials],
+        seeds={"racing": [racing_seeds[0], racing_seeds[-1]],
+               "validation": [validation_seeds[0], validation_seeds[-1]] if validation_seeds else None},
+        auctions=evaluator.auctions,
+    )
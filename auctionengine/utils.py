@@ -4,74 +4,74 @@ Utility functions for the auction engine.
 This module contains utility functions for loading and processing player data.
 """
 
-import pandas as pd
-from auctionengine.player import Player
+import os
+from auctionengine.datacache import load_compiled
+from auctionengine.player_table import PlayerTable
 
-def load_players(filepath, role):
+# Dataset file for each player role, relative to the dataset directory
+DATASET_FILES = {
+    "batsman": "batsmen.csv",
+    "bowler": "bowlers.csv",
+    "allrounder": "allrounders.csv",
+    "wicketkeeper": "wicketkeepers.csv",
+}
+
+def load_players(filepath, role, use_cache=True):
     """
     Load player data from a CSV file and create Player objects.
 
+    The CSV is parsed into a columnar PlayerTable with vectorized pandas operations;
+    the returned players are views into that table.
+
     Args:
         filepath (str): Path to the CSV file containing player data
         role (str): Player role ('batsman', 'bowler', 'wicketkeeper', 'allrounder')
+        use_cache (bool): Read through the compiled binary cache (see auctionengine.datacache)
 
     Returns:
         list: List of Player objects created from the CSV data
     """
-    df = pd.read_csv(filepath)
-    players = []
+    return load_table(filepath, role, use_cache=use_cache).players()
+
+
+def load_table(filepath, role, use_cache=True):
+    """
+    Load a CSV file into a PlayerTable.
+
+    With use_cache, the file is read through its compiled copy, which is built on
+    first use and rebuilt whenever the CSV changes. If the cache directory cannot be
+    written, the CSV is parsed directly.
+
+    Args:
+        filepath (str): Path to the CSV file containing player data
+        role (str): Player role ('batsman', 'bowler', 'wicketkeeper', 'allrounder')
+        use_cache (bool): Read through the compiled binary cache
 
-    for _, row in df.iterrows():
-        # Initialize basic stats that are common for all players
-        stats_dict = {
-            "matches": int(row.get("Matches", 0)),
-            "stars": int(row.get("Stars", 0)),
-            "age": int(row.get("Age", 0)),
-            "span": str(row.get("Span", "")),
-        }
-
-        # Add batting stats for batsmen, wicketkeepers, and all-rounders
-        if role in ["batsman", "wicketkeeper", "allrounder"]:
-            stats_dict.update({
-                "runs": int(row.get("Runs", 0)),
-                "high_score": str(row.get("High Score", 0)),
-                "batting_avg": float(row.get("Average", 0)),
-                "strike_rate": float(row.get("Strike Rates", 0)),
-                "hundreds": int(row.get("100", 0)),
-                "fifties": int(row.get("50", 0)),
-                "fours": int(row.get("4s", 0)),
-                "sixes": int(row.get("6s", 0)),
-                "ducks": int(row.get("Ducks", 0))
-            })
-
-        # Add bowling stats for bowlers and all-rounders
-        if role in ["bowler", "allrounder"]:
-            stats_dict.update({
-                "wickets": int(row.get("Wkts", 0)),
-                "economy": float(row.get("Economy", 0)),
-                "bowling_avg": float(row.get("Avg", 0)),
-                "bowling_sr": float(row.get("SR", 0)),
-                "four_wickets": int(row.get("4", 0)),
-                "five_wickets": int(row.get("5", 0))
-            })
-
-        # Add wicketkeeping stats for wicketkeepers
-        if role == "wicketkeeper":
-            stats_dict.update({
-                "catches": int(row.get("Ct", 0)),
-                "stumpings": int(row.get("St", 0))
-            })
-
-        # Create Player object with all relevant stats and metadata
-        player_obj = Player(
-            name=row.get("Player"),
-            role=role,
-            age=int(row.get("Age")),
-            nationality=row.get("Nationality"),
-            stats=stats_dict,
-            base_price=float(row.get("Base Price (Cr)")),
-            winning_bid=0.0
-        )
-        players.append(player_obj)
-
-    return players
\ No newline at end of file
+    Returns:
+        PlayerTable: Columnar player data for the file
+    """
+    if use_cache:
+        try:
+            return load_compiled(filepath, role)
+        except OSError:
+            pass
+    # pandas is only needed to parse CSVs, not to read the compiled cache
+    import pandas as pd
+    return PlayerTable.from_frame(pd.read_csv(filepath), role)
+
+
+def load_all_players(dataset_dir="dataset", use_cache=True):
+    """
+    Load every player role from a dataset directory.
+
+    Args:
+        dataset_dir (str): Directory containing the per-role CSV files
+        use_cache (bool): Read through the compiled binary cache
+
+    Returns:
+        list: Player objects for batsmen, bowlers, all-rounders and wicket-keepers, in that order
+    """
+    players = []
+    for role, filename in DATASET_FILES.items():
+        players += load_players(os.path.join(dataset_dir, filename), role=role, use_cache=use_cache)
+    return players
@@ -0,0 +1,131 @@
+"""
+Valuation cache shared by the Dealer and the model-backed bidding strategies.
+
+Scoring a player means building a feature row and running ``model.predict`` on it.
+The Dealer polls every team on every bid increment, so doing that per call makes
+single-row predict overhead dominate an auction. The cache scores the whole player
+pool in one vectorized ``predict`` call when the auction starts and answers every
+later lookup from a dictionary.
+
+Predictions go through the model's compiled NumPy kernel (see
+``auctionengine.inference``) when it has one, which skips the libraries' per-call
+validation and makes the single-row predicts on a cache miss cheap. Models without a
+kernel fall back to ``model.predict``.
+"""
+
+import numpy as np
+
+from auctionengine.inference import compile_model
+
+
+class ValuationCache:
+    """
+    Per-strategy cache of raw model predictions keyed by player.
+
+    The cache only stores what the model returns for a player's features. Anything
+    that depends on changing strategy state (remaining budget, spend per role, market
+    noise) must be applied by the strategy after the lookup. A strategy whose feature
+    vector itself depends on such state must call ``invalidate`` whenever it changes.
+    """
+
+    def __init__(self, strategy, compiled=True):
+        """
+        Initialize an empty cache for a strategy.
+
+        Args:
+            strategy: Object exposing ``extract_features(player)`` and a fitted ``model``
+            compiled (bool): Predict through the model's NumPy kernel when it has one
+        """
+        self.strategy = strategy
+        self.compiled = compiled
+        self._values = {}
+        # (model, kernel) for the model the kernel was compiled from
+        self._kernel = None
+        # Counters used to confirm that lookups are not falling back to single-row predicts.
+        self.predict_calls = 0
+        self.rows_predicted = 0
+
+    def _predict(self, X):
+        self.predict_calls += 1
+        self.rows_predicted += len(X)
+        model = self.strategy.model
+        if self.compiled:
+            if self._kernel is None or self._kernel[0] is not model:
+                self._kernel = (model, compile_model(model))
+            if self._kernel[1] is not None:
+                return self._kernel[1].predict(X)
+        return model.predict(X)
+
+    def warm(self, players):
+        """
+        Score every player not yet in the cache with a single predict call.
+
+        Args:
+            players (list): Player objects to score
+        """
+        pending = [p for p in players if p not in self._values]
+        if not pending:
+            return
+        X = self.feature_matrix(pending)
+        values = np.asarray(self._predict(X)).ravel().tolist()
+        self._values.update(zip(pending, values))
+
+    def feature_matrix(self, players):
+        """
+        Stack feature rows for players, gathering straight from their PlayerTable
+        columns when the strategy supports it.
+        """
+        if not hasattr(self.strategy, "extract_feature_matrix"):
+            return np.vstack([self.strategy.extract_features(p) for p in players])
+        # Gather rows per table, then put them back in the caller's order
+        groups = {}
+        for i, p in enumerate(players):
+            _, positions, rows = groups.setdefault(id(p.table), (p.table, [], []))
+            positions.append(i)
+            rows.append(p.row)
+        X = None
+        for table, positions, rows in groups.values():
+            block = self.strategy.extract_feature_matrix(table, np.asarray(rows))
+            if X is None:
+                X = np.empty((len(players), block.shape[1]))
+            X[positions] = block
+        return X
+
+    def get(self, player):
+        """
+        Return the cached prediction for a player, scoring it on a miss.
+
+        Args:
+            player: Player object to look up
+
+        Returns:
+            float: Raw model prediction for the player
+        """
+        try:
+            return self._values[player]
+        except KeyError:
+            X = np.vstack([self.strategy.extract_features(player)])
+            value = float(np.asarray(self._predict(X)).ravel()[0])
+            self._values[player] = value
+            return value
+
+    def invalidate(self, players=None):
+        """
+        Drop cached predictions so they are recomputed on the next lookup.
+
+        Args:
+            players (list, optional): Players to drop. Drops everything, including the
+                compiled kernel, when omitted.
+        """
+        if players is None:
+            self._values.clear()
+            self._kernel = None
+            return
+        for p in players:
+            self._values.pop(p, None)
+
+    def __contains__(self, player):
+        return player in self._values
+
+    def __len__(self):
+        return len(self._values)
@@ -0,0 +1,258 @@
+"""
+Benchmark suite for the auction engine.
+
+Generates deterministic synthetic leagues (see auctionengine.synthetic) and measures:
+
+- load: CSV parse time, compiled-cache build and hit time, and tracemalloc peak
+- construct: strategy construction plus first valuation, with a cold and a warm
+  model artifact store
+- auction: per-lot latency of Dealer.conduct_bidding, end-to-end lots per second,
+  lockstep batch-engine auctions per second and the process memory high-water mark,
+  swept over teams, squad sizes and strategy classes; ``--bidder-index`` measures
+  the same cases with the Dealer's EligibleBidderIndex, which is opt-in
+
+Results are written as JSON; pass an earlier results file as --baseline to print
+per-metric ratios and flag regressions. Run from the repository root:
+
+    python -m benchmarks.run --sizes 1000 100000 --out bench.json
+    python -m benchmarks.run --quick --baseline bench.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from auctionengine import artifacts
+from auctionengine.batch import run_batch
+from auctionengine.bidders import EligibleBidderIndex
+from auctionengine.dealer import Dealer
+from auctionengine.events import NullSink
+from auctionengine.synthetic import generate_league
+from auctionengine.team import Team
+from auctionengine.tournament import make_strategy
+from auctionengine.utils import load_all_players
+
+STRATEGIES = ["base", "statistical", "random_forest", "xgboost", "mlp", "bayesian_ridge"]
+
+# Metrics where a larger value is better; every other timing metric is lower-is-better
+HIGHER_IS_BETTER = {"lots_per_s", "batch_auctions_per_s"}
+
+
+def _league(work_dir, size, seed):
+    out_dir = os.path.join(work_dir, f"league-{size}-{seed}")
+    if not os.path.isdir(out_dir):
+        generate_league(out_dir, size, seed=seed)
+    return out_dir
+
+
+def _percentile(values, q):
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+def bench_load(work_dir, size, seed):
+    league = _league(work_dir, size, seed)
+    tracemalloc.start()
+    start = time.perf_counter()
+    players = load_all_players(league, use_cache=False)
+    parse_s = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    shutil.rmtree(os.path.join(league, ".cache"), ignore_errors=True)
+    start = time.perf_counter()
+    load_all_players(league)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    load_all_players(league)
+    hit_s = time.perf_counter() - start
+    return {
+        "players": len(players),
+        "parse_s": parse_s,
+        "cache_build_s": build_s,
+        "cache_hit_s": hit_s,
+        "parse_peak_kb": peak // 1024,
+    }
+
+
+def bench_construct(name, players):
+    results = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        artifacts._default_store = artifacts.ModelArtifactStore(cache_dir)
+        for phase in ("cold", "warm"):
+            start = time.perf_counter()
+            strategy = make_strategy(name, 40.0)
+            if hasattr(strategy, "begin_auction"):
+                strategy.begin_auction(players)
+            results[f"{phase}_s"] = time.perf_counter() - start
+        artifacts._default_store = None
+    return results
+
+
+def bench_auction(players, name, n_teams, squad, lots, batch_auctions, seed, bidder_index=False):
+    random.seed(seed)
+    np.random.seed(seed)
+    teams = [Team(name=f"Team {i}", budget=40.0, max_players=squad) for i in range(n_teams)]
+    # One instance per team, as in a real league; construction is measured separately.
+    strategies = {team.name: make_strategy(name, 40.0) for team in teams}
+    pool = list(players)
+    random.shuffle(pool)
+    pool = pool[:lots]
+    dealer = Dealer(players=pool, teams=teams, strategies=strategies, events=NullSink())
+    if bidder_index:
+        # Lots are driven one by one below, without start_auction building the index
+        dealer.bidder_index = EligibleBidderIndex(teams)
+
+    start = time.perf_counter()
+    dealer.prepare_strategies(dealer.players)
+    latencies = []
+    for player in pool:
+        lot_start = time.perf_counter()
+        dealer.conduct_bidding(player)
+        latencies.append(time.perf_counter() - lot_start)
+    total_s = time.perf_counter() - start
+    if dealer.bidder_index is not None:
+        dealer.bidder_index.detach()
+    dealer.events.flush()
+
+    metrics = {
+        "lot_mean_ms": 1e3 * sum(latencies) / len(latencies),
+        "lot_p50_ms": 1e3 * _percentile(latencies, 50),
+        "lot_p99_ms": 1e3 * _percentile(latencies, 99),
+        "lots_per_s": len(pool) / total_s,
+        "sold": sum(len(t.players) for t in teams),
+    }
+    if batch_auctions:
+        start = time.perf_counter()
+        run_batch(pool, list(strategies.values()), batch_auctions, max_players=squad, seed=seed)
+        metrics["batch_auctions_per_s"] = batch_auctions / (time.perf_counter() - start)
+    metrics["rss_high_water_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return metrics
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _case_key(result):
+    return json.dumps([result["bench"], result["params"]], sort_keys=True)
+
+
+def compare(results, baseline, threshold):
+    """
+    Print metric ratios against a baseline run and return the regressions.
+
+    Args:
+        results (dict): Current results document
+        baseline (dict): Earlier results document
+        threshold (float): Ratio beyond which a metric counts as a regression
+
+    Returns:
+        list: (case, metric, baseline value, current value) for each regression
+    """
+    base = {_case_key(r): r["metrics"] for r in baseline["results"]}
+    regressions = []
+    for result in results["results"]:
+        old = base.get(_case_key(result))
+        if old is None:
+            continue
+        for metric, value in result["metrics"].items():
+            before = old.get(metric)
+            if not before or not (metric.endswith("_s") or metric.endswith("_ms") or metric in HIGHER_IS_BETTER):
+                continue
+            slowdown = before / value if metric in HIGHER_IS_BETTER else value / before
+            flag = "  REGRESSION" if slowdown > threshold else ""
+            print(f"{result['bench']:<10}{json.dumps(result['params'], sort_keys=True):<80}"
+                  f"{metric:<22}{slowdown:>7.2f}x{flag}")
+            if flag:
+                regressions.append((result["params"], metric, before, value))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loading, strategies and auctions.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000], help="synthetic pool sizes")
+    parser.add_argument("--teams", type=int, nargs="+", default=[4, 16, 64, 256], help="teams per auction")
+    parser.add_argument("--squads", type=int, nargs="+", default=[11, 25], help="squad size limits")
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES, help="strategy names")
+    parser.add_argument("--lots", type=int, default=100, help="lots auctioned per auction case")
+    parser.add_argument("--batch-auctions", type=int, default=32,
+                        help="auctions per batch-engine run (0 to skip)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for data and auctions")
+    parser.add_argument("--work-dir", default=os.path.join(tempfile.gettempdir(), "auction-bench"),
+                        help="where synthetic leagues are generated and kept between runs")
+    parser.add_argument("--bidder-index", action="store_true",
+                        help="poll bidders through the Dealer's EligibleBidderIndex")
+    parser.add_argument("--quick", action="store_true", help="small sweep for a fast smoke run")
+    parser.add_argument("--out", default="bench_results.json", help="results file")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="regression ratio threshold")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.sizes, args.teams, args.squads, args.lots = [1000], [4, 16], [11], 40
+
+    results = []
+
+    def record(bench, params, metrics):
+        results.append({"bench": bench, "params": params, "metrics": metrics})
+        print(f"{bench:<10}{json.dumps(params, sort_keys=True):<80}"
+              + " ".join(f"{k}={v:.4g}" for k, v in metrics.items()))
+
+    for size in args.sizes:
+        record("load", {"size": size}, bench_load(args.work_dir, size, args.seed))
+    players = load_all_players(_league(args.work_dir, args.sizes[0], args.seed))
+    for name in args.strategies:
+        record("construct", {"strategy": name, "size": args.sizes[0]}, bench_construct(name, players))
+    for size in args.sizes:
+        players = load_all_players(_league(args.work_dir, size, args.seed))
+        for name in args.strategies:
+            for n_teams in args.teams:
+                for squad in args.squads:
+                    params = {"size": size, "strategy": name, "teams": n_teams, "squad": squad,
+                              "lots": args.lots}
+                    if args.bidder_index:
+                        params["bidder_index"] = True
+                    record("auction", params, bench_auction(players, name, n_teams, squad, args.lots,
+                                                            args.batch_auctions, args.seed, args.bidder_index))
+
+    document = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "numpy": np.__version__,
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+    print(f"\nWrote {len(results)} results to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print()
+        regressions = compare(document, baseline, args.threshold)
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Command line entry point for paired comparisons of two strategy variants.
+
+A variant is a strategy name or a JSON lineup entry with parameters.
+
+Examples:
+    python compare.py statistical bayesian_ridge
+    python compare.py statistical '{"name": "statistical", "params": {"nudge_step": 0.05}}' --precision 0.25
+    python compare.py xgboost random_forest --opponents statistical statistical statistical --all-seats
+"""
+
+import argparse
+import json
+import time
+
+from auctionengine.comparison import compare
+from auctionengine.tournament import DEFAULT_LINEUP
+
+
+def parse_variant(text):
+    """
+    Read a variant given on the command line.
+
+    Args:
+        text (str): Strategy name, or a JSON object with name, params and label
+
+    Returns:
+        str or dict: Lineup entry
+    """
+    return json.loads(text) if text.lstrip().startswith("{") else text
+
+
+def main():
+    """
+    Parse command line options and compare the two variants on common seeds.
+    """
+    parser = argparse.ArgumentParser(description="Compare two strategy variants with paired auctions.")
+    parser.add_argument("a", type=parse_variant, help="first variant: strategy name or JSON entry")
+    parser.add_argument("b", type=parse_variant, help="second variant: strategy name or JSON entry")
+    parser.add_argument("--opponents", nargs="+", default=DEFAULT_LINEUP[1:], help="opponent strategy per seat")
+    parser.add_argument("--precision", type=float, default=0.5,
+                        help="stop once the 95%% interval on the stars difference is this narrow")
+    parser.add_argument("--min-blocks", type=int, default=20, help="seeds played before stopping is considered")
+    parser.add_argument("--max-blocks", type=int, default=1000, help="most seeds to play")
+    parser.add_argument("--no-antithetic", action="store_true", help="do not also play each lot order reversed")
+    parser.add_argument("--all-seats", action="store_true", help="play every seed from every seat")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first block")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--budget", type=float, default=40.0, help="starting budget per team in Cr")
+    parser.add_argument("--max-players", type=int, default=11, help="squad size limit")
+    parser.add_argument("--out", metavar="PATH", help="also write the result as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = compare(args.a, args.b, opponents=args.opponents, precision=args.precision,
+                     min_blocks=args.min_blocks, max_blocks=args.max_blocks, antithetic=not args.no_antithetic,
+                     all_seats=args.all_seats, base_seed=args.seed, workers=args.workers,
+                     budget=args.budget, max_players=args.max_players)
+    print(result.format_report())
+    print(f"  ({time.perf_counter() - start:.1f}s)")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(result.to_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
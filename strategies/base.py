@@ -9,6 +9,8 @@ and make bidding decisions.
 import random
 import numpy as np
 from sklearn.linear_model import LinearRegression
+from auctionengine.money import raise_bid, raise_bids
+from auctionengine.valuation import ValuationCache
 
 class BiddingStrategy:
     """
@@ -19,17 +21,69 @@ class BiddingStrategy:
     with more sophisticated ML or RL approaches.
     """
 
-    def __init__(self):
+    def __init__(self, aggressive_below=0.8, aggressive_step=0.2, nudge_step=0.1, nudge_probability=0.3):
         """
         Initialize the bidding strategy with a simple linear regression model.
         
         The model uses fake coefficients for demonstration purposes.
         In a real implementation, these would be learned from historical data.
+
+        Args:
+            aggressive_below (float): Fraction of the estimated value below which bids are aggressive
+            aggressive_step (float): Increment of an aggressive bid in Cr
+            nudge_step (float): Increment of a conservative bid in Cr
+            nudge_probability (float): Chance of a conservative bid once above the aggressive range
         """
+        self.aggressive_below = aggressive_below
+        self.aggressive_step = aggressive_step
+        self.nudge_step = nudge_step
+        self.nudge_probability = nudge_probability
         self.model = LinearRegression()
         # Initialize with dummy coefficients for batting average, strike rate, and economy
         self.model.coef_ = np.array([0.1, 0.05, 0.2])  # [bat_avg, strike_rate, economy]
         self.model.intercept_ = 1.0  # Base value for all players
+        self.valuations = ValuationCache(self)
+        self.rng = random
+
+    def extract_features(self, player):
+        """
+        Build the model feature row for a player.
+
+        Args:
+            player: Player object containing stats
+
+        Returns:
+            numpy.ndarray: Feature row [bat_avg, strike_rate, economy]
+        """
+        # Extract key statistics with default values if not available
+        bat_avg = player.stats.get('bat_avg', 20)
+        strike_rate = player.stats.get('strike_rate', 120)
+        economy = player.stats.get('economy', 8)
+        return np.array([bat_avg, strike_rate, economy])
+
+    def extract_feature_matrix(self, table, rows):
+        """
+        Build feature rows for many players of one PlayerTable at once.
+
+        Args:
+            table: PlayerTable holding the players
+            rows (numpy.ndarray): Row indices into the table
+
+        Returns:
+            numpy.ndarray: Matrix with one feature row per player
+        """
+        features = table.features[rows]
+        # 'bat_avg' is not a recorded stat, so it always takes its default
+        return np.column_stack((np.full(len(rows), 20.0), features[:, 1], features[:, 2]))
+
+    def begin_auction(self, players):
+        """
+        Score the whole player pool up front so bidding only does cache lookups.
+
+        Args:
+            players (list): Player objects that will be auctioned
+        """
+        self.valuations.warm(players)
 
     def estimate_value(self, player):
         """
@@ -41,18 +95,42 @@ class BiddingStrategy:
         Returns:
             float: Estimated value of the player in crores
         """
-        # Extract key statistics with default values if not available
-        bat_avg = player.stats.get('bat_avg', 20)
-        strike_rate = player.stats.get('strike_rate', 120)
-        economy = player.stats.get('economy', 8)
-
-        # Prepare features for prediction
-        X = np.array([[bat_avg, strike_rate, economy]])
-        predicted_value = self.model.predict(X)[0]
+        predicted_value = self.valuations.get(player)
         
         # Ensure prediction is not below base price
         return max(predicted_value, player.base_price)
 
+    def batch_values(self, players):
+        """
+        Estimated value of every player, for the batch engine (auctionengine.batch).
+
+        Args:
+            players (list): Player objects in pool order
+
+        Returns:
+            numpy.ndarray: Estimated value per player
+        """
+        self.valuations.warm(players)
+        return np.array([self.estimate_value(p) for p in players])
+
+    def decide_bids(self, values, current_bids, budgets, rng):
+        """
+        Vectorized decide_bid over many concurrent auctions.
+
+        Args:
+            values (numpy.ndarray): batch_values entries of the player on the block in each auction
+            current_bids (numpy.ndarray): Current highest bid in each auction
+            budgets (numpy.ndarray): This team's remaining budget in each auction
+            rng (numpy.random.Generator): Random stream replacing random.random()
+
+        Returns:
+            numpy.ndarray: New bid per auction (the current bid where holding)
+        """
+        aggressive = current_bids < self.aggressive_below * values
+        nudge = rng.random(len(current_bids)) < self.nudge_probability
+        return np.where(aggressive, raise_bids(current_bids, self.aggressive_step),
+                        np.where(nudge, raise_bids(current_bids, self.nudge_step), current_bids))
+
     def decide_bid(self, player, current_bid):
         """
         Decide whether to place a bid and how much to bid.
@@ -68,13 +146,13 @@ class BiddingStrategy:
         estimated_value = self.estimate_value(player)
 
         # Implement bidding logic
-        if current_bid < (0.8 * estimated_value):
+        if current_bid < (self.aggressive_below * estimated_value):
             # Aggressive bidding if current bid is significantly below estimated value
-            return round(current_bid + 0.2, 2)
+            return raise_bid(current_bid, self.aggressive_step)
         else:
-            # Conservative bidding with 30% chance of small increment
-            if random.random() < 0.3:
-                return round(current_bid + 0.1, 2)
+            # Conservative bidding with a small chance of a small increment
+            if self.rng.random() < self.nudge_probability:
+                return raise_bid(current_bid, self.nudge_step)
             else:
                 return current_bid
             
\ No newline at end of file
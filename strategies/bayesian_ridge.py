@@ -1,21 +1,71 @@
+import sklearn
 from sklearn.linear_model import BayesianRidge
 import numpy as np
+from auctionengine.artifacts import default_store
+from auctionengine.money import raise_bid, raise_bids, to_crore, to_lakhs
 from auctionengine.player import Player
+from auctionengine.player_table import FEATURE_COLUMNS
+from auctionengine.valuation import ValuationCache
 
 class BayesianRidgeBiddingStrategy:
-    def __init__(self, model=None, total_budget=100):
+    # Player attributes the model features are computed from
+    FEATURE_STATS = FEATURE_COLUMNS + ("stars", "base_price")
+
+    def __init__(self, model=None, total_budget=100, seed=0, artifact_store=None, trained_version=None,
+                 aggressive_below=0.7, aggressive_step_min=0.2, aggressive_step_max=0.5, nudge_step_min=0.05,
+                 nudge_step_max=0.2, market_min=0.9, market_max=1.1):
         self.total_budget = total_budget
+        # Spending in lakhs
         self.spent_budget = 0
-        self.model = model or self._train_default_model()
+        self.seed = seed
+        self.artifact_store = artifact_store
+        # None fits the default model; "latest" or a version number loads one published by train.py
+        self.trained_version = trained_version
+        # The default model is loaded (or trained) on first use, not at construction
+        self._model = model
+        # Only the raw model output is cached; the market factor and budget cap are
+        # applied per call, so spending never requires invalidating the cache.
+        self.valuations = ValuationCache(self)
+        self.rng = np.random
+        # Bids rise by a uniform step in [aggressive_step_min, aggressive_step_max] while
+        # below aggressive_below of the allowed price, then in [nudge_step_min, nudge_step_max];
+        # valuations are scaled by a uniform market factor in [market_min, market_max]
+        self.aggressive_below = aggressive_below
+        self.aggressive_step_min = aggressive_step_min
+        self.aggressive_step_max = aggressive_step_max
+        self.nudge_step_min = nudge_step_min
+        self.nudge_step_max = nudge_step_max
+        self.market_min = market_min
+        self.market_max = market_max
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = self._train_default_model()
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+        self.valuations.invalidate()
 
     def _train_default_model(self):
+        store = self.artifact_store or default_store()
+        if self.trained_version is not None:
+            # A model published by the training pipeline (auctionengine.training), only on request
+            return store.trained(type(self).__name__, self.trained_version)
         # Simulating realistic auction data for better training
-        X_train = np.random.rand(1000, 5)  
-        y_train = (X_train[:, 0] * 8) + (X_train[:, 1] * 5) + (X_train[:, 2] * 3) + (np.random.rand(1000) * 2)
-        
-        model = BayesianRidge(alpha_1=1e-6, lambda_1=1e-6)  
-        model.fit(X_train, y_train)
-        return model
+        rng = np.random.RandomState(self.seed)
+        X_train = rng.rand(1000, 5)  
+        y_train = (X_train[:, 0] * 8) + (X_train[:, 1] * 5) + (X_train[:, 2] * 3) + (rng.rand(1000) * 2)
+
+        def train(X, y):
+            model = BayesianRidge(alpha_1=1e-6, lambda_1=1e-6)  
+            model.fit(X, y)
+            return model
+
+        params = {"alpha_1": 1e-6, "lambda_1": 1e-6, "sklearn": sklearn.__version__}
+        return store.get_or_train(type(self).__name__, params, X_train, y_train, self.seed, train)
 
     def extract_features(self, player: Player):
         """Extracts enhanced features for valuation."""
@@ -27,28 +77,67 @@ class BayesianRidgeBiddingStrategy:
             np.clip(player.base_price / 5, 0, 1)  # Normalize base price
         ]).reshape(1, -1)
 
+    def extract_feature_matrix(self, table, rows):
+        """Vectorized extract_features for rows of a PlayerTable."""
+        features = table.features[rows]
+        return np.column_stack((
+            features[:, 0] / 50,
+            features[:, 1] / 200,
+            features[:, 2] / 15,
+            table.columns["stars"][rows] / 10,
+            np.clip(table.base_prices[rows] / 5, 0, 1),
+        ))
+
+    def begin_auction(self, players):
+        self.valuations.warm(players)
+
     def estimate_value(self, player: Player):
-        features = self.extract_features(player)
-        predicted_value = self.model.predict(features)[0]
+        predicted_value = self.valuations.get(player)
         
         # Introduce a market adjustment factor based on demand
-        market_factor = np.random.uniform(0.9, 1.1)
+        market_factor = self.rng.uniform(self.market_min, self.market_max)
         return max(predicted_value * market_factor, player.base_price)
 
     def decide_bid(self, player: Player, current_bid: float):
         estimated_value = self.estimate_value(player)
-        remaining_budget = self.total_budget - self.spent_budget
+        remaining_budget = self.remaining_budget()
         max_allowed = min(estimated_value, remaining_budget)
 
         # Adaptive bidding: More aggressive early, conservative later
-        if current_bid < 0.7 * max_allowed:
-            new_bid = round(current_bid + np.random.uniform(0.2, 0.5), 2)
+        if current_bid < self.aggressive_below * max_allowed:
+            new_bid = raise_bid(current_bid, self.rng.uniform(self.aggressive_step_min, self.aggressive_step_max))
         elif current_bid < max_allowed:
-            new_bid = round(current_bid + np.random.uniform(0.05, 0.2), 2)
+            new_bid = raise_bid(current_bid, self.rng.uniform(self.nudge_step_min, self.nudge_step_max))
         else:
             new_bid = current_bid
 
         return min(new_bid, max_allowed)
 
+    def batch_values(self, players):
+        """Raw model prediction and base price per player, for the batch engine."""
+        self.valuations.warm(players)
+        return np.array([(self.valuations.get(p), p.base_price) for p in players])
+
+    def decide_bids(self, values, current_bids, budgets, rng):
+        """Vectorized decide_bid over many concurrent auctions (see auctionengine.batch)."""
+        n = len(current_bids)
+        market_factor = rng.uniform(self.market_min, self.market_max, n)
+        estimated_value = np.maximum(values[:, 0] * market_factor, values[:, 1])
+        remaining_budget = self.remaining_budget()
+        max_allowed = np.minimum(estimated_value, remaining_budget)
+
+        new_bid = np.where(
+            current_bids < self.aggressive_below * max_allowed,
+            raise_bids(current_bids, rng.uniform(self.aggressive_step_min, self.aggressive_step_max, n)),
+            np.where(current_bids < max_allowed,
+                     raise_bids(current_bids, rng.uniform(self.nudge_step_min, self.nudge_step_max, n)),
+                     current_bids))
+        return np.minimum(new_bid, max_allowed)
+
+    def remaining_budget(self):
+        """Budget left in Cr."""
+        return to_crore(to_lakhs(self.total_budget) - self.spent_budget)
+
     def update_spent(self, winning_bid):
-        self.spent_budget += winning_bid
+        """Record a purchase at winning_bid Cr."""
+        self.spent_budget += to_lakhs(winning_bid)
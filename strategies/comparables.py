@@ -0,0 +1,272 @@
+"""
+Comparables Bidding Strategy Module
+
+This module implements a strategy that values a player from the prices paid for
+similar players in the same auction, the way a property is valued from recent sales
+nearby.
+
+When the pool is known (begin_auction), every player becomes a vector of the
+statistics its role records: stars, base price and the role-specific columns of
+stat_schema (wickets, bowling_sr, catches, stumpings, hundreds, ...). Counts are
+log-scaled, since a player with 8000 runs is not 40 times one with 200, and every
+column is standardized over the role's players. One tree per role (sklearn's KDTree,
+or a BallTree with ``tree="ball"``) is built once, in O(n log n).
+
+At a lot, the k nearest comparables of the player on the block are found in
+O(log n) and the player is valued at their inverse-distance weighted price:
+
+- a comparable already sold counts at its realized price;
+- one that went unsold counts at its base price, which nobody paid;
+- one still to come counts at a prior estimate from a base strategy, times a market
+  factor learned from every sale so far (the shrunk geometric mean of realized over
+  prior prices).
+
+Sales update the prices and the factor online in lot_closed, so later lots are
+valued more and more from the market itself. The bid rule is deterministic and is
+offered to the fast clearing engine as a bid policy: raise by aggressive_step below
+aggressive_below of the cap, by nudge_step while that stays under the cap, and hold
+otherwise. The cap is the lower of the valuation and a paced share of the budget
+left: ``pace`` times the budget per open squad slot, so the comparables of an
+expensive player do not spend the budget on the first few lots.
+
+With a lot source, the index covers the current chunk.
+"""
+
+import math
+
+import numpy as np
+from sklearn.neighbors import BallTree, KDTree
+
+from auctionengine.money import raise_bid, to_crore, to_lakhs
+from auctionengine.player_table import stat_schema
+from strategies import registry
+from strategies.market import MarketFactor, prior_price
+
+# Count columns compared on a log scale; stars and age are already on a small scale
+_LINEAR_STATS = ("stars", "age")
+
+
+class ComparablesBiddingStrategy:
+    def __init__(self, total_budget, base="statistical", base_params=None, neighbours=8, tree="kd",
+                 leaf_size=40, smoothing=0.5, prior_sales=3.0, squad_size=11, pace=1.0, aggressive_below=0.8,
+                 aggressive_step=0.2, nudge_step=0.1):
+        """
+        Args:
+            total_budget (float): Total capital available (in Cr)
+            base (str): Registry name of the strategy giving prior price estimates
+            base_params (dict, optional): Constructor arguments of the base strategy
+            neighbours (int): Comparables per valuation (k)
+            tree (str): "kd" for a KD-tree, "ball" for a ball tree
+            leaf_size (int): Leaf size of the trees
+            smoothing (float): Added to distances before inverting them into weights, in
+                standard deviations, so an exact twin does not take all the weight
+            prior_sales (float): Weight of the prior market factor of 1 against observed sales
+            squad_size (int): Players the team means to buy
+            pace (float): Most of the budget per open squad slot to pay for one player
+            aggressive_below (float): Fraction of the cap below which bids are aggressive
+            aggressive_step (float): Increment of an aggressive bid in Cr
+            nudge_step (float): Increment of a bid closer to the cap in Cr
+        """
+        self.total_budget = total_budget
+        self.base = registry.create(base, budget=total_budget, **(base_params or {}))
+        self.neighbours = neighbours
+        self.tree_class = {"kd": KDTree, "ball": BallTree}[tree]
+        self.leaf_size = leaf_size
+        self.smoothing = smoothing
+        self.prior_sales = prior_sales
+        self.squad_size = squad_size
+        self.pace = pace
+        self.aggressive_below = aggressive_below
+        self.aggressive_step = aggressive_step
+        self.nudge_step = nudge_step
+        self.new_auction()
+
+    def new_auction(self):
+        """
+        Forget the index, the sales and this team's spending.
+        """
+        # Spending in lakhs
+        self.spent = 0
+        self.bought = 0
+        # role -> _RoleIndex, and player -> (role index, row)
+        self.indexes = {}
+        self._rows = {}
+        self.market = MarketFactor(self.prior_sales)
+        self._lot = None
+        self._cap = None
+        if hasattr(self.base, "new_auction"):
+            self.base.new_auction()
+
+    def begin_auction(self, players):
+        """
+        Build one nearest-neighbour index per role over the upcoming players.
+
+        Args:
+            players (list): Player objects about to be auctioned
+        """
+        if hasattr(self.base, "begin_auction"):
+            self.base.begin_auction(players)
+        by_role = {}
+        for player in players:
+            by_role.setdefault(player.role, []).append(player)
+        self.indexes, self._rows = {}, {}
+        for role, group in by_role.items():
+            index = _RoleIndex(role, group, self.prior_price, self.tree_class, self.leaf_size)
+            self.indexes[role] = index
+            for row, player in enumerate(group):
+                self._rows[player] = (index, row)
+
+    def prior_price(self, player):
+        """
+        Price estimate of a player from the base strategy, at least its base price.
+        """
+        return prior_price(self.base, player)
+
+    def market_factor(self):
+        """
+        Geometric mean of realized over prior prices, shrunk towards 1 by the prior.
+        """
+        return math.exp(self.market.log_factor())
+
+    def lot_closed(self, player, price, won):
+        """
+        Record the sale for later valuations and learn the market factor.
+
+        Args:
+            player: Player object whose lot closed
+            price (float): Winning bid, 0.0 if unsold
+            won (bool): Whether this team bought the player
+        """
+        if won:
+            self.spent += to_lakhs(price)
+            self.bought += 1
+        entry = self._rows.get(player)
+        if entry is not None:
+            index, row = entry
+            if price > 0:
+                index.price[row] = price
+                self.market.add(price, index.prior[row])
+            else:
+                index.price[row] = player.base_price
+        if hasattr(self.base, "lot_closed"):
+            self.base.lot_closed(player, price, won)
+
+    def comparables(self, player):
+        """
+        The player's nearest comparables in its role.
+
+        Args:
+            player: Player object in the index
+
+        Returns:
+            tuple: (rows, distances) of up to ``neighbours`` other players of the role,
+            nearest first
+        """
+        index, row = self._rows[player]
+        k = min(self.neighbours + 1, len(index.prior))
+        distances, rows = index.tree.query(index.vectors[row:row + 1], k=k)
+        rows, distances = rows[0], distances[0]
+        keep = rows != row
+        return rows[keep][:self.neighbours], distances[keep][:self.neighbours]
+
+    def estimate_value(self, player):
+        """
+        Value of a player from the prices of its comparables.
+
+        Args:
+            player: Player object
+
+        Returns:
+            float: Weighted price of the comparables; the prior estimate times the
+            market factor for a player outside the index or without comparables
+        """
+        factor = self.market_factor()
+        if player not in self._rows:
+            return self.prior_price(player) * factor
+        index, _ = self._rows[player]
+        rows, distances = self.comparables(player)
+        if len(rows) == 0:
+            return self.prior_price(player) * factor
+        prices = index.price[rows]
+        prices = np.where(np.isnan(prices), index.prior[rows] * factor, prices)
+        weights = 1.0 / (distances + self.smoothing)
+        return max(float(weights @ prices / weights.sum()), player.base_price)
+
+    def cap(self, player):
+        """
+        Most this team pays for the player: its valuation, at most a paced share of
+        the budget left. Computed once per lot, since valuations change only when a
+        lot closes.
+        """
+        if self._lot is not player:
+            self._lot = player
+            left = to_crore(to_lakhs(self.total_budget) - self.spent)
+            slots = max(self.squad_size - self.bought, 1)
+            self._cap = min(self.estimate_value(player), left * min(self.pace / slots, 1.0))
+        return self._cap
+
+    def bid_policy(self, player):
+        """
+        Piecewise bidding rule for the fast clearing engine (see auctionengine.clearing).
+
+        Args:
+            player: Player object being auctioned
+
+        Returns:
+            list: (threshold, increment) segments, first match wins
+        """
+        cap = self.cap(player)
+        return [(self.aggressive_below * cap, self.aggressive_step), (cap - self.nudge_step, self.nudge_step)]
+
+    def decide_bid(self, player, current_bid):
+        """
+        Raise towards the cap, fast while far below it.
+
+        Args:
+            player: Player object
+            current_bid (float): Current auction bid
+
+        Returns:
+            float: New bid amount or current bid if holding
+        """
+        for threshold, step in self.bid_policy(player):
+            if current_bid < threshold:
+                return raise_bid(current_bid, step)
+        return current_bid
+
+
+class _RoleIndex:
+    def __init__(self, role, players, prior_price, tree, leaf_size):
+        """
+        Standardized stat vectors of one role's players, their tree, prior and
+        realized prices.
+
+        Args:
+            role (str): Role of every player
+            players (list): Player objects of the role
+            prior_price (callable): Prior price estimate of a player
+            tree: KDTree or BallTree class
+            leaf_size (int): Leaf size of the tree
+        """
+        keys = ["stars"] + [key for key, _, dtype, _ in stat_schema(role) if dtype is not str and key != "stars"]
+        columns = [np.empty(len(players)) for _ in keys]
+        base_price = np.empty(len(players))
+        # Gather table by table, so a pool of views costs one fancy index per column
+        by_table = {}
+        for i, player in enumerate(players):
+            by_table.setdefault(id(player.table), (player.table, [], []))
+            _, positions, rows = by_table[id(player.table)]
+            positions.append(i)
+            rows.append(player.row)
+        for table, positions, rows in by_table.values():
+            for column, key in zip(columns, keys):
+                column[positions] = table.column(key)[rows]
+            base_price[positions] = table.base_prices[rows]
+        columns = [c if key in _LINEAR_STATS else np.log1p(np.maximum(c, 0)) for c, key in zip(columns, keys)]
+        vectors = np.column_stack(columns + [np.log(np.maximum(base_price, 1e-9))])
+        scale = vectors.std(axis=0)
+        self.vectors = (vectors - vectors.mean(axis=0)) / np.where(scale > 0, scale, 1.0)
+        self.tree = tree(self.vectors, leaf_size=leaf_size)
+        self.prior = np.array([prior_price(p) for p in players])
+        # Realized price per player, NaN until its lot closes
+        self.price = np.full(len(players), np.nan)
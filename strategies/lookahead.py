@@ -0,0 +1,229 @@
+"""
+Lookahead Bidding Strategy Module
+
+This module implements a strategy that decides each raise by simulating the rest of
+the auction. Before raising to X it compares two futures from the live AuctionState
+the Dealer keeps for it (see auctionengine.state):
+
+- it wins the lot at X;
+- it drops out and the most willing opponent takes the lot at the current bid.
+
+For each future the state is changed with ``close_lot``, forked into a batch of worlds
+and played forward ``horizon`` lots with a cheap policy, then restored. Both futures
+start from the same generator state, so they see the same random numbers and their
+difference is measured with little noise. The strategy raises if winning at X is
+worth more stars, counting those still affordable after the horizon, than dropping out.
+
+Batches of rollouts are played until ``time_budget`` seconds have passed since the
+decision started, or ``max_batches`` have been played. Another batch starts only if
+one more of the same length still fits in the budget. At least one batch is always
+played, so the batch size and horizon set the minimum latency. How many batches fit
+in the budget depends on the machine; ``time_budget=None`` with a fixed
+``max_batches`` makes a seeded auction reproducible. Decisions within a lot are cached. Once a price is found not
+worth paying, every higher price in the lot is held without further rollouts. Once a
+price is found worth paying, every lower price is raised.
+
+Rollout willingness to pay is a base strategy's price estimate per player, times a
+per-team price factor learned from the sales seen so far, with lognormal noise.
+Without a live state (the batch engine, the asyncio Dealer) the strategy bids like
+its base strategy.
+"""
+
+import math
+import random
+import time
+
+import numpy as np
+
+from auctionengine.money import to_crore, to_lakhs
+from auctionengine.state import RolloutPolicy
+from strategies import registry
+from strategies.market import MarketFactor, prior_price
+
+
+class LookaheadBiddingStrategy:
+    def __init__(self, total_budget, base="statistical", base_params=None, time_budget=0.005, max_batches=None,
+                 worlds=32, horizon=24, bid_step=0.1, noise=0.25, prior_sales=2.0):
+        """
+        Args:
+            total_budget (float): Total capital available (in Cr)
+            base (str): Registry name of the strategy giving price estimates and fallback bids
+            base_params (dict, optional): Constructor arguments of the base strategy
+            time_budget (float): Seconds of rollouts per decision, after the first batch.
+                None plays max_batches batches whatever they take, which makes seeded
+                auctions reproducible.
+            max_batches (int, optional): Most rollout batches per decision (1 if
+                time_budget is None and this is not given)
+            worlds (int): Rollouts per future in a batch
+            horizon (int): Lots simulated after the one on the block
+            bid_step (float): Increment of a raise in Cr
+            noise (float): Standard deviation of rollout log willingness to pay
+            prior_sales (float): Weight of the prior price factor of 1 against observed sales
+        """
+        self.total_budget = total_budget
+        self.base = registry.create(base, budget=total_budget, **(base_params or {}))
+        self.time_budget = time_budget
+        self.max_batches = max_batches
+        self.worlds = worlds
+        self.horizon = horizon
+        self.bid_step = bid_step
+        self._step = to_lakhs(bid_step)
+        self.noise = noise
+        self.prior_sales = prior_sales
+        self.rng = np.random
+        self.state = None
+        self.seat = None
+        self._values = {}
+        # Price factor per buying seat
+        self.market = None
+        self._reset_lot(None)
+        # Decisions made by rollouts, and rollouts played, for profiling
+        self.evaluations = 0
+        self.rollouts = 0
+
+    def _reset_lot(self, lot):
+        self._lot = lot
+        # Highest price found worth paying and lowest found not worth paying this lot, in lakhs
+        self._raise_to = -math.inf
+        self._hold_from = math.inf
+        self._last_bid = None
+
+    def new_auction(self):
+        """
+        Forget learned price factors and give the base strategy a stream of its own.
+        """
+        self.market = None
+        if isinstance(self.rng, np.random.Generator) and hasattr(self.base, "rng"):
+            seed = int(self.rng.integers(2 ** 63))
+            self.base.rng = (random.Random(seed) if self.base.rng is random or isinstance(self.base.rng, random.Random)
+                             else np.random.default_rng(seed))
+        if hasattr(self.base, "new_auction"):
+            self.base.new_auction()
+
+    def begin_auction(self, players):
+        if hasattr(self.base, "begin_auction"):
+            self.base.begin_auction(players)
+
+    def watch_auction(self, state, seat):
+        """
+        Take the live state of the upcoming lots from the Dealer.
+
+        Args:
+            state (AuctionState): State the Dealer closes every lot on
+            seat (int): This team's seat in the state
+        """
+        self.state = state
+        self.seat = seat
+        teams = len(state.budgets)
+        if self.market is None or len(self.market.sales) != teams:
+            self.market = MarketFactor(self.prior_sales, teams)
+        self.values = np.array([self.market_value(player) for player in state.pool.players])
+        self._reset_lot(None)
+
+    def market_value(self, player):
+        """
+        Price estimate of a player from the base strategy.
+        """
+        if player.name not in self._values:
+            self._values[player.name] = prior_price(self.base, player)
+        return self._values[player.name]
+
+    def lot_closed(self, player, price, won):
+        """
+        Learn the buyer's price factor from the sale, and pass the lot on to the base strategy.
+        """
+        state = self.state
+        if state is not None and state.last_sale is not None:
+            i, seat, paid = state.last_sale
+            if seat is not None and paid > 0:
+                self.market.add(to_crore(paid), self.values[i], seat)
+        if hasattr(self.base, "lot_closed"):
+            self.base.lot_closed(player, price, won)
+
+    def policy(self):
+        """
+        Rollout policy from the current price factors, shrunk towards 1 by the prior.
+        """
+        return RolloutPolicy(self.values, self.market.log_factor(), self.noise)
+
+    def gain(self, price, floor):
+        """
+        Expected stars from winning the lot on the block at ``price`` rather than
+        letting an opponent take it at ``floor``.
+
+        Args:
+            price (int): Price of the raise in lakhs
+            floor (int): Current bid in lakhs
+
+        Returns:
+            float: Mean paired difference over the rollouts played
+        """
+        state, seat = self.state, self.seat
+        policy = self.policy()
+        willing = self.values[state.lot] * np.exp(policy.log_factors)
+        others = (state.counts < state.max_players) & (state.budgets >= floor)
+        others[seat] = False
+        taker = int(np.argmax(np.where(others, willing, -np.inf))) if others.any() else None
+
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        batches = self.max_batches or (1 if deadline is None else math.inf)
+        total, played = 0.0, 0
+        while batches > 0:
+            batches -= 1
+            started = time.perf_counter()
+            snapshot = state.snapshot()
+            state.close_lot(seat, price)
+            won = state.fork(self.worlds)
+            won.play(policy, self.horizon)
+            # Same generator state, so the second future sees the same random numbers
+            state.restore(snapshot)
+            state.close_lot(taker, floor)
+            lost = state.fork(self.worlds)
+            lost.play(policy, self.horizon)
+            state.restore(snapshot, rng=False)
+
+            difference = (won.stars[:, seat] + won.terminal_value(seat, policy)
+                          - lost.stars[:, seat] - lost.terminal_value(seat, policy))
+            total += float(difference.sum())
+            played += self.worlds
+            # Stop unless another batch of the same length still fits in the budget
+            now = time.perf_counter()
+            if deadline is not None and now + (now - started) > deadline:
+                break
+        self.evaluations += 1
+        self.rollouts += 2 * played
+        return total / played
+
+    def decide_bid(self, player, current_bid):
+        """
+        Raise by bid_step if winning at the raised price beats dropping out.
+
+        Args:
+            player: Player object
+            current_bid (float): Current auction bid
+
+        Returns:
+            float: New bid amount or current bid if holding
+        """
+        state = self.state
+        if state is None or state.lot is None or state.pool.players[state.lot] is not player:
+            return self.base.decide_bid(player, current_bid)
+        if state.lot != self._lot:
+            self._reset_lot(state.lot)
+        current = to_lakhs(current_bid)
+        if current == self._last_bid:
+            return current_bid  # our own bid still stands
+        seat = self.seat
+        bid = current + self._step
+        if bid > state.budgets[seat] or state.counts[seat] >= state.max_players[seat]:
+            return current_bid
+        if bid >= self._hold_from:
+            return current_bid
+        if bid > self._raise_to:
+            if self.gain(bid, current) > 0:
+                self._raise_to = bid
+            else:
+                self._hold_from = bid
+                return current_bid
+        self._last_bid = bid
+        return to_crore(bid)
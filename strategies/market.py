@@ -0,0 +1,56 @@
+"""
+Market price estimates shared by the strategies that learn from an auction's sales.
+
+A prior price comes from a base strategy's estimate, never below the base price. The
+market factor is the geometric mean of realized over prior prices, shrunk towards 1
+by ``prior_sales`` pseudo-sales at the prior, so a few early sales do not swing it.
+"""
+
+import math
+
+import numpy as np
+
+
+def prior_price(base, player):
+    """
+    Price estimate of a player from a base strategy, at least its base price.
+
+    Args:
+        base: Strategy with ``predict_price(player)`` or ``estimate_value(player)``
+        player: Player object
+
+    Returns:
+        float: Price in Cr
+    """
+    estimate = getattr(base, "predict_price", None) or base.estimate_value
+    return max(float(estimate(player)), player.base_price)
+
+
+class MarketFactor:
+    def __init__(self, prior_sales, seats=None):
+        """
+        Running market factor of one market, or of every seat when ``seats`` is given.
+
+        Args:
+            prior_sales (float): Weight of the prior factor of 1 against observed sales
+            seats (int, optional): Keep a factor per buying seat
+        """
+        self.prior_sales = prior_sales
+        # Summed log(realized / prior price) and number of sales
+        self.log_ratio = 0.0 if seats is None else np.zeros(seats)
+        self.sales = 0 if seats is None else np.zeros(seats)
+
+    def add(self, price, prior, seat=None):
+        """
+        Record a sale at ``price`` of a player whose prior price was ``prior``.
+        """
+        if seat is None:
+            self.log_ratio += math.log(price / prior)
+            self.sales += 1
+        else:
+            self.log_ratio[seat] += math.log(price / prior)
+            self.sales[seat] += 1
+
+    def log_factor(self):
+        """Log of the shrunk factor, per seat when kept per seat."""
+        return self.log_ratio / (self.sales + self.prior_sales)
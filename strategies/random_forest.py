@@ -1,33 +1,101 @@
 import numpy as np
+import sklearn
 from sklearn.ensemble import RandomForestRegressor
+from auctionengine.artifacts import default_store
+from auctionengine.money import raise_bid, raise_bids
 from auctionengine.player import Player
+from auctionengine.player_table import FEATURE_COLUMNS
+from auctionengine.valuation import ValuationCache
 
 class RandomForestBiddingStrategy:
-    def __init__(self, model=None, n_estimators=100):
-        self.model = model or self._train_default_model(n_estimators)
+    # Player attributes the model features are computed from
+    FEATURE_STATS = FEATURE_COLUMNS
+
+    def __init__(self, model=None, n_estimators=100, seed=0, artifact_store=None, trained_version=None,
+                 aggressive_below=0.85, aggressive_step=0.15, nudge_step=0.05):
+        self.n_estimators = n_estimators
+        self.seed = seed
+        # Bid while below aggressive_below of the estimated value in aggressive_step
+        # increments, then in nudge_step increments up to the value itself
+        self.aggressive_below = aggressive_below
+        self.aggressive_step = aggressive_step
+        self.nudge_step = nudge_step
+        self.artifact_store = artifact_store
+        # None fits the default model; "latest" or a version number loads one published by train.py
+        self.trained_version = trained_version
+        # The default model is loaded (or trained) on first use, not at construction
+        self._model = model
+        self.valuations = ValuationCache(self)
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = self._train_default_model(self.n_estimators)
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+        self.valuations.invalidate()
 
     def _train_default_model(self, n_estimators):
-        X_train = np.random.rand(500, 3)
-        y_train = np.random.rand(500) * 10  
+        store = self.artifact_store or default_store()
+        if self.trained_version is not None:
+            # A model published by the training pipeline (auctionengine.training), only on request
+            return store.trained(type(self).__name__, self.trained_version)
+        rng = np.random.RandomState(self.seed)
+        X_train = rng.rand(500, 3)
+        y_train = rng.rand(500) * 10  
 
-        model = RandomForestRegressor(n_estimators=n_estimators)
-        model.fit(X_train, y_train)
-        return model
+        def train(X, y):
+            model = RandomForestRegressor(n_estimators=n_estimators, random_state=self.seed)
+            model.fit(X, y)
+            return model
 
-    def estimate_value(self, player: Player):
-        features = np.array([
+        params = {"n_estimators": n_estimators, "sklearn": sklearn.__version__}
+        return store.get_or_train(type(self).__name__, params, X_train, y_train, self.seed, train)
+
+    def extract_features(self, player: Player):
+        return np.array([
             player.stats.get('batting_avg', 20) / 50,
             player.stats.get('strike_rate', 120) / 200,
             player.stats.get('economy', 8) / 15
-        ]).reshape(1, -1)
+        ])
+
+    def extract_feature_matrix(self, table, rows):
+        return table.features[rows] / np.array([50, 200, 15])
 
-        predicted_value = self.model.predict(features)[0]
+    def begin_auction(self, players):
+        self.valuations.warm(players)
+
+    def estimate_value(self, player: Player):
+        predicted_value = self.valuations.get(player)
         return max(predicted_value, player.base_price)
 
+    def bid_policy(self, player: Player):
+        """
+        Describe decide_bid as (threshold, increment) segments for the fast clearing engine.
+        """
+        estimated_value = self.estimate_value(player)
+        return [(self.aggressive_below * estimated_value, self.aggressive_step),
+                (estimated_value, self.nudge_step)]
+
+    def batch_values(self, players):
+        self.valuations.warm(players)
+        return np.array([self.estimate_value(p) for p in players])
+
+    def decide_bids(self, values, current_bids, budgets, rng):
+        """
+        Vectorized decide_bid over many concurrent auctions (see auctionengine.batch).
+        """
+        return np.where(current_bids < self.aggressive_below * values,
+                        raise_bids(current_bids, self.aggressive_step),
+                        np.where(current_bids < values, raise_bids(current_bids, self.nudge_step), current_bids))
+
     def decide_bid(self, player: Player, current_bid: float):
         estimated_value = self.estimate_value(player)
-        if current_bid < (0.85 * estimated_value):
-            return round(current_bid + 0.15, 2)
+        if current_bid < (self.aggressive_below * estimated_value):
+            return raise_bid(current_bid, self.aggressive_step)
         elif current_bid < estimated_value:
-            return round(current_bid + 0.05, 2)
+            return raise_bid(current_bid, self.nudge_step)
         return current_bid
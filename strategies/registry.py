@@ -0,0 +1,96 @@
+"""
+Registry of bidding strategies by name, resolved lazily.
+
+The model-backed strategies import sklearn, xgboost or both at module level, which
+costs more at startup than a whole auction with the statistical strategy. The
+registry maps each name to a "module:Class" path and default constructor arguments,
+and imports the module only when a strategy of that name is first created, so a run
+pays only for the libraries its lineup uses.
+
+``create`` fills ``total_budget`` from the team's budget for strategies whose
+constructor takes one, so configs and lineups never repeat the budget. A name that
+is not registered but looks like "module:Class" is loaded directly, which lets a
+config use a strategy that lives outside this package.
+"""
+
+import importlib
+import inspect
+
+# name -> ("module:Class", default constructor arguments)
+STRATEGIES = {
+    "base": ("strategies.base:BiddingStrategy", {}),
+    "statistical": ("strategies.statistical:StatisticalBiddingStrategy", {}),
+    "statistical_planner": ("strategies.statistical:StatisticalBiddingStrategy", {"use_planner": True}),
+    "random_forest": ("strategies.random_forest:RandomForestBiddingStrategy", {}),
+    "xgboost": ("strategies.xgboost_strategy:XGBoostBiddingStrategy", {}),
+    "mlp": ("strategies.mlp_strategy:MLPBiddingStrategy", {}),
+    "bayesian_ridge": ("strategies.bayesian_ridge:BayesianRidgeBiddingStrategy", {}),
+    "lookahead": ("strategies.lookahead:LookaheadBiddingStrategy", {}),
+    "comparables": ("strategies.comparables:ComparablesBiddingStrategy", {}),
+}
+
+_classes = {}
+
+
+def register(name, path, **defaults):
+    """
+    Register a strategy under a name.
+
+    Args:
+        name (str): Name used in lineups and configs
+        path (str): "module:Class" of the strategy
+        **defaults: Constructor arguments applied unless overridden at creation
+    """
+    STRATEGIES[name] = (path, defaults)
+    _classes.pop(path, None)
+
+
+def names():
+    """Registered strategy names, sorted."""
+    return sorted(STRATEGIES)
+
+
+def _path(name):
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    if ":" in name:
+        return name, {}
+    raise ValueError(f"Unknown strategy: {name} (known: {', '.join(names())})")
+
+
+def resolve(name):
+    """
+    Return the class of a strategy, importing its module on first use.
+
+    Args:
+        name (str): Registered name or "module:Class"
+
+    Returns:
+        type: Strategy class
+    """
+    path, _ = _path(name)
+    if path not in _classes:
+        module, _, attr = path.partition(":")
+        _classes[path] = getattr(importlib.import_module(module), attr)
+    return _classes[path]
+
+
+def create(name, budget=None, **params):
+    """
+    Build a strategy by name.
+
+    Args:
+        name (str): Registered name or "module:Class"
+        budget (float, optional): Team budget, passed as ``total_budget`` to strategies
+            that take it unless params set it
+        **params: Constructor arguments, overriding the registered defaults
+
+    Returns:
+        object: Bidding strategy instance
+    """
+    cls = resolve(name)
+    kwargs = dict(_path(name)[1], **params)
+    if budget is not None and "total_budget" not in kwargs \
+            and "total_budget" in inspect.signature(cls).parameters:
+        kwargs["total_budget"] = budget
+    return cls(**kwargs)
@@ -0,0 +1,234 @@
+"""
+Role-constrained knapsack planner for squad building.
+
+The planner values a player by what buying them does to the best squad still
+reachable. It solves a knapsack over the players not yet auctioned, with stars as
+value and predicted price as cost. The capacity is the team's remaining budget and,
+per role, its remaining roster slots. A player's reservation price is the highest
+price at which buying them still leads to a squad at least as good as the best
+squad without them.
+
+Budgets are counted in integer units of ``unit`` Cr (0.05 by default). The tables:
+
+- Per role, ``f[k][b]``: the most stars from at most k players of that role costing
+  at most b units. Only players that are not k-dominated enter the DP, where k is
+  the role's remaining slots. A player is k-dominated if k other players of the role
+  have at least its stars at no more than its cost, since such a player can never
+  improve a squad. With integer star ratings this leaves at most k players per star
+  level, so a role table is built from a few dozen items whatever the pool size.
+- Per role, ``H[b]``: the most stars from every other role with b units, the max-plus
+  convolution of their tables. Tables are nondecreasing step functions, so a
+  convolution only has to visit the steps of one operand.
+
+After a lot closes, only the table of the sold (or unsold) player's role is rebuilt,
+and only when the player was one of its kept items. Each H is recomputed lazily when
+one of the tables it combines changes. The reservation price of the player on the
+block needs their role's table without them; it comes from the cached table when the
+player is not kept, or from a rebuild over the kept items. The price itself is then
+found by binary search. Reservations are cached until the next change, so repeated
+``decide_bid`` calls within a lot are dictionary lookups.
+"""
+
+import bisect
+import math
+
+import numpy as np
+
+
+def _steps(a):
+    """Indices where a nondecreasing array increases, including index 0."""
+    return np.flatnonzero(np.diff(a, prepend=-np.inf) > 0)
+
+
+def max_plus(a, b):
+    """
+    Max-plus convolution of two nondecreasing arrays: c[t] = max over i <= t of a[i] + b[t - i].
+    """
+    c = np.full(len(a), -np.inf)
+    for i in _steps(a):
+        np.maximum(c[i:], a[i] + b[:len(b) - i], out=c[i:])
+    return c
+
+
+class SquadPlanner:
+    def __init__(self, requirements, budget, cost, value=None, unit=0.05):
+        """
+        Args:
+            requirements (dict): Roster slots per role
+            budget (float): Starting budget in Cr
+            cost (callable): Player -> expected price in Cr
+            value (callable, optional): Player -> value; defaults to star rating
+            unit (float): Budget grid step in Cr
+        """
+        self.requirements = dict(requirements)
+        self.budget = budget
+        self.cost = cost
+        self.value = value or (lambda player: player.stats.get('stars', 0))
+        self.unit = unit
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the pool and purchases, ready for a new auction.
+        """
+        self.capacity = int(math.floor(self.budget / self.unit + 1e-9))
+        self.remaining = self.capacity
+        self.slots = dict(self.requirements)
+        # Per role and value, (cost units, tiebreak, player) sorted by cost
+        self._groups = {role: {} for role in self.requirements}
+        self._entries = {}
+        self._tables = {}
+        self._others = {}
+        self._reservations = {}
+        self._tiebreak = 0
+
+    def _units(self, price):
+        return int(math.ceil(price / self.unit - 1e-9))
+
+    def add(self, players):
+        """
+        Add players to the pool still to be auctioned.
+
+        Args:
+            players (iterable): Player objects; ones already in the pool are skipped
+        """
+        for player in players:
+            role = player.role.lower()
+            if player in self._entries or role not in self._groups:
+                continue
+            entry = (self._units(self.cost(player)), self._tiebreak, player)
+            self._tiebreak += 1
+            value = self.value(player)
+            bisect.insort(self._groups[role].setdefault(value, []), entry)
+            self._entries[player] = (role, value, entry)
+            self._changed(role)
+
+    def _kept(self, role, exclude=None):
+        """
+        (cost, value) of the players of a role that are not k-dominated, k being the
+        role's remaining slots, optionally leaving one player out.
+        """
+        k = self.slots[role]
+        kept = []
+        cheapest = []  # the k lowest costs among higher-valued players kept so far
+        for value in sorted(self._groups[role], reverse=True):
+            taken = 0
+            for cost, _, player in self._groups[role][value]:
+                if taken == k:
+                    break
+                if player is exclude:
+                    continue
+                taken += 1
+                if cost > self.capacity or (len(cheapest) == k and cost >= cheapest[-1]):
+                    # Too expensive, or k better-or-equal players cost no more
+                    continue
+                kept.append((cost, value))
+                bisect.insort(cheapest, cost)
+                del cheapest[k:]
+        return kept
+
+    def _build(self, role, exclude=None):
+        """Role table f[k][b] for k up to the role's remaining slots."""
+        k, width = self.slots[role], self.capacity + 1
+        f = np.full((k + 1, width), -np.inf)
+        f[0] = 0.0
+        for cost, value in self._kept(role, exclude):
+            # Rows are updated from the previous item's rows, so each player is used once
+            candidate = f[:-1, :width - cost] + value
+            np.maximum(f[1:, cost:], candidate, out=f[1:, cost:])
+        # At most k players, not exactly k
+        return np.maximum.accumulate(f, axis=0)
+
+    def _table(self, role):
+        if role not in self._tables:
+            self._tables[role] = self._build(role)
+        return self._tables[role]
+
+    def _other_roles(self, role):
+        """H for a role: best stars from every other role per budget."""
+        if role not in self._others:
+            combined = np.zeros(self.capacity + 1)
+            for other in self.requirements:
+                if other != role:
+                    combined = max_plus(self._table(other)[-1], combined)
+            self._others[role] = combined
+        return self._others[role]
+
+    def _changed(self, role):
+        self._tables.pop(role, None)
+        self._others = {r: h for r, h in self._others.items() if r == role}
+        self._reservations = {}
+
+    def remove(self, player):
+        """
+        Take a player out of the pool once their lot has closed.
+
+        Args:
+            player: Player object
+        """
+        found = self._entries.pop(player, None)
+        if found is None:
+            return
+        role, value, entry = found
+        group = self._groups[role][value]
+        position = bisect.bisect_left(group, entry)
+        del group[position]
+        if not group:
+            del self._groups[role][value]
+        if position < self.slots[role]:
+            # Only the k cheapest of a value level can be kept, so others change nothing
+            self._changed(role)
+        else:
+            self._reservations.pop(player, None)
+
+    def bought(self, player, price):
+        """
+        Record a purchase by this team.
+
+        Args:
+            player: Player object bought
+            price (float): Price paid in Cr
+        """
+        role = player.role.lower()
+        self.remaining -= self._units(price)
+        if role in self.slots and self.slots[role] > 0:
+            self.slots[role] -= 1
+            self._changed(role)
+        self._reservations = {}
+
+    def reservation_price(self, player):
+        """
+        Highest price in Cr worth paying for a player, by their marginal squad value.
+
+        Args:
+            player: Player object on the block (in the pool or not)
+
+        Returns:
+            float: Reservation price, 0.0 if the player does not fit the plan at all
+        """
+        if player in self._reservations:
+            return self._reservations[player]
+
+        role = player.role.lower()
+        price = 0.0
+        if self.slots.get(role, 0) > 0 and self.remaining > 0:
+            found = self._entries.get(player)
+            if found is not None and bisect.bisect_left(self._groups[role][found[1]], found[2]) < self.slots[role]:
+                own = self._build(role, exclude=player)
+            else:
+                own = self._table(role)
+            others = self._other_roles(role)[:self.remaining + 1]
+            budget = self.remaining
+            own = own[:, :budget + 1]
+
+            # Best squad if someone else gets the player
+            without = np.max(own[-1] + others[::-1])
+            # Best squad after buying them, by budget left once they are paid for
+            with_player = self.value(player) + max_plus(own[-2], others)
+            # with_player is nondecreasing, so the cheapest budget that still matches
+            # `without` gives the highest price worth paying
+            left = int(np.searchsorted(with_player, without - 1e-9, side="left"))
+            if left <= budget:
+                price = (budget - left) * self.unit
+        self._reservations[player] = price
+        return price
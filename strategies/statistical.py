@@ -14,6 +14,9 @@ The strategy considers:
 """
 
 import random
+import numpy as np
+from auctionengine.money import raise_bid, raise_bids, to_crore, to_lakhs
+from strategies.squad_planner import SquadPlanner
 
 class StatisticalBiddingStrategy:
     # A default player combination for a team of maximum 11 players.
@@ -24,13 +27,26 @@ class StatisticalBiddingStrategy:
         "wicketkeeper": 1
     }
 
-    def __init__(self, total_budget):
+    def __init__(self, total_budget, use_planner=False, budget_unit=0.05, aggressive_below=0.8,
+                 aggressive_step=0.2, nudge_step=0.1, nudge_probability=0.3):
         """
         Initialize the bidding strategy with a total budget.
 
         Args:
             total_budget (float): Total capital available (in Cr)
+            use_planner (bool): Cap bids at the player's marginal squad value from a
+                knapsack over the remaining pool (see strategies.squad_planner) instead
+                of the fixed per-role budget slices
+            budget_unit (float): Budget grid step of the planner in Cr
+            aggressive_below (float): Fraction of the allowed bid below which bids are aggressive
+            aggressive_step (float): Increment of an aggressive bid in Cr
+            nudge_step (float): Increment of a conservative bid in Cr
+            nudge_probability (float): Chance of a conservative bid once above the aggressive range
         """
+        self.aggressive_below = aggressive_below
+        self.aggressive_step = aggressive_step
+        self.nudge_step = nudge_step
+        self.nudge_probability = nudge_probability
         self.total_budget = total_budget
 
         # Pull in the default roster requirements.
@@ -42,8 +58,44 @@ class StatisticalBiddingStrategy:
         # Budget allocation per position: proportionally allocate the budget.
         self.position_budget = {pos: (total_budget * count / total_players) 
                                   for pos, count in roster_requirements.items()}
-        # Start with no spending for any position.
+        # Start with no spending for any position. Spending is kept in lakhs.
         self.spent_budget = {pos: 0 for pos in roster_requirements}
+        self.rng = random
+        self.planner = (SquadPlanner(roster_requirements, total_budget, cost=self.predict_price,
+                                     unit=budget_unit) if use_planner else None)
+
+    def new_auction(self):
+        """
+        Reset spending, and the planner's pool, before an auction starts.
+        """
+        self.spent_budget = {pos: 0 for pos in self.spent_budget}
+        if self.planner:
+            self.planner.reset()
+
+    def begin_auction(self, players):
+        """
+        Add upcoming players to the planner's pool.
+
+        Args:
+            players (list): Player objects about to be auctioned
+        """
+        if self.planner:
+            self.planner.add(players)
+
+    def lot_closed(self, player, price, won):
+        """
+        Track the pool and, with the planner, this team's purchases.
+
+        Args:
+            player: Player object whose lot closed
+            price (float): Winning bid, 0.0 if unsold
+            won (bool): Whether this team bought the player
+        """
+        if self.planner:
+            self.planner.remove(player)
+            if won:
+                self.planner.bought(player, price)
+                self.update_spent(player, price)
 
     def predict_price(self, player):
         """
@@ -104,9 +156,11 @@ class StatisticalBiddingStrategy:
         Returns:
             float: Maximum allowed bid for the player
         """
+        if self.planner:
+            return self.planner.reservation_price(player)
         pos = player.role.lower()
         predicted = self.predict_price(player)
-        remaining = self.position_budget.get(pos, self.total_budget) - self.spent_budget.get(pos, 0)
+        remaining = self.position_budget.get(pos, self.total_budget) - to_crore(self.spent_budget.get(pos, 0))
         # Use the lower of predicted price and remaining allocated budget.
         allowed = min(predicted, remaining)
         return allowed
@@ -123,32 +177,63 @@ class StatisticalBiddingStrategy:
             float: New bid amount or current bid if holding
 
         Strategy:
-        - Aggressive bidding (0.2 Cr increment) if current bid is below 80% of allowed bid
-        - Conservative bidding (0.1 Cr increment) with 30% probability if below allowed bid
+        - Aggressive bidding (aggressive_step, 0.2 Cr by default) if current bid is below
+          aggressive_below (80%) of allowed bid
+        - Conservative bidding (nudge_step, 0.1 Cr) with nudge_probability (30%) if below
+          allowed bid
         - Hold current bid otherwise
         """
         allowed = self.allowed_bid(player, current_bid)
-        if current_bid < 0.8 * allowed:
-            new_bid = round(min(current_bid + 0.2, allowed), 2)
-        elif current_bid < allowed and random.random() < 0.3:
-            new_bid = round(min(current_bid + 0.1, allowed), 2)
+        if current_bid < self.aggressive_below * allowed:
+            new_bid = raise_bid(current_bid, self.aggressive_step, allowed)
+        elif current_bid < allowed and self.rng.random() < self.nudge_probability:
+            new_bid = raise_bid(current_bid, self.nudge_step, allowed)
         else:
             new_bid = current_bid
         return new_bid
 
+    def batch_values(self, players):
+        """
+        Allowed bid for every player, for the batch engine (auctionengine.batch).
+
+        Args:
+            players (list): Player objects in pool order
+
+        Returns:
+            numpy.ndarray: Allowed bid per player at the current spending state
+        """
+        return np.array([self.allowed_bid(p, p.base_price) for p in players])
+
+    def decide_bids(self, values, current_bids, budgets, rng):
+        """
+        Vectorized decide_bid over many concurrent auctions.
+
+        Args:
+            values (numpy.ndarray): Allowed bid for the player on the block in each auction
+            current_bids (numpy.ndarray): Current highest bid in each auction
+            budgets (numpy.ndarray): This team's remaining budget in each auction
+            rng (numpy.random.Generator): Random stream replacing random.random()
+
+        Returns:
+            numpy.ndarray: New bid per auction (the current bid where holding)
+        """
+        allowed = values
+        aggressive = current_bids < self.aggressive_below * allowed
+        nudge = (current_bids < allowed) & (rng.random(len(current_bids)) < self.nudge_probability)
+        return np.where(aggressive, raise_bids(current_bids, self.aggressive_step, allowed),
+                        np.where(nudge, raise_bids(current_bids, self.nudge_step, allowed),
+                                 current_bids))
+
     def update_spent(self, player, winning_bid):
         """
         Updates the spent budget after winning a player bid.
 
         Args:
             player: Player object with role attribute
-            winning_bid (float): Winning bid amount
+            winning_bid (float): Winning bid amount in Cr
         """
         pos = player.role.lower()
-        if pos in self.spent_budget:
-            self.spent_budget[pos] += winning_bid
-        else:
-            self.spent_budget[pos] = winning_bid
+        self.spent_budget[pos] = self.spent_budget.get(pos, 0) + to_lakhs(winning_bid)
 
     def evaluate_strategy(self, acquired_players):
         """
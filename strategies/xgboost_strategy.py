@@ -1,48 +1,128 @@
 import numpy as np
 import xgboost as xgb
+from auctionengine.artifacts import default_store
+from auctionengine.money import raise_bid, raise_bids
 from auctionengine.player import Player
+from auctionengine.player_table import FEATURE_COLUMNS
+from auctionengine.valuation import ValuationCache
 
 class XGBoostBiddingStrategy:
-    def __init__(self, model=None):
+    # Player attributes the model features are computed from
+    FEATURE_STATS = FEATURE_COLUMNS
+
+    def __init__(self, model=None, seed=0, artifact_store=None, trained_version=None,
+                 aggressive_below=0.8, aggressive_step=0.2, nudge_step=0.1):
         """
         Initialize the XGBoost bidding strategy with a pre-trained model.
-        If no model is provided, a default one is initialized.
+        If no model is provided, a default one is loaded from the artifact
+        store (or trained) the first time it is needed.
         """
-        self.model = model or self._train_default_model()
+        self.seed = seed
+        # Bid while below aggressive_below of the estimated value in aggressive_step
+        # increments, then in nudge_step increments up to the value itself
+        self.aggressive_below = aggressive_below
+        self.aggressive_step = aggressive_step
+        self.nudge_step = nudge_step
+        self.artifact_store = artifact_store
+        # None fits the default model; "latest" or a version number loads one published by train.py
+        self.trained_version = trained_version
+        self._model = model
+        self.valuations = ValuationCache(self)
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = self._train_default_model()
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+        self.valuations.invalidate()
 
     def _train_default_model(self):
         """
-        Train a default XGBoost model using dummy data.
-        In a real scenario, this should be replaced with actual training data.
+        Train a default XGBoost model using dummy data, reusing a cached fit when available.
+        With ``trained_version``, a model trained on the real dataset by the training
+        pipeline is loaded instead.
         """
+        store = self.artifact_store or default_store()
+        if self.trained_version is not None:
+            # A model published by the training pipeline (auctionengine.training), only on request
+            return store.trained(type(self).__name__, self.trained_version)
         # Dummy training data
-        X_train = np.random.rand(100, 3)  # 100 samples, 3 features
-        y_train = np.random.rand(100) * 10  # Random target values
+        rng = np.random.RandomState(self.seed)
+        X_train = rng.rand(100, 3)  # 100 samples, 3 features
+        y_train = rng.rand(100) * 10  # Random target values
 
-        model = xgb.XGBRegressor(objective='reg:squarederror')
-        model.fit(X_train, y_train)
-        return model
+        def train(X, y):
+            model = xgb.XGBRegressor(objective='reg:squarederror', random_state=self.seed)
+            model.fit(X, y)
+            return model
 
-    def estimate_value(self, player: Player):
+        params = {"objective": "reg:squarederror", "xgboost": xgb.__version__}
+        return store.get_or_train(type(self).__name__, params, X_train, y_train, self.seed, train)
+
+    def extract_features(self, player: Player):
         """
-        Estimate the value of a player using the XGBoost model.
+        Build the XGBoost feature row for a player.
         """
-        features = np.array([
+        return np.array([
             player.stats.get('batting_avg', 20),
             player.stats.get('strike_rate', 120),
             player.stats.get('economy', 8)
-        ]).reshape(1, -1)
-        predicted_value = self.model.predict(features)[0]
+        ])
+
+    def extract_feature_matrix(self, table, rows):
+        """
+        Gather feature rows for many players straight from a PlayerTable.
+        """
+        return table.features[rows]
+
+    def begin_auction(self, players):
+        """
+        Score the whole player pool in one predict call before bidding starts.
+        """
+        self.valuations.warm(players)
+
+    def estimate_value(self, player: Player):
+        """
+        Estimate the value of a player using the XGBoost model.
+        """
+        predicted_value = self.valuations.get(player)
         return max(predicted_value, player.base_price)
 
+    def bid_policy(self, player: Player):
+        """
+        Describe decide_bid as (threshold, increment) segments for the fast clearing engine.
+        """
+        estimated_value = self.estimate_value(player)
+        return [(self.aggressive_below * estimated_value, self.aggressive_step),
+                (estimated_value, self.nudge_step)]
+
+    def batch_values(self, players):
+        """
+        Estimated value of every player, for the batch engine (auctionengine.batch).
+        """
+        self.valuations.warm(players)
+        return np.array([self.estimate_value(p) for p in players])
+
+    def decide_bids(self, values, current_bids, budgets, rng):
+        """
+        Vectorized decide_bid over many concurrent auctions.
+        """
+        return np.where(current_bids < self.aggressive_below * values,
+                        raise_bids(current_bids, self.aggressive_step),
+                        np.where(current_bids < values, raise_bids(current_bids, self.nudge_step), current_bids))
+
     def decide_bid(self, player: Player, current_bid: float):
         """
         Decide the bid amount based on the estimated player value.
         """
         estimated_value = self.estimate_value(player)
-        if current_bid < (0.8 * estimated_value):
-            return round(current_bid + 0.2, 2)
+        if current_bid < (self.aggressive_below * estimated_value):
+            return raise_bid(current_bid, self.aggressive_step)
         elif current_bid < estimated_value:
-            return round(current_bid + 0.1, 2)
+            return raise_bid(current_bid, self.nudge_step)
         else:
             return current_bid 
\ No newline at end of file
@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pytest
+
+# The packages live at the repository root, which is not installed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auctionengine.events import NullSink  # noqa: E402
+from auctionengine.team import Team  # noqa: E402
+from auctionengine.tournament import make_strategy  # noqa: E402
+from auctionengine.utils import load_all_players  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def player_pool():
+    return load_all_players("dataset")
+
+
+@pytest.fixture
+def players(player_pool):
+    """The dataset's players, with every sale undone after the test."""
+    yield player_pool
+    for player in player_pool:
+        player.winning_bid = 0.0
+
+
+def seats(strategies, max_players=11):
+    """A 40 Cr team per strategy, and the strategies keyed by team name."""
+    teams = [Team(name=f"Seat {i + 1}", budget=40.0, max_players=max_players) for i in range(len(strategies))]
+    return teams, {team.name: strategy for team, strategy in zip(teams, strategies)}
+
+
+def play(dealer_class, players, lineup, seed, max_players=11, **options):
+    """
+    Run one seeded auction of the named strategies and undo its sales.
+
+    Returns:
+        list: Per seat, its name, squad as (player, price) pairs and purse left in lakhs
+    """
+    teams, strategies = seats([make_strategy(name, 40.0) for name in lineup], max_players)
+    dealer = dealer_class(players=list(players), teams=teams, strategies=strategies, events=NullSink(), seed=seed,
+                          **options)
+    dealer.start_auction()
+    outcome = [(team.name, [(p.name, p.winning_bid) for p in team.players], team.purse) for team in teams]
+    for player in players:
+        player.winning_bid = 0.0
+    return outcome
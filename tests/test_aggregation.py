@@ -0,0 +1,96 @@
+"""
+Mergeable aggregates: merged statistics equal one pass over all the data.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from auctionengine.aggregation import QuantileSketch, ResultsAggregator, RunningStats
+from auctionengine.tournament import aggregate_tournament
+
+LINEUP = ["statistical", "random_forest", "comparables"]
+
+
+def assert_close(actual, expected):
+    """Nested dicts and lists equal, floats to rounding."""
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            assert_close(actual[key], expected[key])
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected)
+        for a, e in zip(actual, expected):
+            assert_close(a, e)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-12)
+    else:
+        assert actual == expected
+
+
+def stats_of(values):
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    return stats
+
+
+def test_running_stats_merge_equals_single_pass():
+    values = np.random.default_rng(0).normal(5, 3, 1000).tolist()
+    whole = stats_of(values)
+    merged = stats_of([])
+    for start in range(0, len(values), 137):
+        merged.merge(stats_of(values[start:start + 137]))
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean) == pytest.approx(np.mean(values))
+    assert merged.variance == pytest.approx(whole.variance) == pytest.approx(np.var(values, ddof=1))
+    assert (merged.min, merged.max) == (min(values), max(values))
+
+
+@pytest.mark.parametrize("accuracy", [0.01, 0.05])
+def test_quantile_sketch_relative_error(accuracy):
+    values = np.random.default_rng(1).lognormal(0, 2, 5000).tolist() + [0.0] * 50
+    sketch = QuantileSketch(accuracy)
+    for value in values:
+        sketch.add(value)
+    ordered = sorted(values)
+    for q in (0.0, 0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99, 1.0):
+        exact = ordered[math.floor(q * (len(values) - 1))]
+        assert abs(sketch.quantile(q) - exact) <= accuracy * exact + 1e-12, q
+
+
+def test_quantile_sketch_merge_equals_single_pass():
+    values = [random.Random(2).expovariate(0.5) for _ in range(2000)]
+    whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i, value in enumerate(values):
+        whole.add(value)
+        (left if i % 3 else right).add(value)
+    assert left.merge(right).to_dict() == whole.to_dict()
+
+
+def test_sketch_rejects_negative_values_and_mismatched_merges():
+    with pytest.raises(ValueError):
+        QuantileSketch().add(-1.0)
+    with pytest.raises(ValueError):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+def test_to_dict_round_trip(tmp_path):
+    aggregator = aggregate_tournament(3, LINEUP, workers=1)
+    restored = ResultsAggregator.from_dict(aggregator.to_dict())
+    assert restored.to_dict() == aggregator.to_dict()
+    assert restored.format_report() == aggregator.format_report()
+    aggregator.save(tmp_path / "aggregate.json")
+    assert ResultsAggregator.load(tmp_path / "aggregate.json").to_dict() == aggregator.to_dict()
+
+
+def test_split_then_merged_aggregator_equals_single_run():
+    single = aggregate_tournament(6, LINEUP, workers=1, batch_size=6)
+    first = aggregate_tournament(4, LINEUP, workers=1, batch_size=1)
+    second = ResultsAggregator.from_dict(aggregate_tournament(2, LINEUP, base_seed=4, workers=1).to_dict())
+    merged = first.merge(second)
+    assert merged.auctions == single.auctions == 6
+    assert_close(merged.summary(), single.summary())
+    assert_close(merged.player_summary(), single.player_summary())
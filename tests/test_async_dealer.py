@@ -0,0 +1,72 @@
+"""
+AsyncDealer: sequential rounds reproduce the Dealer, and slow strategies miss deadlines.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from conftest import play, seats
+
+from auctionengine.async_dealer import AsyncDealer, verify_against_loop
+from auctionengine.dealer import Dealer
+from auctionengine.events import NullSink
+from auctionengine.tournament import make_strategy
+
+LINEUPS = [
+    ["statistical", "statistical_planner", "bayesian_ridge", "random_forest"],
+    ["statistical", "statistical", "statistical"],
+    ["comparables", "mlp", "statistical"],
+]
+
+
+class SlowStrategy:
+    """Bids the base price plus 1 Cr, after taking ``delay`` seconds to decide."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def decide_bid(self, player, current_bid):
+        time.sleep(self.delay)
+        return current_bid + 1.0
+
+
+class AsyncSlowStrategy(SlowStrategy):
+    async def decide_bid(self, player, current_bid):
+        await asyncio.sleep(self.delay)
+        return current_bid + 1.0
+
+
+class HoldStrategy:
+    def decide_bid(self, player, current_bid):
+        return current_bid
+
+
+@pytest.mark.parametrize("lineup", LINEUPS)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sequential_rounds_match_dealer(players, lineup, seed):
+    expected = play(Dealer, players, lineup, seed)
+    assert play(AsyncDealer, players, lineup, seed, rounds="sequential", deadline=None) == expected
+
+
+def test_verify_against_loop(players):
+    strategies = [make_strategy(name, 40.0) for name in LINEUPS[0]]
+    assert verify_against_loop(players, strategies, seeds=range(3)) == []
+
+
+@pytest.mark.parametrize("slow", [SlowStrategy, AsyncSlowStrategy])
+@pytest.mark.parametrize("rounds", ["concurrent", "sequential"])
+def test_slow_strategy_misses_deadline(players, slow, rounds):
+    lots = players[:3]
+    teams, strategies = seats([slow(0.5), HoldStrategy()])
+    # Calls that missed the deadline keep their worker thread until they return, so
+    # leave room for the other team's calls
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        dealer = AsyncDealer(players=list(lots), teams=teams, strategies=strategies, events=NullSink(), seed=0,
+                             deadline=0.02, rounds=rounds, executor=executor)
+        dealer.start_auction()
+    # Every call missed the deadline, so the slow team held and bought nothing
+    assert dealer.missed_deadlines["Seat 1"] == len(lots)
+    assert dealer.missed_deadlines["Seat 2"] == 0
+    assert teams[0].players == [] and teams[0].purse == 4000
@@ -0,0 +1,30 @@
+"""
+The lockstep batch engine must play auctions distributed like the scalar Dealer's.
+"""
+
+import numpy as np
+
+from auctionengine.batch import cross_check, run_batch
+from auctionengine.tournament import make_strategy
+
+LINEUP = ["random_forest", "statistical", "bayesian_ridge", "mlp"]
+
+
+def test_cross_check_passes(players):
+    strategies = [make_strategy(name, 40.0) for name in LINEUP]
+    report = cross_check(players, strategies, n_auctions=60, seed=3)
+    assert [row["strategy"] for row in report] == [type(s).__name__ for s in strategies]
+    assert all(row["matches"] for row in report), report
+
+
+def test_batch_is_reproducible_and_within_budget(players):
+    strategies = [make_strategy(name, 40.0) for name in LINEUP]
+    first = run_batch(players, strategies, 16, seed=5)
+    second = run_batch(players, strategies, 16, seed=5)
+    np.testing.assert_array_equal(first.stars, second.stars)
+    spent = first.spent(40.0)
+    assert (spent >= 0).all() and (spent <= 40.0).all()
+    # The integer ledger is exactly the sum of the sale prices
+    for seat in range(len(LINEUP)):
+        paid = np.where(first.winners == seat, first.prices, 0).sum(axis=1)
+        np.testing.assert_array_equal(paid, 4000 - first.budgets[:, seat])
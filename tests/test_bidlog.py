@@ -0,0 +1,64 @@
+"""
+Bid logs: a seeded auction written by BidLogSink reads back and replays without a mismatch.
+"""
+
+import pytest
+from conftest import seats
+
+from auctionengine.bidlog import BidLogSink, ReplayError, read_bid_log, replay
+from auctionengine.dealer import Dealer
+from auctionengine.tournament import make_strategy
+
+LINEUP = ["statistical", "random_forest", "bayesian_ridge", "comparables"]
+
+
+def squads(teams):
+    return [(team.name, [p.name for p in team.players], team.purse) for team in teams]
+
+
+def log_auctions(path, players, seeds, fast_clearing=False):
+    """Play one seeded auction per seed into one log; returns every auction's squads."""
+    sink = BidLogSink(str(path))
+    played = []
+    for seed in seeds:
+        teams, strategies = seats([make_strategy(name, 40.0) for name in LINEUP])
+        Dealer(players=list(players), teams=teams, strategies=strategies, events=sink, seed=seed,
+               fast_clearing=fast_clearing).start_auction()
+        played.append(squads(teams))
+        for player in players:
+            player.winning_bid = 0.0
+    sink.close()
+    return played
+
+
+@pytest.mark.parametrize("fast_clearing", [False, True])
+def test_logged_auctions_replay(tmp_path, players, fast_clearing):
+    played = log_auctions(tmp_path / "bids.log", players, [3, 4], fast_clearing)
+    records = list(read_bid_log(str(tmp_path / "bids.log")))
+
+    assert [record.seed for record in records] == [3, 4]
+    assert len(records[0].lots) == len(players)
+    for record, squads_played in zip(records, played):
+        assert [(seat["name"], seat["players"]) for seat in record.outcome()] == [
+            (name, names) for name, names, _ in squads_played]
+        assert squads(replay(record, players)) == squads_played
+        for player in players:
+            player.winning_bid = 0.0
+
+
+def test_replay_detects_a_diverging_log(tmp_path, players):
+    log_auctions(tmp_path / "bids.log", players, [5])
+    record = next(read_bid_log(str(tmp_path / "bids.log")))
+    lot = next(lot for lot in record.lots if lot.winner is not None and lot.price > 0.1)
+    # The first buyer can no longer afford its first winning bid
+    name, _, max_players = record.seats[lot.winner]
+    record.seats[lot.winner] = (name, lot.price - 0.1, max_players)
+    with pytest.raises(ReplayError):
+        replay(record, players)
+
+
+def test_read_bid_log_rejects_other_files(tmp_path):
+    path = tmp_path / "not.log"
+    path.write_bytes(b"something else")
+    with pytest.raises(ValueError):
+        list(read_bid_log(str(path)))
@@ -0,0 +1,43 @@
+"""
+The fast clearing engine must reproduce the bid loop's auctions exactly.
+"""
+
+import pytest
+from conftest import play, seats
+
+from auctionengine.clearing import verify_against_loop
+from auctionengine.dealer import Dealer
+from auctionengine.events import NullSink
+from auctionengine.tournament import make_strategy
+
+LINEUPS = [
+    ["random_forest", "xgboost", "mlp", "comparables"],
+    ["comparables", "comparables", "comparables"],
+    # Stochastic strategies make the fast engine fall back to the loop on their lots
+    ["random_forest", "statistical", "mlp", "bayesian_ridge", "xgboost"],
+]
+
+
+@pytest.mark.parametrize("lineup", LINEUPS)
+@pytest.mark.parametrize("seed", [0, 7])
+def test_fast_clearing_matches_bid_loop(players, lineup, seed):
+    assert (play(Dealer, players, lineup, seed, fast_clearing=True)
+            == play(Dealer, players, lineup, seed, fast_clearing=False))
+
+
+def test_fast_clearing_matches_bid_loop_with_large_squads(players):
+    lineup = ["random_forest", "comparables", "mlp"]
+    assert (play(Dealer, players, lineup, 3, max_players=25, fast_clearing=True)
+            == play(Dealer, players, lineup, 3, max_players=25, fast_clearing=False))
+
+
+def test_fast_clearing_sells_players(players):
+    squads = play(Dealer, players, LINEUPS[0], 0, fast_clearing=True)
+    assert sum(len(squad) for _, squad, _ in squads) > 0
+
+
+@pytest.mark.parametrize("lineup", LINEUPS[:2])
+def test_verify_against_loop_finds_no_mismatch(players, lineup):
+    teams, strategies = seats([make_strategy(name, 40.0) for name in lineup])
+    dealer = Dealer(players=list(players), teams=teams, strategies=strategies, events=NullSink(), seed=1)
+    assert verify_against_loop(dealer) == []
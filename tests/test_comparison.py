@@ -0,0 +1,27 @@
+"""
+Paired comparisons: a variant compared with itself differs by exactly nothing.
+"""
+
+import math
+
+import pytest
+
+from auctionengine.comparison import compare
+from auctionengine.tournament import mean_ci
+
+
+def test_mean_ci():
+    assert mean_ci([2.0]) == (2.0, math.inf)
+    mean, half_width = mean_ci([1.0, 2.0, 3.0, 4.0])
+    assert mean == 2.5
+    assert half_width == pytest.approx(1.96 * math.sqrt((5 / 3) / 4))
+
+
+def test_identical_variants_do_not_differ():
+    result = compare("statistical", "statistical", max_blocks=4, workers=1)
+    summary = result.summary()
+    assert summary["blocks"] == 4 and result.stopped == "max_blocks"
+    assert summary["difference"] == 0 and summary["difference_ci"] == 0
+    assert summary["win_rate_difference"] == 0
+    assert summary["unpaired_auctions"] is None and summary["variance_reduction"] is None
+    assert "statistical" in result.format_report()
@@ -0,0 +1,51 @@
+"""
+Event sinks: buffered output is written out even when an auction fails part way.
+"""
+
+import io
+
+import pytest
+from conftest import seats
+
+from auctionengine.dealer import Dealer
+from auctionengine.events import ConsoleSink
+
+
+class FailingStrategy:
+    """Bids 0.1 Cr over the base price, and raises on lot ``fail_at``."""
+
+    def __init__(self, fail_at):
+        self.fail_at = fail_at
+        self.lots = set()
+
+    def decide_bid(self, player, current_bid):
+        self.lots.add(player.name)
+        if len(self.lots) > self.fail_at:
+            raise RuntimeError("strategy failed")
+        return max(current_bid, player.base_price + 0.1)
+
+
+class HoldStrategy:
+    def decide_bid(self, player, current_bid):
+        return current_bid
+
+
+def test_console_sink_is_flushed_when_an_auction_fails(players):
+    stream = io.StringIO()
+    teams, strategies = seats([FailingStrategy(fail_at=5), HoldStrategy()])
+    dealer = Dealer(players=list(players[:20]), teams=teams, strategies=strategies,
+                    events=ConsoleSink(stream, buffer_lines=256), seed=0)
+    with pytest.raises(RuntimeError):
+        dealer.start_auction()
+    log = stream.getvalue()
+    assert log.count("Auctioning") == 6
+    assert log.count("Seat 1 wins") == 5
+
+
+def test_console_sink_writes_every_lot(players):
+    stream = io.StringIO()
+    teams, strategies = seats([HoldStrategy(), HoldStrategy()])
+    Dealer(players=list(players[:30]), teams=teams, strategies=strategies, events=ConsoleSink(stream, 7),
+           seed=0).start_auction()
+    assert stream.getvalue().count("Auctioning") == 30
+    assert stream.getvalue().count("remains unsold") == 30
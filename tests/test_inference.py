@@ -0,0 +1,48 @@
+"""
+Compiled inference kernels must predict exactly what the strategies' models predict.
+"""
+
+import numpy as np
+import pytest
+
+from auctionengine.inference import compile_model, verify_kernel
+from auctionengine.tournament import make_strategy
+
+MODELS = ["base", "random_forest", "xgboost", "mlp", "bayesian_ridge"]
+
+
+def features(name, players):
+    strategy = make_strategy(name, 40.0)
+    return strategy.model, strategy.valuations.feature_matrix(players)
+
+
+@pytest.mark.parametrize("name", MODELS)
+def test_kernel_matches_model(player_pool, name):
+    model, X = features(name, player_pool)
+    report = verify_kernel(model, X)
+    assert report["supported"] and report["ok"], report
+
+
+def test_xgboost_kernel_follows_default_direction_on_missing_values(player_pool):
+    model, X = features("xgboost", player_pool)
+    X = X.copy()
+    X[np.random.default_rng(0).random(X.shape) < 0.2] = np.nan
+    assert np.isnan(X).any(axis=1).sum() > 10
+    report = verify_kernel(model, X)
+    assert report["supported"] and report["exact"], report
+
+
+def test_forest_kernel_averages_trees(player_pool):
+    model, X = features("random_forest", player_pool)
+    kernel = compile_model(model)
+    assert kernel.divisor == len(model.estimators_)
+    expected = np.mean([tree.predict(X) for tree in model.estimators_], axis=0)
+    assert np.allclose(kernel.predict(X), expected)
+
+
+def test_unsupported_model_compiles_to_none():
+    from sklearn.neighbors import KNeighborsRegressor
+
+    model = KNeighborsRegressor(n_neighbors=2).fit(np.arange(8.0).reshape(4, 2), np.arange(4.0))
+    assert compile_model(model) is None
+    assert verify_kernel(model, np.zeros((2, 2)))["supported"] is False
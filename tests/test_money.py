@@ -0,0 +1,90 @@
+"""
+Integer-lakh money: the rounding rule, the strategy raises and the Team boundary in crore.
+"""
+
+import numpy as np
+import pytest
+
+from auctionengine.money import ledger, raise_bid, raise_bids, to_crore, to_lakhs
+from auctionengine.team import Team
+
+PRICES = [0.1, 0.2, 0.3, 0.7, 1.1, 2.35, 0.05, 3.3]
+
+
+@pytest.mark.parametrize("crore, lakhs", [
+    (0.07, 7), (0.1 + 0.2, 30), (2.35, 235), (40.0, 4000), (-1.5, -150),
+    # Exact ties go to the even lakh
+    (0.125, 12), (0.375, 38), (0.005, 0), (0.015, 2),
+])
+def test_to_lakhs(crore, lakhs):
+    assert to_lakhs(crore) == lakhs
+
+
+def test_to_lakhs_matches_ledger_rounding():
+    amounts = np.round(np.random.default_rng(0).uniform(0, 50, 10000), 3)
+    assert ledger(amounts).tolist() == [to_lakhs(a) for a in amounts.tolist()]
+
+
+def test_to_crore_round_trip():
+    for lakhs in range(-500, 5000):
+        assert to_lakhs(to_crore(lakhs)) == lakhs
+
+
+def test_raise_bid_agrees_with_raise_bids():
+    rng = np.random.default_rng(1)
+    current = np.round(rng.uniform(0, 20, 2000), 2)
+    steps = rng.choice([0.1, 0.2, 0.05, 0.125], len(current))
+    caps = np.round(rng.uniform(0, 25, len(current)), 2)
+    expected = [raise_bid(b, s, c) for b, s, c in zip(current.tolist(), steps.tolist(), caps.tolist())]
+    assert raise_bids(current, steps, caps).tolist() == expected
+    assert raise_bids(current, 0.2).tolist() == [raise_bid(b, 0.2) for b in current.tolist()]
+
+
+def test_raise_bid_stays_on_grid():
+    bid = 0.0
+    for _ in range(1000):
+        bid = raise_bid(bid, 0.1)
+    assert bid == 100.0
+    assert raise_bid(1.0, 0.2, cap=1.15) == 1.15
+
+
+def test_ledger_shape_and_dtype():
+    purses = ledger(40.0, (3, 4), dtype=np.int32)
+    assert purses.dtype == np.int32 and purses.shape == (3, 4) and (purses == 4000).all()
+
+
+def test_ledger_overflows_int32():
+    assert ledger(21_000_000.0, dtype=np.int32)[()] == 2_100_000_000
+    with pytest.raises(OverflowError):
+        ledger([1.0, 22_000_000.0], dtype=np.int32)
+    assert ledger(22_000_000.0)[()] == 2_200_000_000
+
+
+def test_team_takes_crore(players):
+    team = Team(name="A", budget=1.0, max_players=11)
+    assert team.can_bid(1.0) and team.can_bid_lakhs(100)
+    assert not team.can_bid(1.01) and not team.can_bid_lakhs(101)
+    # Anything below half a lakh is not more money
+    assert team.can_bid(1.004)
+
+    team.add_player(players[0], 0.3)
+    assert team.purse == 70 and team.budget == 0.7
+    team.add_player_lakhs(players[1], 30)
+    assert team.purse == 40 and team.budget == 0.4
+    assert sum(team.spent_by_role.values()) == 60
+
+
+def test_team_refuses_unaffordable_player(players):
+    team = Team(name="A", budget=1.0, max_players=11)
+    team.add_player(players[0], 1.01)
+    assert team.players == [] and team.purse == 100
+
+
+def test_purse_returns_to_start_after_refunds(players):
+    team = Team(name="A", budget=40.0, max_players=len(PRICES))
+    for player, price in zip(players, PRICES):
+        team.add_player(player, price)
+    assert team.purse == 4000 - sum(to_lakhs(price) for price in PRICES)
+    for price in PRICES:
+        team.budget = team.budget + price
+    assert team.purse == 4000 and team.budget == 40.0
@@ -0,0 +1,78 @@
+"""
+SquadPlanner reservation prices must match an exhaustive search over small pools.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from strategies.squad_planner import SquadPlanner
+
+ROLES = ["batsman", "bowler", "allrounder"]
+
+
+class FakePlayer:
+    def __init__(self, name, role, stars, price):
+        self.name = name
+        self.role = role
+        self.stats = {"stars": stars}
+        self.price = price
+
+
+def best_squad(pool, slots, budget):
+    """Most stars from a subset of pool within the slots per role and the budget."""
+    best = 0
+    for size in range(len(pool) + 1):
+        for squad in itertools.combinations(pool, size):
+            if sum(p.price for p in squad) > budget:
+                continue
+            if any(sum(p.role == role for p in squad) > slots[role] for role in slots):
+                continue
+            best = max(best, sum(p.stats["stars"] for p in squad))
+    return best
+
+
+def reservation_price(player, pool, slots, budget):
+    """Highest whole price at which buying the player still reaches the best squad without them."""
+    if slots[player.role] == 0 or budget <= 0:
+        return 0.0
+    others = [p for p in pool if p is not player]
+    without = best_squad(others, slots, budget)
+    slots_after = dict(slots, **{player.role: slots[player.role] - 1})
+    for price in range(budget, -1, -1):
+        if player.stats["stars"] + best_squad(others, slots_after, budget - price) >= without:
+            return float(price)
+    return 0.0
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_reservation_prices_match_exhaustive_search(seed):
+    rng = random.Random(seed)
+    budget = rng.randint(6, 14)
+    slots = {role: rng.randint(0, 3) for role in ROLES}
+    pool = [FakePlayer(f"P{i}", rng.choice(ROLES), rng.randint(0, 5), rng.randint(1, 6)) for i in range(10)]
+    planner = SquadPlanner(slots, budget, cost=lambda p: p.price, unit=1.0)
+    planner.add(pool)
+
+    remaining, pool = budget, list(pool)
+    while pool:
+        for player in pool:
+            assert planner.reservation_price(player) == reservation_price(player, pool, slots, remaining), player.name
+        # Close a lot: this team buys the player at a random price it can afford, or someone else does
+        player = pool.pop(rng.randrange(len(pool)))
+        price = rng.randint(0, remaining)
+        planner.remove(player)
+        if slots[player.role] > 0 and rng.random() < 0.4:
+            planner.bought(player, price)
+            slots[player.role] -= 1
+            remaining -= price
+
+
+def test_player_outside_the_plan_is_worth_nothing():
+    planner = SquadPlanner({"batsman": 0, "bowler": 2}, 10, cost=lambda p: p.price, unit=1.0)
+    batsman = FakePlayer("B", "batsman", 5, 1)
+    bowler = FakePlayer("W", "bowler", 5, 1)
+    planner.add([batsman, bowler])
+    assert planner.reservation_price(batsman) == 0.0
+    assert planner.reservation_price(bowler) == 10.0
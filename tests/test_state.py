@@ -0,0 +1,70 @@
+"""
+AuctionState: a restored snapshot is the state, and the random stream, it was taken from.
+"""
+
+import copy
+
+import numpy as np
+import pytest
+from conftest import seats
+
+from auctionengine.state import AuctionState, RolloutPolicy
+
+
+@pytest.fixture
+def state(players):
+    teams, _ = seats([None] * 4)
+    teams[1].add_player(players[0], 2.5)
+    return AuctionState.from_teams(teams, players[1:200], rng=np.random.default_rng(11))
+
+
+def arrays(state):
+    return [a.copy() for a in (state.budgets, state.counts, state.stars, state.role_counts)] + [state.position]
+
+
+def assert_same(actual, expected):
+    for a, e in zip(actual, expected):
+        np.testing.assert_array_equal(a, e)
+
+
+def policy(state):
+    values = np.maximum(state.pool.base_price, 0.2) * 2
+    return RolloutPolicy(values, np.zeros(len(state.budgets)))
+
+
+def test_restore_after_close_and_rollouts(state):
+    state.close_lot(2, 150)
+    before = arrays(state)
+    snapshot = state.snapshot()
+    draws = copy.deepcopy(state.rng).standard_normal(16)
+
+    state.close_lot(0, 300)
+    state.close_lot(None, 0)
+    rollouts = state.fork(8)
+    rollouts.play(policy(state), lots=20)
+    assert rollouts.position == state.position + 20
+    assert not np.array_equal(arrays(state)[0], before[0])
+
+    state.restore(snapshot)
+    assert_same(arrays(state), before)
+    np.testing.assert_array_equal(state.rng.standard_normal(16), draws)
+
+
+def test_restored_rollouts_repeat_their_draws(state):
+    snapshot = state.snapshot()
+    first = state.fork(16)
+    first.play(policy(state), lots=30)
+    state.restore(snapshot)
+    second = state.fork(16)
+    second.play(policy(state), lots=30)
+    np.testing.assert_array_equal(first.budgets, second.budgets)
+    np.testing.assert_array_equal(first.stars, second.stars)
+
+
+def test_restore_can_keep_the_stream(state):
+    snapshot = state.snapshot()
+    draws = copy.deepcopy(state.rng).standard_normal(4)
+    state.fork(4).play(policy(state), lots=5)
+    state.restore(snapshot, rng=False)
+    assert state.position == 0
+    assert not np.array_equal(state.rng.standard_normal(4), draws)
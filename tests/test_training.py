@@ -0,0 +1,52 @@
+"""
+Training pipeline: leaked targets are refused and retraining only publishes new data.
+"""
+
+import pytest
+from conftest import seats
+
+from auctionengine.artifacts import ModelArtifactStore
+from auctionengine.bidlog import BidLogSink
+from auctionengine.dealer import Dealer
+from auctionengine.tournament import make_strategy
+from auctionengine.training import ModelTrainer, leaks_target, retrain, train_models
+
+OWNER = "BayesianRidgeBiddingStrategy"
+
+
+def write_log(path, players, seed):
+    sink = BidLogSink(str(path))
+    teams, strategies = seats([make_strategy(name, 40.0) for name in ["statistical", "random_forest", "comparables"]])
+    Dealer(players=list(players), teams=teams, strategies=strategies, events=sink, seed=seed).start_auction()
+    sink.close()
+    for player in players:
+        player.winning_bid = 0.0
+    return str(path)
+
+
+def test_trainer_must_implement_build_and_update():
+    with pytest.raises(TypeError):
+        ModelTrainer()
+
+
+def test_train_models_refuses_a_leaked_target(tmp_path):
+    assert leaks_target("bayesian_ridge", "stars") and not leaks_target("random_forest", "stars")
+    with pytest.raises(ValueError, match="stars"):
+        train_models(["bayesian_ridge"], target="stars", store=ModelArtifactStore(str(tmp_path)))
+
+
+def test_retrain_publishes_only_for_new_logs(tmp_path, players):
+    store = ModelArtifactStore(str(tmp_path / "models"))
+    first = write_log(tmp_path / "first.log", players, 1)
+    [trained] = train_models(["bayesian_ridge"], target="price", logs=[first], folds=0, workers=1, store=store)
+    assert store.versions(OWNER) == [trained["version"]]
+
+    assert retrain([first], names=["bayesian_ridge"], workers=1, store=store) == []
+    assert store.versions(OWNER) == [trained["version"]]
+
+    second = write_log(tmp_path / "second.log", players, 2)
+    [updated] = retrain([first, second], names=["bayesian_ridge"], workers=1, store=store)
+    assert updated["parent"] == trained["version"] and updated["incremental"]
+    assert updated["samples"] == trained["samples"] + updated["new_samples"]
+    assert retrain([second, first], names=["bayesian_ridge"], workers=1, store=store) == []
+    assert len(store.versions(OWNER)) == 2
@@ -0,0 +1,81 @@
+"""
+Command line entry point for running Monte Carlo tournaments between bidding strategies.
+
+Examples:
+    python tournament.py --auctions 200 --workers 8
+    python tournament.py --lineup statistical statistical xgboost random_forest --no-rotate
+    python tournament.py --replay 17
+    python tournament.py --auctions 1000000 --stats-out stats.json
+    python tournament.py --merge-stats run1.json run2.json
+"""
+
+import argparse
+import time
+
+from auctionengine.aggregation import ResultsAggregator
+from auctionengine.tournament import DEFAULT_LINEUP, aggregate_tournament, run_auction, run_tournament, seat_lineup
+
+
+def main():
+    """
+    Parse command line options and run a tournament or replay a single seed.
+    """
+    parser = argparse.ArgumentParser(description="Run many seeded auctions and compare strategies.")
+    parser.add_argument("--auctions", type=int, default=100, help="number of auctions to play")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first auction")
+    parser.add_argument("--lineup", nargs="+", default=DEFAULT_LINEUP, help="strategy name per seat")
+    parser.add_argument("--no-rotate", action="store_true", help="keep each strategy in the same seat")
+    parser.add_argument("--budget", type=float, default=40.0, help="starting budget per team in Cr")
+    parser.add_argument("--max-players", type=int, default=11, help="squad size limit")
+    parser.add_argument("--fast-clearing", action="store_true", help="use the fast clearing engine")
+    parser.add_argument("--replay", type=int, default=None, metavar="SEED",
+                        help="replay a single auction verbosely instead of running a tournament")
+    parser.add_argument("--stream", action="store_true",
+                        help="keep only mergeable aggregates, with per-player prices, instead of every result")
+    parser.add_argument("--stats-out", metavar="PATH", help="save the aggregates as JSON (implies --stream)")
+    parser.add_argument("--merge-stats", nargs="+", metavar="PATH",
+                        help="merge saved aggregates and report them instead of running auctions")
+    args = parser.parse_args()
+
+    options = {"budget": args.budget, "max_players": args.max_players, "fast_clearing": args.fast_clearing}
+    rotate = not args.no_rotate
+
+    if args.replay is not None:
+        seats = run_auction(args.replay, seat_lineup(args.lineup, args.replay, rotate), verbose=True, **options)
+        for i, seat in enumerate(seats):
+            print(f"Seat {i + 1} ({seat['strategy']}): {seat['stars']} stars for {seat['spent']:.2f} Cr")
+        return
+
+    if args.merge_stats:
+        aggregator = ResultsAggregator.load(args.merge_stats[0])
+        for path in args.merge_stats[1:]:
+            aggregator.merge(ResultsAggregator.load(path))
+        print(aggregator.format_report())
+        print(f"\n{aggregator.auctions} auctions from {len(args.merge_stats)} files")
+        if args.stats_out:
+            aggregator.save(args.stats_out)
+        return
+
+    start = time.perf_counter()
+    if args.stream or args.stats_out:
+        aggregator = aggregate_tournament(args.auctions, lineup=args.lineup, base_seed=args.seed,
+                                          workers=args.workers, rotate=rotate, **options)
+        print(aggregator.format_report())
+        print(f"\n{args.auctions} auctions in {time.perf_counter() - start:.1f}s")
+        if args.stats_out:
+            aggregator.save(args.stats_out)
+        return
+
+    result = run_tournament(args.auctions, lineup=args.lineup, base_seed=args.seed,
+                            workers=args.workers, rotate=rotate, **options)
+    elapsed = time.perf_counter() - start
+    print(result.format_table())
+    print(f"\n{args.auctions} auctions in {elapsed:.1f}s")
+    for name in sorted(set(args.lineup)):
+        worst = ", ".join(f"{seed} ({stars})" for seed, stars in result.outliers(name, count=3))
+        print(f"Lowest-star seeds for {name}: {worst}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Command line entry point for the offline training pipeline.
+
+Examples:
+    python train.py                                   # fit the models to star ratings
+    python train.py --target price --logs logs/*.bin  # fit to winning bids from bid logs
+    python train.py --update --logs logs/new.bin      # fold new logs into the latest versions
+    python train.py --list
+"""
+
+import argparse
+import time
+
+from auctionengine.artifacts import default_store
+from auctionengine.training import DEFAULT_MODELS, TARGETS, retrain, train_models
+
+
+def main():
+    """
+    Parse command line options and train, update or list the strategy models.
+    """
+    parser = argparse.ArgumentParser(description="Train the strategy models on the real player pool.")
+    parser.add_argument("--models", nargs="+", default=None,
+                        help="strategy names to train (default: those of DEFAULT_MODELS able to learn the target)")
+    parser.add_argument("--target", choices=TARGETS, default="stars", help="what the models predict")
+    parser.add_argument("--logs", nargs="+", default=[], metavar="PATH", help="bid logs (see auction.py --bid-log)")
+    parser.add_argument("--update", action="store_true",
+                        help="update the latest price-trained versions with logs they have not seen")
+    parser.add_argument("--folds", type=int, default=5, help="cross-validation folds (below 2 skips it)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for fold splits and estimators")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--dataset", default="dataset", help="directory containing the player CSVs")
+    parser.add_argument("--list", action="store_true", help="list published versions and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        from strategies import registry
+        store = default_store()
+        for name in args.models or DEFAULT_MODELS:
+            owner = registry.resolve(name).__name__
+            for version in store.versions(owner):
+                metadata = store.load_version(owner, version)["metadata"]
+                print(f"{name:<16} v{version:<4} {metadata['target']:<6} {metadata['samples']:>6} samples"
+                      f"  parent {metadata['parent']}  {metadata['trained_at']}")
+        return
+
+    start = time.perf_counter()
+    if args.update:
+        published = retrain(args.logs, names=args.models, dataset_dir=args.dataset, seed=args.seed,
+                            workers=args.workers)
+    else:
+        published = train_models(names=args.models, target=args.target, logs=args.logs,
+                                 dataset_dir=args.dataset, folds=args.folds, seed=args.seed,
+                                 workers=args.workers)
+    for metadata in published:
+        line = f"{metadata['strategy']:<16} v{metadata['version']:<4} {metadata['samples']:>6} samples"
+        if metadata.get("cv"):
+            cv = metadata["cv"]
+            line += f"  cv RMSE {cv['rmse']:.3f} +/- {cv['rmse_std']:.3f}  R^2 {cv['r2']:.3f}"
+        if metadata["incremental"]:
+            line += (f"  +{metadata['new_samples']} new, RMSE on them {metadata['new_samples_rmse_before']:.3f}"
+                     f" -> {metadata['new_samples_rmse_after']:.3f}")
+        print(line)
+    if not published:
+        print("Nothing to train: no new logs")
+    print(f"\nDone in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Command line entry point for tuning strategy bidding parameters with Hyperband.
+
+Examples:
+    python tune.py --strategies statistical random_forest
+    python tune.py --strategies bayesian_ridge --opponents statistical statistical xgboost --max-auctions 243
+    python tune.py --strategies statistical --out tuning.json
+"""
+
+import argparse
+import json
+import time
+
+from auctionengine.tuning import DEFAULT_OPPONENTS, SPACES, hyperband
+
+
+def main():
+    """
+    Parse command line options and tune each requested strategy against the opponent field.
+    """
+    parser = argparse.ArgumentParser(description="Tune bidding parameters with successive halving / Hyperband.")
+    parser.add_argument("--strategies", nargs="+", default=["statistical"], choices=sorted(SPACES),
+                        help="strategies to tune, one after another")
+    parser.add_argument("--opponents", nargs="+", default=DEFAULT_OPPONENTS, help="fixed opponent field")
+    parser.add_argument("--max-auctions", type=int, default=81, help="most auctions any configuration plays")
+    parser.add_argument("--min-auctions", type=int, default=1, help="auctions per configuration at the first rung")
+    parser.add_argument("--eta", type=int, default=3, help="reduction factor between rungs")
+    parser.add_argument("--validation", type=int, default=100,
+                        help="fresh seeds comparing the best configuration with the defaults (0 skips)")
+    parser.add_argument("--seed", type=int, default=0, help="first racing seed, and seed for sampling configurations")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--budget", type=float, default=40.0, help="starting budget per team in Cr")
+    parser.add_argument("--max-players", type=int, default=11, help="squad size limit")
+    parser.add_argument("--out", metavar="PATH", help="also write every result, with seeds and trials, as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for strategy in args.strategies:
+        start = time.perf_counter()
+        result = hyperband(strategy, opponents=args.opponents, max_auctions=args.max_auctions,
+                           min_auctions=args.min_auctions, eta=args.eta, validation_auctions=args.validation,
+                           base_seed=args.seed, seed=args.seed, workers=args.workers,
+                           budget=args.budget, max_players=args.max_players)
+        print(result.format_report())
+        print(f"  ({time.perf_counter() - start:.1f}s)\n")
+        results.append(result.to_dict())
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()